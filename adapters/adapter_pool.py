@@ -0,0 +1,60 @@
+# adapters/adapter_pool.py
+# Defines the MediaPipeAdapterPool class, which lazily builds and reuses one MediaPipeAdapter per processing mode.
+
+import threading  # Guards lazy construction when live and static processing run on different threads.
+import logging  # Facilitates logging for debugging and monitoring adapter lifetimes.
+from typing import Dict, TYPE_CHECKING  # Type hints for configuration dictionaries.
+
+if TYPE_CHECKING:
+    from adapters.mediapipe_adapter import MediaPipeAdapter  # Imported on first use: loading mediapipe takes most of startup.
+
+class MediaPipeAdapterPool:
+    def __init__(self, config: Dict = None):
+        """Initialize the pool; adapters are built on first use.
+
+        Args:
+            config: FaceMesh configuration shared by all modes (AppConfig.mediapipe).
+        """
+        self.config = config or {}  # Use empty dict if no config provided.
+        self.adapters = {}  # Map modes ('live', 'static') to their adapter.
+        self.lock = threading.Lock()  # Serializes lazy construction.
+
+    def get(self, mode: str = "live") -> "MediaPipeAdapter":
+        """Return the adapter for a mode, building its FaceMesh graph on first use.
+
+        Args:
+            mode: 'live' for video tracking or 'static' for independent still images.
+
+        Returns:
+            MediaPipeAdapter: The reusable adapter for this mode.
+        """
+        adapter = self.adapters.get(mode)
+        if adapter is None:
+            with self.lock:
+                adapter = self.adapters.get(mode)
+                if adapter is None:
+                    from adapters.mediapipe_adapter import MediaPipeAdapter  # Deferred heavy import.
+                    adapter = self.adapters[mode] = MediaPipeAdapter(mode=mode, config=self.config)
+                    logging.info("MediaPipeAdapter built for %s mode", mode)
+        return adapter
+
+    def warm_up(self, mode: str = "live"):
+        """Build the adapter for a mode and run one blank inference, e.g. on a background thread at startup.
+
+        Args:
+            mode: 'live' or 'static'.
+        """
+        self.get(mode).warm_up()
+
+    def reset(self):
+        """Forget the live adapter's face tracking state, e.g. before another video; static images keep none."""
+        adapter = self.adapters.get("live")
+        if adapter is not None:
+            adapter.reset()
+
+    def close(self):
+        """Release every FaceMesh graph held by the pool."""
+        with self.lock:
+            for adapter in self.adapters.values():
+                adapter.close()
+            self.adapters.clear()
@@ -0,0 +1,112 @@
+# adapters/capture_worker.py
+# Defines the CaptureWorker class, which owns the camera and grabs frames on a background thread.
+
+import collections  # Provides the bounded deque used as a drop-oldest frame queue.
+import threading  # Runs the capture loop off the GUI thread.
+import time  # Timestamps captured frames and paces retries after read failures.
+import logging  # Facilitates logging for debugging and monitoring capture.
+from typing import Dict, Optional, Tuple  # Type hints for configuration and queued frames.
+import cv2  # OpenCV library for video capture.
+from logs.rate_limited_log import RateLimitedLog  # Summarizes repeated read failures.
+from logs.instrumentation import instrumentation  # Times camera reads and counts dropped frames.
+
+class CaptureWorker:
+    def __init__(self, config: Dict = None):
+        """Initialize the CaptureWorker with camera configuration.
+
+        Args:
+            config: Dictionary of camera options (optional):
+                index: Camera device index (default 0).
+                width, height: Requested capture resolution (driver default if omitted).
+                fourcc: Four-character codec code, e.g. 'MJPG' (driver default if omitted).
+                buffer_size: Driver-side buffer length in frames (default 1).
+                queue_size: Number of frames kept for the consumer; the oldest is dropped (default 1).
+        """
+        self.config = config or {}  # Use empty dict if no config provided.
+        self.queue = collections.deque(maxlen=max(1, self.config.get("queue_size", 1)))  # Drop-oldest frame slots.
+        self.condition = threading.Condition()  # Guards the queue and wakes waiting consumers.
+        self.cap = None  # OpenCV capture object, owned by the worker.
+        self.thread = None  # Background capture thread.
+        self.running = False  # Whether the capture loop should keep grabbing.
+        self.frames_captured = 0  # Total frames grabbed from the camera.
+        self.frames_dropped = 0  # Frames discarded because the consumer was slower than the camera.
+        self.read_failure_log = RateLimitedLog("Failed to read frame from camera.", logging.ERROR, interval=10.0)
+
+    def start(self) -> bool:
+        """Open the camera, apply the configured properties and start grabbing.
+
+        Returns:
+            bool: True if the camera was opened, False otherwise.
+        """
+        self.stop()  # Release any previously opened camera.
+        self.cap = cv2.VideoCapture(self.config.get("index", 0))
+        if not self.cap.isOpened():
+            logging.error("Could not open camera.")
+            self.cap.release()
+            self.cap = None
+            return False
+        fourcc = self.config.get("fourcc")
+        if fourcc:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))  # Set before resolution for some drivers.
+        if self.config.get("width"):
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.config["width"])
+        if self.config.get("height"):
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.config["height"])
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, self.config.get("buffer_size", 1))  # Keep the driver from hoarding stale frames.
+
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="CaptureWorker", daemon=True)
+        self.thread.start()
+        logging.info("Camera capture started: %dx%d", self.cap.get(cv2.CAP_PROP_FRAME_WIDTH),
+                     self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        return True
+
+    def _run(self):
+        """Grab frames continuously, keeping only the freshest ones in the queue."""
+        while self.running:
+            with instrumentation.timer("capture"):
+                ret, frame = self.cap.read()
+            if not ret:
+                self.read_failure_log.log()
+                time.sleep(0.01)  # Avoid spinning while the device recovers.
+                continue
+            with self.condition:
+                if len(self.queue) == self.queue.maxlen:
+                    self.frames_dropped += 1  # deque(maxlen) evicts the oldest frame on append.
+                    instrumentation.count("frames_dropped_capture")
+                self.queue.append((frame, time.time(), self.frames_captured))  # Sequence ID = capture count.
+                self.frames_captured += 1
+                instrumentation.count("frames_captured")
+                self.condition.notify()
+
+    def read(self, timeout: Optional[float] = 0.0) -> Optional[Tuple]:
+        """Take the oldest queued frame (the freshest one when queue_size is 1).
+
+        Args:
+            timeout: Seconds to wait for a frame; 0 returns immediately, None waits indefinitely.
+
+        Returns:
+            Optional[Tuple]: (frame, capture_timestamp, sequence_id), or None if no frame is available.
+        """
+        with self.condition:
+            if not self.queue and timeout != 0:
+                self.condition.wait_for(lambda: self.queue or not self.running, timeout)
+            return self.queue.popleft() if self.queue else None
+
+    def is_running(self) -> bool:
+        """Return whether the camera is open and frames are being grabbed."""
+        return self.running and self.cap is not None and self.cap.isOpened()
+
+    def stop(self):
+        """Stop the capture thread and release the camera."""
+        self.running = False
+        with self.condition:
+            self.condition.notify_all()  # Wake consumers waiting for a frame.
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+            logging.info("Camera released.")
+        self.queue.clear()
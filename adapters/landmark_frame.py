@@ -0,0 +1,50 @@
+# adapters/landmark_frame.py
+# Defines the LandmarkFrame class, a compact NumPy representation of one face's landmarks in pixel space.
+
+import numpy as np  # Provides the contiguous landmark array and vectorized scaling.
+from typing import Tuple  # Type hints for image size tuples.
+
+class LandmarkFrame:
+    """Landmarks of a single detected face, stored as an (N, 3) float32 array in pixel units.
+
+    x and y are pixel coordinates; z uses MediaPipe's relative depth scaled by the image width.
+    Calculators gather the points they need with fancy indexing, e.g. ``frame.points[[33, 133], :2]``.
+    """
+
+    __slots__ = ("points", "image_size", "face_index")
+
+    def __init__(self, points: np.ndarray, image_size: Tuple[int, int], face_index: int = 0):
+        """Initialize the LandmarkFrame.
+
+        Args:
+            points: (N, 3) float32 array of landmark coordinates in pixel space.
+            image_size: Tuple of (width, height) of the source image.
+            face_index: Index of the face among the detections of the frame.
+        """
+        self.points = points  # (N, 3) float32 landmark array, shared without copying.
+        self.image_size = image_size  # Source image (width, height).
+        self.face_index = face_index  # Position of this face in the detector output.
+
+    @classmethod
+    def from_normalized(cls, normalized: np.ndarray, image_size: Tuple[int, int], face_index: int = 0,
+                        region: Tuple[int, int, int, int] = None) -> "LandmarkFrame":
+        """Build a LandmarkFrame from normalized [0, 1] coordinates, scaling them in place.
+
+        Args:
+            normalized: (N, 3) float32 array of normalized landmark coordinates.
+            image_size: Tuple of (width, height) of the source image.
+            face_index: Index of the face among the detections of the frame.
+            region: (x, y, width, height) of the crop the coordinates are normalized to (default: full image).
+
+        Returns:
+            LandmarkFrame: Frame whose points are in full-image pixel space.
+        """
+        x, y, width, height = region or (0, 0, image_size[0], image_size[1])
+        normalized *= np.array([width, height, width], dtype=np.float32)  # Scale x, y and depth in one pass.
+        if x or y:
+            normalized += np.array([x, y, 0], dtype=np.float32)  # Map crop coordinates back to the full frame.
+        return cls(normalized, image_size, face_index)
+
+    def __len__(self) -> int:
+        """Return the number of landmarks, so empty frames are falsy."""
+        return len(self.points)
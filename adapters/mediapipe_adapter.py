@@ -3,50 +3,139 @@
 
 import mediapipe as mp  # MediaPipe library for facial landmark detection.
 import cv2  # OpenCV library for image processing and color conversion.
+import numpy as np  # Builds the landmark arrays handed to the KPI calculators.
 import logging  # Facilitates logging for debugging and monitoring frame processing.
+from typing import List  # Type hints for the list of detected faces.
+from adapters.landmark_frame import LandmarkFrame  # Compact per-face landmark representation.
+from adapters.region_of_interest import RegionOfInterest  # Crops FaceMesh input around the previous faces.
+from logs.rate_limited_log import RateLimitedLog  # Summarizes face lost/found transitions when they flap.
+from logs.instrumentation import instrumentation  # Times colour conversion and FaceMesh inference.
 
 class MediaPipeAdapter:
     def __init__(self, mode="live", config=None):
         """Initialize the MediaPipeAdapter with FaceMesh configuration.
 
         Args:
-            mode: Processing mode ('live' or 'static'), currently unused but reserved for future use.
-            config: Dictionary of configuration options for FaceMesh (optional).
+            mode: Processing mode: 'live' tracks faces across video frames, 'static' detects on every image.
+            config: Dictionary of configuration options for FaceMesh (optional). Besides the FaceMesh
+                options it accepts working_size (longest side fed to FaceMesh, 0 to disable downscaling),
+                roi_enabled, roi_margin and roi_refresh_frames (live mode only).
         """
         self.config = config or {}  # Use empty dict if no config provided.
+        self.mode = mode  # Processing mode selecting FaceMesh's static image behaviour.
         # Initialize MediaPipe FaceMesh with configuration options or defaults.
         self.face_mesh = mp.solutions.face_mesh.FaceMesh(
+            static_image_mode=(mode == "static"),  # Run detection on every image instead of tracking.
             max_num_faces=self.config.get("max_num_faces", 1),  # Max faces to detect.
             refine_landmarks=self.config.get("refine_landmarks", True),  # Refine facial landmarks.
             min_detection_confidence=self.config.get("min_detection_confidence", 0.5),  # Detection confidence threshold.
             min_tracking_confidence=self.config.get("min_tracking_confidence", 0.5)  # Tracking confidence threshold.
         )
-        logging.debug(f"MediaPipeAdapter initialized with mode: {mode}, config: {self.config}")
+        self.working_size = self.config.get("working_size", 640)  # Longest side of the image given to FaceMesh.
+        # Crop around the previous frame's faces in live mode; still images are always searched in full.
+        self.roi = RegionOfInterest(self.config) if mode == "live" and self.config.get("roi_enabled", True) else None
+        self.faces_present = True  # Whether the previous frame had faces; the no-face warning fires on the transition only.
+        self.faces_lost_log = RateLimitedLog("No faces detected.")
+        self.faces_found_log = RateLimitedLog("Faces detected again.", logging.INFO)
+        logging.debug("MediaPipeAdapter initialized with mode: %s, config: %s", mode, self.config)
 
-    def process(self, frame):
+    def process(self, frame) -> List[LandmarkFrame]:
         """Process a frame to detect facial landmarks using MediaPipe FaceMesh.
 
         Args:
             frame: Input frame (numpy array) in BGR format from OpenCV.
 
         Returns:
-            mediapipe.python.solutions.face_mesh.FaceMeshResults: Results containing detected landmarks.
+            List[LandmarkFrame]: One pixel-space landmark frame per detected face (empty if none).
         """
-        # Convert frame from BGR (OpenCV) to RGB (MediaPipe requirement).
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        image_size = (frame.shape[1], frame.shape[0])
+        region = self.roi.select(image_size) if self.roi else (0, 0, image_size[0], image_size[1])
+        faces = self._detect(frame, region, image_size)
+        if not faces and region != (0, 0, image_size[0], image_size[1]):
+            # Tracking lost inside the crop: search the full frame before giving up.
+            region = (0, 0, image_size[0], image_size[1])
+            faces = self._detect(frame, region, image_size)
+        if self.roi:
+            self.roi.update(faces, image_size)
+        if not faces:
+            if self.faces_present:
+                self.faces_lost_log.log()
+            self.faces_present = False
+            return []
+        if not self.faces_present:
+            self.faces_found_log.log()
+        self.faces_present = True
+
+        # Log number of detected faces and landmarks for the first face.
+        logging.debug("Detected %s faces", len(faces))
+        logging.debug("Landmarks detected: %s landmarks", len(faces[0]))
+        return faces
+
+    def _detect(self, frame, region, image_size) -> List[LandmarkFrame]:
+        """Run FaceMesh on a region of the frame, downscaled to the working size.
+
+        Args:
+            frame: Input frame (numpy array) in BGR format from OpenCV.
+            region: (x, y, width, height) of the crop to process.
+            image_size: Tuple of (width, height) of the full frame.
+
+        Returns:
+            List[LandmarkFrame]: Detected faces in full-frame pixel coordinates.
+        """
+        x, y, width, height = region
+        crop = frame[y:y + height, x:x + width]  # View into the frame, no copy.
+        scale = self.working_size / max(width, height) if self.working_size else 1.0
+        with instrumentation.timer("color_conversion"):
+            if scale < 1.0:
+                # Downscale before colour conversion so both stages work on fewer pixels.
+                crop = cv2.resize(crop, (max(1, round(width * scale)), max(1, round(height * scale))),
+                                  interpolation=cv2.INTER_AREA)
+            # Convert frame from BGR (OpenCV) to RGB (MediaPipe requirement).
+            rgb_frame = cv2.cvtColor(crop, cv2.COLOR_BGR2RGB)
         logging.debug("Processing image with MediaPipe...")
         
         # Process the frame to detect facial landmarks.
-        results = self.face_mesh.process(rgb_frame)
-        if results.multi_face_landmarks:
-            # Log number of detected faces and landmarks for the first face.
-            logging.debug(f"Detected {len(results.multi_face_landmarks)} faces")
-            logging.debug(f"Landmarks detected: {len(results.multi_face_landmarks[0].landmark)} landmarks")
-        else:
-            logging.warning("No faces detected.")
-        
-        return results
+        with instrumentation.timer("facemesh"):
+            results = self.face_mesh.process(rgb_frame)
+        if not results.multi_face_landmarks:
+            return []
+
+        # Convert each face's protobuf landmarks to a full-frame pixel array once, for all calculators.
+        return [
+            LandmarkFrame.from_normalized(
+                np.array([(p.x, p.y, p.z) for p in face_landmarks.landmark], dtype=np.float32),
+                image_size,
+                face_index,
+                region
+            )
+            for face_index, face_landmarks in enumerate(results.multi_face_landmarks)
+        ]
+
+    def reset(self):
+        """Forget face tracking state (region of interest, face presence, FaceMesh tracking), e.g. between videos."""
+        if self.roi:
+            self.roi.reset()
+        self.faces_present = True
+        if self.face_mesh is not None:
+            self.face_mesh.reset()  # Restart the graph so tracking does not continue from the previous video.
+
+    def warm_up(self, image_size=(640, 480)):
+        """Run FaceMesh once on a blank image so the first real frame does not pay for graph initialization.
+
+        Face tracking state (region of interest, face presence) is left untouched.
+
+        Args:
+            image_size: Tuple of (width, height) of the blank image.
+        """
+        self.face_mesh.process(np.zeros((image_size[1], image_size[0], 3), dtype=np.uint8))
+
+    def close(self):
+        """Release the FaceMesh graph; safe to call more than once."""
+        if self.face_mesh is not None:
+            self.face_mesh.close()  # Release MediaPipe resources.
+            self.face_mesh = None
 
     def __del__(self):
         """Clean up resources by closing the FaceMesh instance."""
-        self.face_mesh.close()  # Release MediaPipe resources.
\ No newline at end of file
+        if getattr(self, "face_mesh", None) is not None:
+            self.close()
\ No newline at end of file
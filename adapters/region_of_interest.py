@@ -0,0 +1,88 @@
+# adapters/region_of_interest.py
+# Defines the RegionOfInterest class, which picks the image region fed to FaceMesh from the previous frame's faces.
+
+import logging  # Facilitates logging for debugging and monitoring region changes.
+from typing import Dict, List, Tuple  # Type hints for regions and configuration.
+import numpy as np  # Computes landmark bounding boxes.
+
+class RegionOfInterest:
+    def __init__(self, config: Dict = None):
+        """Initialize the RegionOfInterest.
+
+        Args:
+            config: Dictionary of ROI options (optional):
+                roi_margin: Margin added around the faces' bounding box, as a fraction of its size (default 0.5).
+                roi_refresh_frames: Frames between full-frame searches for newly appearing faces (default 60).
+        """
+        self.config = config or {}  # Use empty dict if no config provided.
+        self.margin = self.config.get("roi_margin", 0.5)
+        self.refresh_frames = self.config.get("roi_refresh_frames", 60)
+        self.region = None  # Current (x, y, width, height) crop, or None for the full frame.
+        self.frames_since_full = 0  # Frames processed since the last full-frame search.
+
+    def select(self, image_size: Tuple[int, int]) -> Tuple[int, int, int, int]:
+        """Return the region to run FaceMesh on for the next frame.
+
+        Args:
+            image_size: Tuple of (width, height) of the full frame.
+
+        Returns:
+            Tuple[int, int, int, int]: (x, y, width, height) of the crop; the full frame when tracking is lost.
+        """
+        self.frames_since_full += 1
+        if self.region is not None:
+            self.region = self._fit(self.region, image_size)
+        if self.region is None or self.frames_since_full >= self.refresh_frames:
+            self.frames_since_full = 0
+            return (0, 0, image_size[0], image_size[1])
+        return self.region
+
+    def reset(self):
+        """Drop the current region so the next frame is searched in full, e.g. before another video."""
+        self.region = None
+        self.frames_since_full = 0
+
+    @staticmethod
+    def _fit(region: Tuple[int, int, int, int], image_size: Tuple[int, int]):
+        """Clip a region to the frame, or return None if nothing of it lies inside (e.g. after a resolution change)."""
+        x, y, w, h = region
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(image_size[0], x + w), min(image_size[1], y + h)
+        if x1 <= x0 or y1 <= y0:
+            logging.debug("ROI outside the %sx%s frame; falling back to full-frame search", *image_size)
+            return None
+        return (x0, y0, x1 - x0, y1 - y0)
+
+    def update(self, faces: List, image_size: Tuple[int, int]):
+        """Move the region to follow the detected faces, or drop it when tracking is lost.
+
+        The region is kept while the faces stay well inside it, so FaceMesh sees a stable crop.
+
+        Args:
+            faces: LandmarkFrame objects in full-frame pixel coordinates.
+            image_size: Tuple of (width, height) of the full frame.
+        """
+        if not faces:
+            if self.region is not None:
+                logging.debug("ROI lost; falling back to full-frame search")
+            self.region = None
+            return
+        xy = np.concatenate([face.points[:, :2] for face in faces])
+        x_min, y_min = xy.min(axis=0)
+        x_max, y_max = xy.max(axis=0)
+        if self.region is not None:
+            x, y, w, h = self.region
+            # Keep the crop while the faces stay inside its central part (half the margin from each edge).
+            inner = self.margin / (2 * (1 + 2 * self.margin))
+            if (x_min >= x + inner * w and x_max <= x + (1 - inner) * w and
+                    y_min >= y + inner * h and y_max <= y + (1 - inner) * h and
+                    (x_max - x_min) >= w / (2 * (1 + 2 * self.margin))):
+                return
+        # Re-center a crop of the faces' box plus margin, clipped to the frame.
+        pad_x = (x_max - x_min) * self.margin
+        pad_y = (y_max - y_min) * self.margin
+        x0 = int(max(0, x_min - pad_x))
+        y0 = int(max(0, y_min - pad_y))
+        x1 = int(min(image_size[0], x_max + pad_x))
+        y1 = int(min(image_size[1], y_max + pad_y))
+        self.region = (x0, y0, x1 - x0, y1 - y0) if x1 > x0 and y1 > y0 else None
@@ -0,0 +1,51 @@
+# batch.py
+# Headless entry point: reprocesses recorded videos or still-image folders into KPI rows without PyQt5.
+
+import argparse  # Parses command-line arguments.
+import sys  # Provides the process exit code.
+from config.config_loader import load_config  # Reads the logging settings before the pipeline is built.
+from controllers.batch_controller import BatchController  # Runs the Qt-free processing pipeline over video files.
+from logs.logging_config import configure_logging  # Applies the configured log level and format.
+from logs.instrumentation import instrumentation  # Optional stage timings written as JSON.
+
+def main():
+    """Parse arguments and process the given video files or image folders."""
+    parser = argparse.ArgumentParser(description="Compute per-frame KPIs for recorded videos or still images.")
+    parser.add_argument("inputs", nargs="+", help="Video files, or image folders/glob patterns with --images.")
+    parser.add_argument("--images", action="store_true",
+                        help="Treat inputs as still-image folders or glob patterns (static-mode FaceMesh).")
+    parser.add_argument("--decode-threads", type=int, default=4, help="Threads decoding images ahead of inference.")
+    parser.add_argument("-o", "--output", required=True, help="Output file (.csv, or .jsonl for JSON Lines).")
+    parser.add_argument("-c", "--config", default="config/config.json", help="Path to the configuration file.")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="Worker processes; above 1, images or video shards are processed in parallel.")
+    parser.add_argument("--shard-seconds", type=float, default=300.0, help="Shard length in seconds of video.")
+    parser.add_argument("--warmup-seconds", type=float,
+                        help="Overlap processed before each shard to rebuild stateful KPIs "
+                             "(default: the longest KPI history window, e.g. PERCLOS).")
+    parser.add_argument("--record", metavar="DIR",
+                        help="Also record each video's driver landmarks as a session in DIR (sequential).")
+    parser.add_argument("--replay", action="store_true",
+                        help="Treat inputs as recorded landmark sessions and recompute KPIs without FaceMesh.")
+    parser.add_argument("--metrics", help="Write stage timing metrics as JSON to this file (this process only).")
+    args = parser.parse_args()
+
+    # Log level and format come from the configuration (INFO shows progress; DEBUG would dominate the run time).
+    config = load_config(args.config)
+    configure_logging(config.logging)
+    instrumentation.configure(dict(config.instrumentation, enabled=True, dump_path=args.metrics)
+                              if args.metrics else config.instrumentation)
+    controller = BatchController(args.config)
+    if args.replay:
+        frames = controller.run_sessions(args.inputs, args.output)
+    elif args.images:
+        frames = controller.run_images(args.inputs, args.output, args.workers, args.decode_threads)
+    else:
+        frames = controller.run(args.inputs, args.output, args.workers, args.shard_seconds, args.warmup_seconds,
+                                args.record)
+    instrumentation.dump()  # Only written when a metrics path is set.
+    sys.exit(0 if frames > 0 else 1)
+
+if __name__ == "__main__":
+    # Check if the script is run directly (not imported) and call the main function.
+    main()
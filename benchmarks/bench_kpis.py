@@ -0,0 +1,117 @@
+# benchmarks/bench_kpis.py
+# Micro-benchmarks for every KpiCalculator, the full KpiManager plan and the HeadPoseEstimator (per frame and batched).
+
+import pkgutil  # Discovers calculator modules in the kpi package.
+import time  # Times whole-session batch solves.
+from typing import Any, Dict, List  # Type hints for benchmark results.
+import numpy as np  # Stacks fixture landmarks into session arrays.
+import kpi  # Package scanned for *_calculator modules.
+from kpi.head_pose_estimator import HeadPoseEstimator  # Solved once per frame for the pose KPIs.
+from kpi.kpi_factory import KpiFactory  # Creates calculators the same way the application does.
+from kpi.kpi_manager import KpiManager  # Resolves dependencies and features for each calculator.
+from benchmarks.fixtures import expected_pose  # Ground truth for the head pose accuracy check.
+from benchmarks.measure import measure  # Timing and allocation measurement.
+
+def calculator_names() -> List[str]:
+    """Return the KPI names of every calculator module in the kpi package."""
+    return sorted(
+        module.name[:-len("_calculator")] for module in pkgutil.iter_modules(kpi.__path__)
+        if module.name.endswith("_calculator") and module.name != "kpi_calculator"
+    )
+
+def _frame_data(landmarks, index: int, fps: float = 30.0) -> Dict[str, Any]:
+    return {"landmarks": landmarks, "image_size": landmarks.image_size, "frame": None, "timestamp": index / fps}
+
+def build_manager(factory: KpiFactory, names: List[str]) -> KpiManager:
+    """Build a KpiManager with the named KPIs enabled and the calculators they consume."""
+    params = {kpi_config["name"]: kpi_config.get("params", {}) for kpi_config in factory.config.get("kpis", [])}
+    calculators = [factory.create_calculator(name, params.get(name, {})) for name in names]
+    manager = KpiManager()
+    for calculator in calculators:
+        manager.register_calculator(calculator)
+    for calculator in factory.create_dependencies(calculators):
+        manager.register_calculator(calculator, enabled=False)
+    return manager
+
+def calculator_benchmarks(frames: List, config: Dict) -> Dict[str, Any]:
+    """Time each calculator's calculate() alone on inputs prepared by its dependencies.
+
+    Args:
+        frames: (landmarks, pose) fixtures from benchmarks.fixtures.pose_sequence().
+        config: Application configuration dictionary (KPI parameters).
+
+    Returns:
+        Dict[str, Any]: Measurements per KPI name.
+    """
+    factory = KpiFactory(config)
+    results = {}
+    for name in calculator_names():
+        manager = build_manager(factory, [name])
+        calculator = next(calc for calc in manager.calculators if calc.name() == name)
+        inputs = []
+        for index, (landmarks, _) in enumerate(frames):
+            data = _frame_data(landmarks, index)
+            manager.calculate(data)  # Fills features and upstream values, as in the pipeline.
+            inputs.append(data)
+        results[name] = measure(calculator.calculate, inputs)
+    return results
+
+def manager_benchmark(frames: List, config: Dict) -> Dict[str, Any]:
+    """Time the full KpiManager plan of the configured KPIs per frame, head pose solve included."""
+    factory = KpiFactory(config)
+    names = [kpi_config["name"] for kpi_config in config.get("kpis", []) if kpi_config.get("enabled", True)]
+    manager = build_manager(factory, names)
+    inputs = [(landmarks, index) for index, (landmarks, _) in enumerate(frames)]
+    result = measure(lambda item: manager.calculate(_frame_data(*item)), inputs)
+    result["kpis"] = names
+    return result
+
+def head_pose_benchmark(frames: List) -> Dict[str, Any]:
+    """Time HeadPoseEstimator.estimate() and report its error against the fixture poses."""
+    estimator = HeadPoseEstimator()
+    result = measure(lambda landmarks: estimator.estimate(landmarks, landmarks.image_size),
+                     [landmarks for landmarks, _ in frames])
+    worst = 0.0
+    for landmarks, pose in frames:
+        estimate = estimator.estimate(landmarks, landmarks.image_size)
+        for key, expected in zip(("yaw", "pitch", "roll"), expected_pose(*pose)):
+            worst = max(worst, abs((estimate[key] - expected + 180.0) % 360.0 - 180.0))
+    result["max_error_deg"] = worst
+    return result
+
+def _wrapped_difference(a, b) -> float:
+    """Largest absolute angle difference in degrees, modulo 360."""
+    return float(np.nanmax(np.abs((np.asarray(a) - np.asarray(b) + 180.0) % 360.0 - 180.0)))
+
+def head_pose_batch_benchmark(frames: List, repeat: int = 3, noise_px: float = 1.0) -> Dict[str, Any]:
+    """Compare HeadPoseEstimator.estimate_batch() with per-frame estimate() on a whole session.
+
+    Reports both throughputs, the speedup, the largest difference between the two paths and the
+    batch error against the fixture poses, also with Gaussian landmark noise of noise_px pixels.
+    """
+    estimator = HeadPoseEstimator()
+    points = np.stack([landmarks.points for landmarks, _ in frames])
+    image_sizes = np.array([landmarks.image_size for landmarks, _ in frames])
+    present = np.ones(len(frames), dtype=bool)
+    expected = np.array([expected_pose(*pose) for _, pose in frames])
+    per_frame = measure(lambda landmarks: estimator.estimate(landmarks, landmarks.image_size),
+                        [landmarks for landmarks, _ in frames])
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        poses = estimator.estimate_batch(points, image_sizes, present)
+        best = min(best or float("inf"), time.perf_counter() - start)
+    single = [estimator.estimate(landmarks, landmarks.image_size) for landmarks, _ in frames]
+    batch = np.stack([poses[key] for key in ("yaw", "pitch", "roll")], axis=1)
+    noisy = points + np.random.default_rng(0).normal(0.0, noise_px, points.shape).astype(np.float32)
+    noisy_poses = estimator.estimate_batch(noisy, image_sizes, present)
+    return {
+        "per_frame": per_frame,
+        "batch": {"calls": len(frames), "per_second": len(frames) / best, "total_ms": best * 1000.0},
+        "speedup": per_frame["mean_us"] * len(frames) / (best * 1e6),
+        "max_difference_deg": _wrapped_difference(batch, [[pose[key] for key in ("yaw", "pitch", "roll")]
+                                                          for pose in single]),
+        "max_error_deg": _wrapped_difference(batch, expected),
+        "noisy_max_error_deg": _wrapped_difference(
+            np.stack([noisy_poses[key] for key in ("yaw", "pitch", "roll")], axis=1), expected)
+    }
@@ -0,0 +1,90 @@
+# benchmarks/bench_pipeline.py
+# Throughput benchmarks for the FrameProcessor with a stubbed landmark backend and for the end-to-end pipeline.
+
+import os  # Temporary clip path handling.
+import tempfile  # Directory for the generated clip.
+import time  # Wall-clock timing of the end-to-end run.
+from typing import Any, Dict, List, Optional  # Type hints for benchmark results.
+import cv2  # Writes the generated clip.
+import numpy as np  # Blank frames and generated clip content.
+from benchmarks.fixtures import StubAdapter, StubAdapterPool  # FaceMesh stand-in replaying fixtures.
+from benchmarks.measure import measure  # Timing and allocation measurement.
+from controllers.pipeline_controller import PipelineController  # Builds the KPI manager from configuration.
+from logs.instrumentation import instrumentation  # Stage breakdown of the end-to-end run.
+from processors.frame_processor import FrameProcessor  # Frame-level orchestration under test.
+
+def frame_processor_benchmark(frames: List, config_path: str) -> Dict[str, Any]:
+    """Measure FrameProcessor.process_frame throughput with fixture landmarks instead of FaceMesh.
+
+    Keyframes, gating and idle backoff stay disabled so every frame runs tracking and all KPIs.
+
+    Args:
+        frames: (landmarks, pose) fixtures from benchmarks.fixtures.pose_sequence().
+        config_path: Configuration file defining the KPIs.
+
+    Returns:
+        Dict[str, Any]: Frames per second, per-frame latency percentiles and allocations.
+    """
+    pipeline = PipelineController(config_path)
+    pool = StubAdapterPool(StubAdapter([landmarks for landmarks, _ in frames]))
+    processor = FrameProcessor(pool, pipeline.create_kpi_manager(), pipeline.config.tracking)
+    width, height = frames[0][0].image_size
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    inputs = [index / 30.0 for index in range(len(frames))]
+    return measure(lambda timestamp: processor.process_frame(frame, timestamp), inputs)
+
+def generate_clip(path: str, frame_count: int, size=(1280, 720), fps: float = 30.0):
+    """Write a synthetic clip: a moving, shaded face-like ellipse on a gradient background."""
+    width, height = size
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), fps, size)
+    background = np.tile(np.linspace(40, 200, width, dtype=np.uint8), (height, 1))
+    for index in range(frame_count):
+        frame = cv2.cvtColor(background, cv2.COLOR_GRAY2BGR)
+        center = (width // 2 + int(80 * np.sin(index / 20)), height // 2)
+        cv2.ellipse(frame, center, (120, 160), 0, 0, 360, (150, 180, 220), -1)
+        for dx in (-45, 45):
+            cv2.circle(frame, (center[0] + dx, center[1] - 30), 12, (40, 40, 40), -1)
+        cv2.ellipse(frame, (center[0], center[1] + 70), (40, 12), 0, 0, 360, (60, 60, 160), -1)
+        writer.write(frame)
+    writer.release()
+
+def end_to_end_benchmark(config_path: str, frame_count: int, video_path: Optional[str] = None) -> Dict[str, Any]:
+    """Decode a clip and run the real FaceMesh and all KPIs over it through the BatchController.
+
+    Args:
+        config_path: Configuration file for the pipeline.
+        frame_count: Frames of the generated clip (ignored with video_path).
+        video_path: Recorded clip to use instead of the generated one (optional). The generated
+            clip contains no real face, so it mostly measures detection cost.
+
+    Returns:
+        Dict[str, Any]: Frames per second, frames with a face and the per-stage breakdown,
+        or {"skipped": reason} if FaceMesh is unavailable.
+    """
+    from controllers.batch_controller import BatchController  # Loaded here; FaceMesh may be unavailable.
+    with tempfile.TemporaryDirectory() as directory:
+        if video_path is None:
+            video_path = os.path.join(directory, "benchmark.avi")
+            generate_clip(video_path, frame_count)
+        try:
+            controller = BatchController(config_path)
+            instrumentation.configure({"enabled": True})
+            start = time.perf_counter()
+            processed = with_face = 0
+            for _ in controller.iter_video(video_path):
+                processed += 1
+                with_face += controller.pipeline.frame_processor.face_tracker.driver_id is not None
+            elapsed = time.perf_counter() - start
+            controller.pipeline.adapter_pool.close()
+        except Exception as error:  # FaceMesh missing or unable to start on this machine.
+            return {"skipped": f"{type(error).__name__}: {error}"}
+        finally:
+            stages = instrumentation.snapshot()["stages"]
+            instrumentation.configure({})
+    return {
+        "video": os.path.basename(video_path),
+        "frames": processed,
+        "frames_with_face": with_face,
+        "per_second": processed / elapsed if elapsed > 0 else 0.0,
+        "stages": stages
+    }
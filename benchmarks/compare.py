@@ -0,0 +1,44 @@
+# benchmarks/compare.py
+# Compares two benchmark result files and reports throughput and allocation regressions.
+
+import argparse  # Parses command-line arguments.
+import json  # Reads the result files.
+import sys  # Exit code signalling regressions.
+from typing import Dict, Iterator, Tuple  # Type hints for flattened metrics.
+
+# Metric name -> True if higher is better.
+METRICS = {"per_second": True, "alloc_peak_bytes_median": False}
+
+def flatten(results: Dict, prefix: str = "") -> Iterator[Tuple[str, str, float]]:
+    """Yield (benchmark path, metric, value) for every compared metric in a results tree."""
+    for key, value in results.items():
+        if isinstance(value, dict):
+            yield from flatten(value, f"{prefix}{key}.")
+        elif key in METRICS and isinstance(value, (int, float)):
+            yield prefix.rstrip("."), key, float(value)
+
+def main():
+    """Print a comparison table and exit with 1 if any metric regressed beyond the tolerance."""
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("baseline", help="Results of the reference commit.")
+    parser.add_argument("candidate", help="Results of the commit under test.")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed relative regression (default 0.10).")
+    args = parser.parse_args()
+
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = {(path, metric): value for path, metric, value in flatten(json.load(handle)["results"])}
+    with open(args.candidate, encoding="utf-8") as handle:
+        candidate = {(path, metric): value for path, metric, value in flatten(json.load(handle)["results"])}
+
+    regressions = 0
+    for key in sorted(baseline.keys() & candidate.keys()):
+        before, after = baseline[key], candidate[key]
+        change = (after - before) / before if before else 0.0
+        worse = -change if METRICS[key[1]] else change
+        flag = "REGRESSION" if worse > args.tolerance else ""
+        regressions += bool(flag)
+        print(f"{key[0]:<40} {key[1]:<24} {before:>14.1f} {after:>14.1f} {change:>+8.1%} {flag}")
+    sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# benchmarks/fixtures.py
+# Synthetic landmark fixtures with controllable head pose, eye and mouth openness, and a stubbed landmark backend.
+
+import math  # Trigonometry for the head rotation.
+from typing import List, Tuple  # Type hints for fixture sequences.
+import numpy as np  # Builds and projects the 3D face model.
+from adapters.landmark_frame import LandmarkFrame  # Pixel-space landmarks consumed by the calculators.
+
+NUM_LANDMARKS = 478  # Refined FaceMesh topology.
+DEFAULT_IMAGE_SIZE = (1280, 720)
+
+# Model points (mm, y up) of the landmarks the calculators read; the six HeadPoseEstimator points match its model.
+_KEY_POINTS = {
+    1: (0.0, 0.0, 0.0),            # Nose tip
+    152: (0.0, -63.6, -12.5),      # Chin
+    33: (-43.3, 32.7, -26.0),      # Left eye outer corner
+    133: (-15.0, 32.7, -24.0),     # Left eye inner corner
+    263: (43.3, 32.7, -26.0),      # Right eye outer corner
+    362: (15.0, 32.7, -24.0),      # Right eye inner corner
+    61: (-28.9, -28.9, -24.1),     # Left mouth corner
+    291: (28.9, -28.9, -24.1),     # Right mouth corner
+}
+_EYE_LIDS = {159: (-29.2, 133), 145: (-29.2, 133), 386: (29.2, 362), 374: (29.2, 362)}  # Upper/lower lids
+_OPEN_EYE_HALF_HEIGHT = 4.5  # mm; an EAR of about 0.32 when fully open.
+_LIP_HALF_GAP = 25.0  # mm at full mouth openness.
+
+def _rotation(yaw: float, pitch: float, roll: float) -> np.ndarray:
+    """Rotation Rz(roll) @ Ry(yaw) @ Rx(pitch) @ Rx(180°) from degrees; the last factor turns the y-up model to image axes."""
+    a, b, c = (math.radians(angle) for angle in (pitch + 180.0, yaw, roll))
+    rx = np.array([[1, 0, 0], [0, math.cos(a), -math.sin(a)], [0, math.sin(a), math.cos(a)]])
+    ry = np.array([[math.cos(b), 0, math.sin(b)], [0, 1, 0], [-math.sin(b), 0, math.cos(b)]])
+    rz = np.array([[math.cos(c), -math.sin(c), 0], [math.sin(c), math.cos(c), 0], [0, 0, 1]])
+    return rz @ ry @ rx
+
+def expected_pose(yaw: float, pitch: float, roll: float) -> Tuple[float, float, float]:
+    """Return the (yaw, pitch, roll) HeadPoseEstimator reports for a fixture pose.
+
+    The estimator's pitch is measured from the model's y-up axes, so a face looking at the camera reads ±180°.
+    """
+    return yaw, (pitch + 180.0 + 180.0) % 360.0 - 180.0, roll
+
+def face_model(eye_openness: float = 1.0, mouth_openness: float = 0.0, seed: int = 0) -> np.ndarray:
+    """Return a (478, 3) face model in millimetres (y up).
+
+    Args:
+        eye_openness: Eyelid opening from 0 (closed) to 1 (fully open).
+        mouth_openness: Lip gap from 0 (closed) to 1 (yawning).
+        seed: Seed for the filler points that are not read by any calculator.
+    """
+    rng = np.random.default_rng(seed)
+    # Filler points on the front half of an ellipsoid around the face.
+    theta = rng.uniform(-1.2, 1.2, NUM_LANDMARKS)
+    phi = rng.uniform(-1.2, 1.2, NUM_LANDMARKS)
+    model = np.stack([70 * np.sin(theta) * np.cos(phi), 90 * np.sin(phi), -60 + 60 * np.cos(theta) * np.cos(phi)], axis=1)
+    for index, point in _KEY_POINTS.items():
+        model[index] = point
+    half_height = _OPEN_EYE_HALF_HEIGHT * eye_openness
+    for index, (x, _) in _EYE_LIDS.items():
+        model[index] = (x, 32.7 + (half_height if index in (159, 386) else -half_height), -22.0)
+    half_gap = 2.0 + _LIP_HALF_GAP * mouth_openness
+    model[13] = (0.0, -28.9 + half_gap, -20.0)   # Upper lip
+    model[14] = (0.0, -28.9 - half_gap, -20.0)   # Lower lip
+    return model
+
+def face_landmarks(yaw: float = 0.0, pitch: float = 0.0, roll: float = 0.0, eye_openness: float = 1.0,
+                   mouth_openness: float = 0.0, image_size: Tuple[int, int] = DEFAULT_IMAGE_SIZE,
+                   distance: float = 600.0, seed: int = 0) -> LandmarkFrame:
+    """Project the face model with a given head pose into pixel-space landmarks.
+
+    The camera matches HeadPoseEstimator's (focal length = image width, centred principal point).
+
+    Args:
+        yaw, pitch, roll: Head rotation in degrees relative to facing the camera.
+        eye_openness, mouth_openness, seed: See face_model().
+        image_size: Tuple of (width, height) of the image.
+        distance: Distance of the nose tip from the camera in millimetres.
+
+    Returns:
+        LandmarkFrame: Landmarks in pixels, depth in pixels relative to the nose tip.
+    """
+    width, height = image_size
+    camera = _rotation(yaw, pitch, roll) @ face_model(eye_openness, mouth_openness, seed).T
+    camera[2] += distance
+    points = np.empty((NUM_LANDMARKS, 3), dtype=np.float32)
+    points[:, 0] = width * camera[0] / camera[2] + width / 2
+    points[:, 1] = width * camera[1] / camera[2] + height / 2
+    points[:, 2] = width * (camera[2] - distance) / distance
+    return LandmarkFrame(points, image_size)
+
+def pose_sequence(count: int, image_size: Tuple[int, int] = DEFAULT_IMAGE_SIZE, fps: float = 30.0,
+                  blink_every: float = 4.0) -> List[Tuple[LandmarkFrame, Tuple[float, float, float]]]:
+    """Return a driving-like sequence: slow head sweeps, periodic blinks and an occasional yawn.
+
+    Args:
+        count: Number of frames.
+        image_size: Tuple of (width, height) of the image.
+        fps: Frame rate used to place blinks in time.
+        blink_every: Seconds between blinks.
+
+    Returns:
+        List of (landmarks, (yaw, pitch, roll)) with the pose given in fixture convention.
+    """
+    frames = []
+    blink_frames = max(1, int(blink_every * fps))
+    for i in range(count):
+        t = i / fps
+        pose = (25.0 * math.sin(t * 0.7), 10.0 * math.sin(t * 0.5), 8.0 * math.sin(t * 0.3))
+        eye_openness = 0.1 if i % blink_frames < 3 else 1.0
+        mouth_openness = max(0.0, math.sin(t * 0.2)) ** 8
+        frames.append((face_landmarks(*pose, eye_openness, mouth_openness, image_size, seed=i % 7), pose))
+    return frames
+
+class StubAdapter:
+    """Landmark backend that replays fixture faces instead of running FaceMesh."""
+
+    def __init__(self, faces: List[LandmarkFrame]):
+        self.faces = faces
+        self.index = 0
+
+    def process(self, frame) -> List[LandmarkFrame]:
+        face = self.faces[self.index % len(self.faces)]
+        self.index += 1
+        return [LandmarkFrame(face.points.copy(), face.image_size)]  # Fresh array per frame, like FaceMesh.
+
+    def close(self):
+        pass
+
+class StubAdapterPool:
+    """MediaPipeAdapterPool stand-in handing out one StubAdapter for every mode."""
+
+    def __init__(self, adapter: StubAdapter):
+        self.adapter = adapter
+
+    def get(self, mode: str = "live") -> StubAdapter:
+        return self.adapter
+
+    def reset(self):
+        pass
+
+    def close(self):
+        pass
@@ -0,0 +1,57 @@
+# benchmarks/measure.py
+# Timing and allocation measurement helpers shared by the benchmarks.
+
+import time  # High-resolution timer.
+import tracemalloc  # Per-iteration allocation peaks.
+from typing import Any, Callable, Dict, Sequence  # Type hints for benchmark callables and inputs.
+import numpy as np  # Percentiles of per-iteration timings.
+
+def measure(function: Callable[[Any], Any], inputs: Sequence[Any], repeat: int = 3,
+            allocation_samples: int = 200) -> Dict[str, float]:
+    """Time a function over a sequence of inputs and measure its per-call allocations.
+
+    Timing and allocation passes are separate so tracemalloc does not distort the timings.
+
+    Args:
+        function: Callable invoked once per input.
+        inputs: Inputs for one pass; the best of repeat passes is reported.
+        repeat: Timed passes over the inputs.
+        allocation_samples: Calls measured under tracemalloc.
+
+    Returns:
+        Dict[str, float]: Calls per second, mean/p50/p95/p99 microseconds per call, and
+        median/max bytes allocated at peak within one call.
+    """
+    function(inputs[0])  # Warm caches and lazy initialization.
+    best = None
+    for _ in range(repeat):
+        durations = np.empty(len(inputs))
+        for i, item in enumerate(inputs):
+            start = time.perf_counter()
+            function(item)
+            durations[i] = time.perf_counter() - start
+        if best is None or durations.sum() < best.sum():
+            best = durations
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for i in range(min(allocation_samples, len(inputs))):
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            function(inputs[i])
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    p50, p95, p99 = np.percentile(best, [50, 95, 99]) * 1e6
+    return {
+        "calls": len(inputs),
+        "per_second": len(inputs) / best.sum(),
+        "mean_us": float(best.mean() * 1e6),
+        "p50_us": float(p50),
+        "p95_us": float(p95),
+        "p99_us": float(p99),
+        "alloc_peak_bytes_median": float(np.median(peaks)),
+        "alloc_peak_bytes_max": float(max(peaks))
+    }
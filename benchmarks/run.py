@@ -0,0 +1,70 @@
+# benchmarks/run.py
+# Runs the benchmark suite offline and writes the results as JSON for comparison between commits.
+
+import argparse  # Parses command-line arguments.
+import json  # Writes the results.
+import logging  # Reports progress while benchmarks run.
+import platform  # Records the machine the results come from.
+import subprocess  # Reads the current git commit.
+import sys  # Python version and stdout output.
+import time  # Timestamp of the run.
+import cv2  # Version recorded with the results.
+import numpy as np  # Version recorded with the results.
+from config.config_loader import load_config  # Reads the KPI configuration.
+from logs.logging_config import configure_logging  # Applies the configured log level and format.
+from benchmarks.fixtures import pose_sequence  # Synthetic landmark fixtures.
+from benchmarks.bench_kpis import calculator_benchmarks, manager_benchmark, head_pose_benchmark, \
+    head_pose_batch_benchmark
+from benchmarks.bench_pipeline import frame_processor_benchmark, end_to_end_benchmark
+
+SUITES = ("calculators", "kpi_manager", "head_pose", "head_pose_batch", "frame_processor", "end_to_end")
+
+def git_commit() -> str:
+    """Return the current git commit hash, or 'unknown' outside a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def main():
+    """Parse arguments, run the selected benchmarks and write the JSON results."""
+    parser = argparse.ArgumentParser(description="Benchmark KPI calculators, FrameProcessor and the end-to-end pipeline.")
+    parser.add_argument("-o", "--output", help="JSON results file (stdout if omitted).")
+    parser.add_argument("-c", "--config", default="config/config.json", help="Path to the configuration file.")
+    parser.add_argument("--frames", type=int, default=600, help="Synthetic frames per benchmark.")
+    parser.add_argument("--video", help="Recorded clip for the end-to-end benchmark (a clip is generated otherwise).")
+    parser.add_argument("--only", nargs="+", choices=SUITES, default=list(SUITES), help="Benchmarks to run.")
+    args = parser.parse_args()
+    config = load_config(args.config).dict()
+    configure_logging(config.get("logging"))
+    frames = pose_sequence(args.frames)
+    suites = {
+        "calculators": lambda: calculator_benchmarks(frames, config),
+        "kpi_manager": lambda: manager_benchmark(frames, config),
+        "head_pose": lambda: head_pose_benchmark(frames),
+        "head_pose_batch": lambda: head_pose_batch_benchmark(frames),
+        "frame_processor": lambda: frame_processor_benchmark(frames, args.config),
+        "end_to_end": lambda: end_to_end_benchmark(args.config, args.frames, args.video),
+    }
+    results = {}
+    for name in args.only:
+        logging.info("Running %s benchmark", name)
+        results[name] = suites[name]()
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "machine": {"platform": platform.platform(), "processor": platform.processor(),
+                    "python": sys.version.split()[0], "numpy": np.__version__, "opencv": cv2.__version__},
+        "frames": args.frames,
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        logging.info("Wrote benchmark results to %s", args.output)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,17 @@ class KpiConfig(BaseModel):
 class AppConfig(BaseModel):
     """Top-level configuration model for the application."""
     mediapipe: Dict  # Configuration settings for the MediaPipe adapter.
+    camera: Dict = {}  # Capture settings for live mode (device index, resolution, FOURCC, buffering).
+    tracking: Dict = {}  # Multi-face tracking settings (driver_only, iou_threshold, max_missed_frames).
+    keyframes: Dict = {}  # Keyframe inference settings (enabled, min/max_interval, motion_threshold, cpu_budget).
+    gating: Dict = {}  # Static-scene gating settings (enabled, threshold, thumbnail_width, max_gated_frames).
+    idle: Dict = {}  # Empty-seat backoff settings (enabled, grace_seconds, initial_interval, max_interval).
+    logging: Dict = {}  # Log settings (level, format, per-logger levels).
+    instrumentation: Dict = {}  # Timing instrumentation settings (enabled, window, overlay, dump_path, dump_interval, startup_budget).
+    history: Dict = {}  # KPI history settings (capacity: samples kept per KPI).
+    recording: Dict = {}  # Live landmark recording settings (enabled, directory).
+    batch: Dict = {}  # Bulk image analysis settings (workers, decode_threads).
+    ui: Dict = {}  # Display settings for the GUI (display_fps, kpi_text_fps).
     kpis: List[KpiConfig]  # List of KPI configurations for the application.
 
 def load_config(path: str) -> AppConfig:
@@ -28,4 +39,21 @@ def load_config(path: str) -> AppConfig:
     with open(path, "r") as f:  # Open the JSON file in read mode.
         import json  # Import json module for parsing the file.
         data = json.load(f)  # Read and parse the JSON data into a Python dictionary.
-        return AppConfig(**data)  # Validate and convert the data into an AppConfig instance.
\ No newline at end of file
+        return AppConfig(**data)  # Validate and convert the data into an AppConfig instance.
+
+def enabled_kpi_groups(config: AppConfig) -> Dict[str, List[str]]:
+    """Group the enabled KPI names of a configuration by their configured group.
+
+    Lets the window lay out its KPI panels before the calculators are imported.
+
+    Args:
+        config (AppConfig): Parsed configuration.
+
+    Returns:
+        Dict[str, List[str]]: Mapping of group names to enabled KPI names, in configuration order.
+    """
+    groups = {}  # Group name -> enabled KPI names.
+    for kpi in config.kpis:
+        if kpi.enabled:
+            groups.setdefault(kpi.group, []).append(kpi.name)
+    return groups
@@ -1,58 +1,71 @@
 # controllers/app_controller.py
 # Defines the AppController class, responsible for initializing and coordinating the application's core components.
 
-from config.config_loader import load_config  # Loads configuration settings from a JSON file.
-from adapters.mediapipe_adapter import MediaPipeAdapter  # Provides an interface to MediaPipe for pose/motion detection.
-from kpi.kpi_factory import KpiFactory  # Creates KPI calculators based on configuration.
-from kpi.kpi_manager import KpiManager  # Manages KPI calculators for performance metric computation.
-from processors.frame_processor import FrameProcessor  # Processes video frames using MediaPipe and KPI calculators.
+from PyQt5 import QtWidgets, QtCore  # Defers the processing pipeline until the window is shown.
 from ui.main_window import MainWindow  # Defines the main GUI window for the application.
+from config.config_loader import load_config, enabled_kpi_groups  # Loads configuration settings from a JSON file.
+from logs.logging_config import configure_logging  # Applies the configured log level and format.
+from logs.instrumentation import instrumentation  # Optional stage timings, overlay and metrics dump.
 import logging  # Enables logging for debugging and monitoring application behavior.
-
-# Configure logging to display timestamp, log level, and message for debugging purposes.
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+import os  # Builds the recording session path.
+import time  # Times the pipeline build and names recording sessions after their start time.
 
 class AppController:
-    def __init__(self, config_path="config/config.json"):
-        """Initialize the AppController with configuration and core components."""
+    def __init__(self, config_path="config/config.json", started=None):
+        """Initialize the AppController with configuration and core components.
+
+        Args:
+            config_path: Path to the JSON configuration file.
+            started: time.perf_counter() value when the application started, for startup metrics (optional).
+        """
+        # Load configuration and apply its logging settings before anything else logs. The validated
+        # configuration (pydantic) stays on the startup path: the window layout is built from it.
+        config = load_config(config_path)
+        configure_logging(config.logging)
+        instrumentation.configure(config.instrumentation)
         logging.info("Initializing AppController...")
-        # Load configuration from the specified JSON file.
-        self.config = load_config(config_path)
-        logging.debug(f"Configuration loaded: {self.config.dict()}")
-        
-        # Initialize MediaPipe adapter for live mode with configuration settings.
-        self.mediapipe_adapter = MediaPipeAdapter(mode="live", config=self.config.mediapipe)
-        logging.debug("MediaPipeAdapter initialized.")
-        
-        # Create KPI calculators based on the loaded configuration.
-        kpi_factory = KpiFactory(self.config.dict())
-        calculators = kpi_factory.create_calculators()
-        logging.debug(f"Calculators created: {[calc.name() for calc in calculators]}")
+        self.config = config
+        self.config_path = config_path
+        self.pipeline = None  # Built by build_pipeline once the window is shown.
+        self.adapter_pool = None
+        self.kpi_manager = None
+        self.frame_processor = None
         
-        # Initialize KPI manager and register all calculators for metric computation.
-        self.kpi_manager = KpiManager()
-        for calc in calculators:
-            self.kpi_manager.register_calculator(calc)
-        logging.debug("KpiManager initialized with calculators.")
+        # Lay out the KPI panels from the configuration, without importing the calculators.
+        enabled_kpis = enabled_kpi_groups(self.config)
         
-        # Initialize frame processor with MediaPipe adapter and KPI manager.
-        self.frame_processor = FrameProcessor(self.mediapipe_adapter, self.kpi_manager)
-        logging.debug("FrameProcessor initialized.")
-        
-        # Group enabled KPIs by their group attribute for display in the UI.
-        # Dynamically group enabled KPIs by their group attribute
-
-        enabled_kpis = {}
-        for calc in calculators:
-            group = calc.group()
-            if group not in enabled_kpis:
-                enabled_kpis[group] = []
-            enabled_kpis[group].append(calc.name())
-        
-        # Initialize the main window with the frame processor and grouped KPIs.
-        self.main_window = MainWindow(self.frame_processor, enabled_kpis)
+        # Initialize the main window; the frame processor is attached once the pipeline is built.
+        self.main_window = MainWindow(None, enabled_kpis, self.config.camera, self.config.ui,
+                                      config_path, self.config.batch, started)
+        # OpenCV, numpy and the KPI calculators load after the window is shown, not on the startup path.
+        QtCore.QTimer.singleShot(0, self.build_pipeline)
         logging.info("AppController successfully initialized.")
     
+    def build_pipeline(self):
+        """Build the MediaPipe adapter, KPI manager and frame processor, and attach them to the window."""
+        QtWidgets.QApplication.processEvents()  # Paint the window before the imports block the GUI thread.
+        start = time.perf_counter()
+        from controllers.pipeline_controller import PipelineController  # OpenCV, numpy and the KPI calculators.
+        from processors.landmark_recording import LandmarkRecorder, landmark_count  # Optional landmark recording.
+        self.pipeline = PipelineController(self.config_path, self.config)
+        self.adapter_pool = self.pipeline.adapter_pool
+        self.kpi_manager = self.pipeline.kpi_manager
+        self.frame_processor = self.pipeline.frame_processor
+        recording = self.config.recording
+        if recording.get("enabled", False):
+            # Record live landmarks so KPIs can be recomputed later without video or FaceMesh.
+            session = os.path.join(recording.get("directory", "recordings"), time.strftime("session-%Y%m%d-%H%M%S"))
+            self.frame_processor.recorder = LandmarkRecorder(session, source=f"camera {self.config.camera.get('index', 0)}",
+                                                             num_landmarks=landmark_count(self.config.mediapipe))
+            logging.info("Recording driver landmarks to %s", session)
+        if self.pipeline.enabled_kpis() != self.main_window.enabled_kpis:
+            logging.warning("KPI groups differ from the configured ones: %s", self.pipeline.enabled_kpis())
+        self.main_window.attach_frame_processor(self.frame_processor)
+        elapsed = time.perf_counter() - start
+        instrumentation.set_value("pipeline_s", round(elapsed, 3))
+        instrumentation.set_value("ready_s", round(time.perf_counter() - self.main_window.started, 3))
+        logging.info("Processing pipeline loaded in %.2fs after the window was shown", elapsed)
+    
     def get_main_window(self):
         """Return the main window instance for display."""
-        return self.main_window
\ No newline at end of file
+        return self.main_window
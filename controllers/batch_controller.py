@@ -0,0 +1,431 @@
+# controllers/batch_controller.py
+# Defines the BatchController class, which reprocesses recorded videos and still-image folders headlessly into KPI rows.
+
+import collections  # Provides the deques of in-flight image jobs.
+import contextlib  # Provides a no-op context when images are processed in-process.
+import glob  # Expands image folder patterns.
+import os  # Inspects image paths and extensions.
+import cv2  # OpenCV library for video and image decoding.
+import logging  # Enables logging for debugging and monitoring batch progress.
+import math  # Rounds warm-up lengths up to whole frames.
+import multiprocessing  # Provides the spawn context for worker processes.
+import time  # Measures processing throughput.
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor  # Process pool for inference, threads for decoding.
+from typing import Callable, Dict, Iterator, List, Optional  # Type hints for KPI rows, shards and video lists.
+from config.config_loader import load_config  # Reads the worker's configuration once for logging and the pipeline.
+from controllers.pipeline_controller import PipelineController  # Qt-free configuration, KPI and frame pipeline.
+from processors.landmark_recording import LandmarkRecorder, LandmarkSession, landmark_count  # Landmark session files.
+from processors.result_writer import ResultWriter  # Streams KPI rows to CSV or JSON Lines.
+from logs.logging_config import configure_logging  # Applies the configured log level and format in workers.
+
+# Per-process BatchController, built once by the pool initializer (own MediaPipeAdapter and calculators).
+_worker_controller = None
+
+def _init_worker(config_path: str):
+    """Build the worker process's own pipeline.
+
+    Args:
+        config_path: Path to the JSON configuration file.
+    """
+    global _worker_controller
+    config = load_config(config_path)
+    # Spawned workers start with unconfigured logging; apply the same "logging" section as the main process.
+    configure_logging(config.logging, default_level="WARNING")
+    _worker_controller = BatchController(config_path, config)
+
+def _process_shard(shard: Dict) -> List[Dict]:
+    """Process one shard in a worker process.
+
+    Args:
+        shard: Shard description produced by BatchController.plan_shards().
+
+    Returns:
+        List[Dict]: KPI rows of the shard, in frame order, excluding warm-up frames.
+    """
+    return list(_worker_controller.iter_video(
+        shard["path"], shard["start_frame"], shard["end_frame"], shard["warmup_frames"]
+    ))
+
+def _process_image(image) -> Dict:
+    """Run static-mode inference on one decoded image in a worker process.
+
+    Args:
+        image: Decoded BGR image.
+
+    Returns:
+        Dict: KPI results of the image.
+    """
+    return _worker_controller.process_image(image)
+
+# File extensions picked up when an image folder is given.
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+def find_images(source: str) -> List[str]:
+    """List the image files of a folder, or those matching a glob pattern, in sorted order.
+
+    Args:
+        source: Directory path or glob pattern (e.g., 'snapshots/**/*.jpg').
+
+    Returns:
+        List[str]: Image file paths.
+    """
+    if os.path.isdir(source):
+        paths = (os.path.join(source, name) for name in os.listdir(source))
+    else:
+        paths = glob.iglob(source, recursive=True)
+    return sorted(path for path in paths if path.lower().endswith(IMAGE_EXTENSIONS) and os.path.isfile(path))
+
+class BatchController:
+    def __init__(self, config_path="config/config.json", config=None):
+        """Initialize the BatchController with the shared processing pipeline (no PyQt5 required).
+
+        Args:
+            config_path: Path to the JSON configuration file.
+            config: Already loaded AppConfig (optional); skips reading config_path.
+        """
+        self.config_path = config_path  # Passed to worker processes, which build their own pipeline.
+        self.pipeline = PipelineController(config_path, config)  # Reuses config loading, KpiFactory, KpiManager and FrameProcessor.
+        # Recordings are analysed on every frame: no idle backoff and no reuse of results on unchanged frames.
+        self.pipeline.frame_processor.idle_policy.enabled = False
+        self.pipeline.frame_processor.change_detector.enabled = False
+        self.kpi_names = [name for names in self.pipeline.enabled_kpis().values() for name in names]  # Output columns.
+        # Running-total KPIs (e.g., blink counts) that must continue across shard boundaries.
+        self.cumulative_kpis = [
+            calc.name() for calc in self.pipeline.kpi_manager.calculators
+            if calc.cumulative() and calc.name() in self.kpi_names
+        ]
+
+    def iter_video(self, path: str, start_frame: int = 0, end_frame: Optional[int] = None,
+                   warmup_frames: int = 0) -> Iterator[Dict]:
+        """Decode a video (or a frame range of it) and yield one KPI row per frame.
+
+        Runs as fast as decoding and inference allow. Calculator state starts fresh for every call;
+        when warmup_frames is set, the frames before start_frame are processed only to rebuild
+        stateful KPIs (blink detection, distraction timers, FaceMesh tracking) and are not yielded.
+        Cumulative KPIs are reported relative to the end of the warm-up.
+
+        Args:
+            path: Path to the video file.
+            start_frame: First frame to report.
+            end_frame: Frame index to stop before (None for end of video).
+            warmup_frames: Number of frames before start_frame processed for state only.
+
+        Yields:
+            Dict: Row with source, frame_index, timestamp (seconds of video time) and KPI values.
+        """
+        cap = cv2.VideoCapture(path)
+        if not cap.isOpened():
+            logging.error("Could not open video: %s", path)
+            return
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0  # Fallback when the container has no frame rate.
+        frame_processor = self.pipeline.frame_processor
+        frame_processor.reset(self.pipeline.create_kpi_manager())  # Fresh tracks and calculator state per run.
+        frame_index = max(0, start_frame - warmup_frames)
+        if frame_index > 0:
+            cap = self._seek(cap, path, frame_index)  # Start of the warm-up.
+        baseline = {name: 0 for name in self.cumulative_kpis}  # Totals accumulated during warm-up.
+        try:
+            while end_frame is None or frame_index < end_frame:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                # Prefer the container's timestamp; fall back to the nominal frame rate.
+                position_ms = cap.get(cv2.CAP_PROP_POS_MSEC)
+                timestamp = position_ms / 1000.0 if position_ms > 0 or frame_index == 0 else frame_index / fps
+                results = frame_processor.process_frame(frame, timestamp)
+                if frame_index < start_frame:
+                    baseline = {name: results.get(name, 0) for name in self.cumulative_kpis}
+                else:
+                    for name in self.cumulative_kpis:
+                        results[name] = results.get(name, 0) - baseline[name]
+                    yield {"source": path, "frame_index": frame_index, "timestamp": timestamp, **results}
+                frame_index += 1
+        finally:
+            cap.release()
+
+    @staticmethod
+    def _seek(cap, path: str, frame_index: int):
+        """Position a capture at a frame index, exactly.
+
+        Seeking by frame is inexact for many codecs; when the capture does not report the requested
+        position afterwards, the video is reopened and frames are grabbed (not decoded) up to it.
+
+        Args:
+            cap: Opened cv2.VideoCapture.
+            path: Path of the video, for reopening.
+            frame_index: Index of the next frame to read.
+
+        Returns:
+            cv2.VideoCapture: Capture whose next read returns frame_index (or fails past the end).
+        """
+        if cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index) and int(cap.get(cv2.CAP_PROP_POS_FRAMES)) == frame_index:
+            return cap
+        logging.debug("Inexact seek to frame %d in %s; grabbing frames from the start", frame_index, path)
+        cap.release()
+        cap = cv2.VideoCapture(path)
+        for _ in range(frame_index):
+            if not cap.grab():
+                break
+        return cap
+
+    def plan_shards(self, video_paths: List[str], shard_seconds: float, warmup_seconds: float) -> List[Dict]:
+        """Split videos into time shards for parallel processing.
+
+        Args:
+            video_paths: Video files to process.
+            shard_seconds: Length of each shard in seconds of video time.
+            warmup_seconds: Overlap processed before each shard to rebuild calculator state.
+
+        Returns:
+            List[Dict]: Shards in output order, with path, start_frame, end_frame and warmup_frames.
+        """
+        shards = []
+        for path in video_paths:
+            cap = cv2.VideoCapture(path)
+            fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))  # May be approximate for some containers.
+            cap.release()
+            shard_frames = max(1, int(shard_seconds * fps))
+            # One frame beyond the window: the sample at its oldest edge depends on the frame before (e.g. blink edges).
+            warmup_frames = math.ceil(warmup_seconds * fps) + 1 if warmup_seconds > 0 else 0
+            starts = list(range(0, max(frame_count, 1), shard_frames))
+            for i, start in enumerate(starts):
+                shards.append({
+                    "path": path,
+                    "start_frame": start,
+                    # The last shard reads to the end, in case the frame count is underestimated.
+                    "end_frame": starts[i + 1] if i + 1 < len(starts) else None,
+                    "warmup_frames": warmup_frames if start > 0 else 0,
+                })
+        logging.info("Planned %d shards for %d videos", len(shards), len(video_paths))
+        return shards
+
+    def run(self, video_paths: List[str], output_path: str, workers: int = 1,
+            shard_seconds: float = 300.0, warmup_seconds: Optional[float] = None,
+            record_dir: Optional[str] = None) -> int:
+        """Process videos and stream their KPI rows to the output file, in video and frame order.
+
+        Args:
+            video_paths: Video files to process.
+            output_path: CSV or JSON Lines (.jsonl) output file.
+            workers: Number of worker processes; 1 processes videos sequentially in this process.
+            shard_seconds: Length of the time shards long videos are split into (workers > 1).
+            warmup_seconds: Overlap processed before each shard for stateful KPIs (workers > 1); defaults
+                to the longest KPI history window, and shorter values make shard starts differ from a sequential run.
+            record_dir: Directory receiving one landmark session per video (optional; processes sequentially).
+
+        Returns:
+            int: Total number of frames processed.
+        """
+        start = time.perf_counter()
+        total = 0
+        if record_dir and workers > 1:
+            logging.warning("Recording landmarks processes videos sequentially; ignoring workers=%d", workers)
+            workers = 1
+        with ResultWriter(output_path, self.kpi_names) as writer:
+            if workers <= 1:
+                for path in video_paths:
+                    recorder = self._recorder(record_dir, path) if record_dir else None
+                    self.pipeline.frame_processor.recorder = recorder
+                    try:
+                        for row in self.iter_video(path):
+                            writer.write(row)
+                            total += 1
+                    finally:
+                        self.pipeline.frame_processor.recorder = None
+                        if recorder is not None:
+                            recorder.close()
+            else:
+                history_seconds = self.pipeline.kpi_manager.history_seconds()
+                if warmup_seconds is None:
+                    warmup_seconds = history_seconds
+                elif warmup_seconds < history_seconds:
+                    logging.warning("Warm-up of %.1fs is shorter than the %.1fs KPI history window; KPIs at shard "
+                                    "starts will differ from a sequential run", warmup_seconds, history_seconds)
+                shards = self.plan_shards(video_paths, shard_seconds, warmup_seconds)
+                offsets = {}  # Running totals of cumulative KPIs at the end of the previous shard, per video.
+                pending_shards = iter(shards)
+                in_flight = collections.deque()  # (shard, future), in output order.
+                # Spawn (not fork) so every worker gets a clean MediaPipe graph.
+                with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                         initializer=_init_worker, initargs=(self.config_path,)) as executor:
+                    while True:
+                        # Only a few shards per worker are queued or finished but unwritten, so memory
+                        # stays bounded however large the archive is.
+                        while len(in_flight) < 2 * workers:
+                            shard = next(pending_shards, None)
+                            if shard is None:
+                                break
+                            in_flight.append((shard, executor.submit(_process_shard, shard)))
+                        if not in_flight:
+                            break
+                        shard, future = in_flight.popleft()  # Taken in submission order, so rows merge in order.
+                        rows = future.result()
+                        offset = offsets.setdefault(shard["path"], {name: 0 for name in self.cumulative_kpis})
+                        for row in rows:
+                            for name in self.cumulative_kpis:
+                                row[name] = row[name] + offset[name]
+                            writer.write(row)
+                        if rows:
+                            offsets[shard["path"]] = {name: rows[-1][name] for name in self.cumulative_kpis}
+                        total += len(rows)
+        elapsed = time.perf_counter() - start
+        logging.info("Processed %d frames from %d videos in %.1fs (%.1f FPS)",
+                     total, len(video_paths), elapsed, total / elapsed if elapsed > 0 else 0.0)
+        return total
+
+    def _recorder(self, record_dir: str, video_path: str) -> LandmarkRecorder:
+        """Create the landmark session of a video, named after the video file."""
+        name = os.path.splitext(os.path.basename(video_path))[0]
+        return LandmarkRecorder(os.path.join(record_dir, name), source=video_path,
+                                num_landmarks=landmark_count(self.pipeline.config.mediapipe))
+
+    def iter_session(self, path: str, chunk_frames: int = 10000) -> Iterator[Dict]:
+        """Replay a recorded landmark session through a fresh KpiManager and yield one KPI row per frame.
+
+        No video is decoded and FaceMesh does not run, and KPIs are evaluated with the vectorized
+        batch path chunk by chunk, so KPI parameters can be re-tuned over long recordings quickly.
+
+        Args:
+            path: Session directory written by LandmarkRecorder.
+            chunk_frames: Frames decoded and evaluated per batch (bounds memory use).
+
+        Yields:
+            Dict: Row with source, frame_index, timestamp and KPI values.
+        """
+        kpi_manager = self.pipeline.create_kpi_manager()
+        session = LandmarkSession(path)
+        for start in range(0, len(session), chunk_frames):
+            data = session.arrays(start, start + chunk_frames)
+            columns = {name: column.tolist() for name, column in kpi_manager.calculate_batch(data).items()}
+            frame_indices = data["frame_indices"].tolist()
+            timestamps = data["timestamps"].tolist()
+            for index, frame_index in enumerate(frame_indices):
+                yield {"source": path, "frame_index": frame_index, "timestamp": timestamps[index],
+                       **{name: column[index] for name, column in columns.items()}}
+
+    def run_sessions(self, session_paths: List[str], output_path: str) -> int:
+        """Replay landmark sessions and stream their KPI rows to the output file.
+
+        Args:
+            session_paths: Session directories.
+            output_path: CSV or JSON Lines (.jsonl) output file.
+
+        Returns:
+            int: Total number of frames replayed.
+        """
+        start = time.perf_counter()
+        total = 0
+        with ResultWriter(output_path, self.kpi_names) as writer:
+            for path in session_paths:
+                for row in self.iter_session(path):
+                    writer.write(row)
+                    total += 1
+        elapsed = time.perf_counter() - start
+        logging.info("Replayed %d frames from %d sessions in %.1fs (%.1f FPS)",
+                     total, len(session_paths), elapsed, total / elapsed if elapsed > 0 else 0.0)
+        return total
+
+    def process_image(self, image) -> Dict:
+        """Calculate KPIs for one still image with the static-mode FaceMesh and fresh calculator state.
+
+        Args:
+            image: Decoded BGR image.
+
+        Returns:
+            Dict: KPI results of the image.
+        """
+        frame_processor = self.pipeline.frame_processor
+        frame_processor.reset(self.pipeline.kpi_manager.clone())  # Images are independent; no carried-over state.
+        return frame_processor.process_frame(image, mode="static")
+
+    def iter_images(self, paths: List[str], workers: int = 1, decode_threads: int = 4,
+                    stop_event=None) -> Iterator[Dict]:
+        """Decode images on a thread pool, run static-mode inference and yield one row per image, in order.
+
+        At most a few images per worker are decoded or in flight at any time, so memory stays
+        bounded regardless of the number of images.
+
+        Args:
+            paths: Image file paths.
+            workers: Inference processes; 1 runs inference in this process.
+            decode_threads: Threads decoding images ahead of inference.
+            stop_event: threading.Event that cancels the run when set (optional).
+
+        Yields:
+            Dict: Row with source, image_index and KPI values (KPIs empty if the image cannot be read).
+        """
+        max_in_flight = max(2, 2 * max(workers, 1) + decode_threads)  # Bounds decoded images held in memory.
+        pending_paths = iter(enumerate(paths))
+        decoding = collections.deque()  # (index, path, decode future), in input order.
+        inferring = collections.deque()  # (index, path, inference future or decoded image), in input order.
+        pool = (ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                    initializer=_init_worker, initargs=(self.config_path,))
+                if workers > 1 else contextlib.nullcontext())
+        with ThreadPoolExecutor(max_workers=decode_threads) as decoder, pool as executor:
+            while stop_event is None or not stop_event.is_set():
+                # Keep the decode threads busy up to the in-flight limit.
+                while len(decoding) + len(inferring) < max_in_flight:
+                    item = next(pending_paths, None)
+                    if item is None:
+                        break
+                    index, path = item
+                    decoding.append((index, path, decoder.submit(cv2.imread, path)))
+                # Hand decoded images to inference in order (block only when nothing else is queued).
+                while decoding and (decoding[0][2].done() or not inferring):
+                    index, path, decoded = decoding.popleft()
+                    image = decoded.result()
+                    if image is not None and executor is not None:
+                        image = executor.submit(_process_image, image)
+                    inferring.append((index, path, image))
+                if not inferring:
+                    break  # All images processed.
+                index, path, job = inferring.popleft()
+                if job is None:
+                    logging.warning("Could not load image from %s", path)
+                    results = {}
+                else:
+                    results = job.result() if executor is not None else self.process_image(job)
+                yield {"source": path, "image_index": index, **results}
+            else:
+                logging.info("Image analysis cancelled.")
+                for _, _, job in inferring:
+                    if hasattr(job, "cancel"):
+                        job.cancel()
+
+    def run_images(self, sources: List[str], output_path: str, workers: int = 1, decode_threads: int = 4,
+                   progress: Optional[Callable[[int, int, float], None]] = None, progress_interval: float = 1.0,
+                   stop_event=None) -> int:
+        """Analyze still images from folders or glob patterns and stream their KPI rows to a file.
+
+        Args:
+            sources: Directories or glob patterns of images.
+            output_path: CSV or JSON Lines (.jsonl) output file.
+            workers: Inference processes; 1 runs inference in this process.
+            decode_threads: Threads decoding images ahead of inference.
+            progress: Callback receiving (images done, total images, images per second) (optional).
+            progress_interval: Minimum seconds between progress callbacks (the final one is always sent).
+            stop_event: threading.Event that cancels the run when set (optional).
+
+        Returns:
+            int: Number of images analyzed.
+        """
+        paths = [path for source in sources for path in find_images(source)]
+        total = len(paths)
+        logging.info("Analyzing %d images with %d workers", total, workers)
+        start = time.perf_counter()
+        last_report = start
+        done = 0
+        with ResultWriter(output_path, self.kpi_names, key_columns=["source", "image_index"]) as writer:
+            for row in self.iter_images(paths, workers, decode_threads, stop_event):
+                writer.write(row)
+                done += 1
+                now = time.perf_counter()
+                if now - last_report >= progress_interval or done == total:
+                    last_report = now
+                    rate = done / (now - start) if now > start else 0.0
+                    if progress is not None:
+                        progress(done, total, rate)
+                    else:
+                        logging.info("Analyzed %d/%d images (%.1f images/s)", done, total, rate)
+        return done
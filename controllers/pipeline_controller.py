@@ -0,0 +1,71 @@
+# controllers/pipeline_controller.py
+# Defines the PipelineController class, which builds the Qt-free processing pipeline shared by the GUI and batch tools.
+
+from config.config_loader import load_config  # Loads configuration settings from a JSON file.
+from adapters.adapter_pool import MediaPipeAdapterPool  # Lazily built, reusable MediaPipe adapters per mode.
+from kpi.kpi_factory import KpiFactory  # Creates KPI calculators based on configuration.
+from kpi.kpi_manager import KpiManager  # Manages KPI calculators for performance metric computation.
+from processors.frame_processor import FrameProcessor  # Processes video frames using MediaPipe and KPI calculators.
+import logging  # Enables logging for debugging and monitoring pipeline construction.
+
+class PipelineController:
+    def __init__(self, config_path="config/config.json", config=None):
+        """Initialize the PipelineController with configuration, KPI calculators and a frame processor.
+
+        Args:
+            config_path: Path to the JSON configuration file.
+            config: Already loaded AppConfig (optional); skips reading config_path.
+        """
+        # Load configuration from the specified JSON file.
+        self.config = config if config is not None else load_config(config_path)
+        logging.debug("Configuration loaded: %s", self.config.dict())
+        
+        # Live and static MediaPipe adapters, built on first use from the configuration settings.
+        self.adapter_pool = MediaPipeAdapterPool(self.config.mediapipe)
+        
+        # Initialize KPI manager with enabled calculators and their dependencies.
+        self.kpi_manager = self.create_kpi_manager()
+        
+        # Initialize frame processor with MediaPipe adapter and KPI manager.
+        self.frame_processor = FrameProcessor(self.adapter_pool, self.kpi_manager, self.config.tracking,
+                                              self.config.keyframes, self.config.gating, self.config.idle)
+        logging.debug("FrameProcessor initialized.")
+
+    def create_kpi_manager(self) -> KpiManager:
+        """Create a KpiManager with freshly instantiated calculators (no carried-over state).
+
+        Returns:
+            KpiManager: Manager with enabled calculators and the disabled ones they consume.
+        """
+        # Create KPI calculators based on the loaded configuration.
+        kpi_factory = KpiFactory(self.config.dict())
+        calculators = kpi_factory.create_calculators()
+        logging.debug("Calculators created: %s", [calc.name() for calc in calculators])
+        
+        # Create disabled calculators whose outputs enabled KPIs consume (e.g., eye openness for attention).
+        dependencies = kpi_factory.create_dependencies(calculators)
+        
+        # Register all calculators for metric computation.
+        kpi_manager = KpiManager(self.config.history.get("capacity", 18000))
+        for calc in calculators:
+            kpi_manager.register_calculator(calc)
+        for calc in dependencies:
+            kpi_manager.register_calculator(calc, enabled=False)
+        logging.debug("KpiManager initialized with calculators.")
+        return kpi_manager
+
+    def enabled_kpis(self):
+        """Group enabled KPI names by their group attribute (e.g., 'numeric', 'state').
+
+        Returns:
+            Dict[str, List[str]]: Mapping of group names to enabled KPI names, in registration order.
+        """
+        enabled_kpis = {}
+        for calc in self.kpi_manager.calculators:
+            if not self.kpi_manager.enabled[calc.name()]:
+                continue
+            group = calc.group()
+            if group not in enabled_kpis:
+                enabled_kpis[group] = []
+            enabled_kpis[group].append(calc.name())
+        return enabled_kpis
@@ -1,13 +1,12 @@
 from kpi.kpi_calculator import KpiCalculator
-from kpi.head_pose_estimator import HeadPoseEstimator
+import numpy as np
 import logging
 import time
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 class AttentionCalculator(KpiCalculator):
     def __init__(self, config: Dict = None):
         self.config = config or {}
-        self.estimator = HeadPoseEstimator()
         # NCAP-inspired thresholds (Euro NCAP DMS protocols)
         self.yaw_threshold = self.config.get("yaw_threshold", 20.0)  # ±20° yaw for forward gaze
         self.pitch_threshold = self.config.get("pitch_threshold", 15.0)  # ±15° pitch for forward gaze
@@ -25,15 +24,23 @@ class AttentionCalculator(KpiCalculator):
     def group(self) -> str:
         return "state"  # Fits NCAP’s safety state reporting
 
+    def consumes(self) -> List[str]:
+        return ["left_eye_openness", "right_eye_openness"]
+
+    def required_features(self) -> List[str]:
+        return ["head_pose"]
+
+    def history_seconds(self) -> float:
+        return self.distraction_time_threshold  # Distraction timer
+
     def calculate(self, data: Dict[str, Any]) -> str:
         landmarks = data.get("landmarks")
-        image_size = data.get("image_size")
         if not landmarks:
             self.reset_tracking()
             return "None"
         
-        # Head pose analysis
-        pose = self.estimator.estimate(landmarks, image_size)
+        # Head pose analysis (solved once per frame by the KpiManager)
+        pose = data.get("head_pose")
         if not pose:
             self.reset_tracking()
             return "None"
@@ -42,36 +49,75 @@ class AttentionCalculator(KpiCalculator):
         pitch = abs(pose["pitch"])
         gaze_forward = yaw <= self.yaw_threshold and pitch <= self.pitch_threshold
 
-        # Eye openness analysis (requires left/right_eye_openness KPIs)
+        # Eye openness analysis (produced upstream by the left/right_eye_openness calculators)
         left_eye_openness = data.get("left_eye_openness", 1.0)  # Default to open if missing
         right_eye_openness = data.get("right_eye_openness", 1.0)
         eyes_open = (left_eye_openness >= self.eye_openness_threshold and 
                      right_eye_openness >= self.eye_openness_threshold)
 
         # Determine current state
-        current_time = time.time()
+        current_time = data.get("timestamp", time.time())  # Video time when reprocessing recordings
         if gaze_forward and eyes_open:
             state = "Attentive"
             self.reset_tracking()
         elif not eyes_open:
             state = "Drowsy"  # Eyes closed → potential drowsiness
             self.drowsiness_detected = True
-            self.distraction_start_time = self.distraction_start_time or current_time
+            if self.distraction_start_time is None:
+                self.distraction_start_time = current_time
         else:
             state = "Distracted"  # Off-road gaze
-            self.distraction_start_time = self.distraction_start_time or current_time
+            if self.distraction_start_time is None:
+                self.distraction_start_time = current_time
 
-        # Check for sustained distraction/drowsiness
-        if self.distraction_start_time and state != "Attentive":
+        # Check for sustained distraction/drowsiness (a start at video time 0.0 counts too)
+        if self.distraction_start_time is not None and state != "Attentive":
             distraction_duration = current_time - self.distraction_start_time
             if distraction_duration >= self.distraction_time_threshold:
                 state = f"{state} (> {self.distraction_time_threshold}s)"
         
         self.last_state = state
-        logging.debug(f"Attention calculated: {state} (yaw={yaw:.2f}, pitch={pitch:.2f}, "
-                      f"left_eye={left_eye_openness:.2f}, right_eye={right_eye_openness:.2f})")
+        logging.debug("Attention calculated: %s (yaw=%.2f, pitch=%.2f, left_eye=%.2f, right_eye=%.2f)",
+                      state, yaw, pitch, left_eye_openness, right_eye_openness)
         return state
 
+    def calculate_batch(self, data: Dict[str, Any]) -> np.ndarray:
+        pose = data["head_pose"]
+        timestamps = data["timestamps"]
+        valid = data["present"] & ~np.isnan(pose["yaw"])  # "None" and reset without a face or pose
+        gaze_forward = (np.abs(pose["yaw"]) <= self.yaw_threshold) & (np.abs(pose["pitch"]) <= self.pitch_threshold)
+        eyes_open = ((data["left_eye_openness"] >= self.eye_openness_threshold) &
+                     (data["right_eye_openness"] >= self.eye_openness_threshold))
+        attentive = valid & gaze_forward & eyes_open
+        drowsy = valid & ~eyes_open
+        distracted = valid & eyes_open & ~gaze_forward
+
+        # Run-length detection: every frame of a run of drowsy/distracted frames measures from the run's start.
+        inattentive = drowsy | distracted
+        continued = self.distraction_start_time is not None  # A run still open from the previous call
+        starts = inattentive & ~np.concatenate(([continued], inattentive[:-1]))
+        start_index = np.maximum.accumulate(np.where(starts, np.arange(len(starts)), -1))
+        carried_start = self.distraction_start_time if continued else np.nan
+        start_time = np.where(start_index >= 0, timestamps[np.maximum(start_index, 0)], carried_start)
+        sustained = inattentive & (timestamps - start_time >= self.distraction_time_threshold)
+
+        states = np.full(len(valid), "None", dtype=object)
+        states[attentive] = "Attentive"
+        states[drowsy] = "Drowsy"
+        states[distracted] = "Distracted"
+        states[drowsy & sustained] = f"Drowsy (> {self.distraction_time_threshold}s)"
+        states[distracted & sustained] = f"Distracted (> {self.distraction_time_threshold}s)"
+
+        if len(states):
+            if inattentive[-1]:
+                run = slice(max(start_index[-1], 0), None)
+                self.drowsiness_detected = bool(drowsy[run].any()) or (start_index[-1] < 0 and self.drowsiness_detected)
+                self.distraction_start_time = float(start_time[-1])
+            else:
+                self.reset_tracking()
+            self.last_state = states[-1]
+        return states
+
     def reset_tracking(self):
         """Reset distraction tracking when attentive."""
         self.distraction_start_time = None
@@ -1,7 +1,8 @@
 # kpi/blink_rate_calculator.py
 from kpi.kpi_calculator import KpiCalculator
+import numpy as np
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 class BlinkRateCalculator(KpiCalculator):
     def __init__(self, config: Dict = None):
@@ -16,21 +17,35 @@ class BlinkRateCalculator(KpiCalculator):
     def group(self) -> str:
         return "numeric"
 
+    def consumes(self) -> List[str]:
+        return ["left_eye_openness"]  # EAR computed once by LeftEyeOpennessCalculator
+
+    def cumulative(self) -> bool:
+        return True  # Running blink count
+
     def calculate(self, data: Dict[str, Any]) -> float:
-        landmarks = data.get("landmarks")
-        if not landmarks:
-            return 0.0
-        
-        # Simple EAR calculation (reuse logic from EyelidOpennessCalculator)
-        left_eye_points = [landmarks.landmark[i] for i in [33, 159, 145, 133]]
-        img_w, img_h = data["image_size"]
-        coords = [(int(p.x * img_w), int(p.y * img_h)) for p in left_eye_points]
-        vert_dist = ((coords[1][0] - coords[2][0])**2 + (coords[1][1] - coords[2][1])**2)**0.5
-        hor_dist = ((coords[0][0] - coords[3][0])**2 + (coords[0][1] - coords[3][1])**2)**0.5
-        ear = vert_dist / (hor_dist + 1e-6)
+        if not data.get("landmarks"):
+            self.prev_openness = None  # A blink cannot span a lost face.
+            return self.blink_count
 
+        ear = data.get("left_eye_openness", 0.0)
         if self.prev_openness is not None and self.prev_openness > self.threshold and ear <= self.threshold:
             self.blink_count += 1
         self.prev_openness = ear
-        logging.debug(f"Blink count: {self.blink_count}")
-        return self.blink_count  # Per frame, simplistic for now
\ No newline at end of file
+        logging.debug("Blink count: %s", self.blink_count)
+        return self.blink_count  # Cumulative; see BlinksPerMinuteCalculator for the rate
+
+    def calculate_batch(self, data: Dict[str, Any]) -> np.ndarray:
+        present = data["present"]
+        ear = data["left_eye_openness"]
+        if not len(present):
+            return np.zeros(0, dtype=np.int64)
+        # Previous frame's EAR and face flag, continuing from the state of earlier calls.
+        prev_ear = np.concatenate(([self.prev_openness if self.prev_openness is not None else 0.0], ear[:-1]))
+        prev_present = np.concatenate(([self.prev_openness is not None], present[:-1]))
+        # A blink is a falling edge through the threshold between consecutive frames with a face.
+        blinks = present & prev_present & (prev_ear > self.threshold) & (ear <= self.threshold)
+        counts = self.blink_count + np.cumsum(blinks)
+        self.blink_count = int(counts[-1])
+        self.prev_openness = float(ear[-1]) if present[-1] else None
+        return counts
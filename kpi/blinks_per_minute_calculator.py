@@ -0,0 +1,58 @@
+# kpi/blinks_per_minute_calculator.py
+from kpi.kpi_calculator import KpiCalculator
+import numpy as np
+import logging
+from typing import Dict, Any, List
+from kpi.kpi_history import hold_latest
+
+class BlinksPerMinuteCalculator(KpiCalculator):
+    def __init__(self, config: Dict = None):
+        self.config = config or {}
+        self.window_seconds = self.config.get("window_seconds", 60.0)  # Sliding window for the rate
+        self.prev_count = None
+
+    def name(self) -> str:
+        return "blinks_per_minute"
+
+    def group(self) -> str:
+        return "numeric"
+
+    def consumes(self) -> List[str]:
+        return ["blink_rate"]  # Cumulative blink count from BlinkRateCalculator
+
+    def history_seconds(self) -> float:
+        return self.window_seconds
+
+    def calculate(self, data: Dict[str, Any]) -> float:
+        history = data.get("history")
+        if history is None:
+            return 0.0
+        events = history.series("blink_events")  # One sample per frame: blinks detected in that frame
+        window = events.window(self.window_seconds)
+        if data.get("landmarks"):
+            count = data.get("blink_rate", 0)
+            blinks = 0 if self.prev_count is None else max(0, count - self.prev_count)
+            self.prev_count = count
+            events.append(blinks, data.get("timestamp", 0.0))
+        rate = window.rate_per_minute()  # O(1): running sum over the window
+        logging.debug("Blinks per minute: %.1f", rate)
+        return rate
+
+    def calculate_batch(self, data: Dict[str, Any]) -> np.ndarray:
+        present = data["present"]
+        history = data.get("history")
+        if history is None:
+            return np.zeros(len(present))
+        events = history.series("blink_events")
+        initial = events.window(self.window_seconds).rate_per_minute()
+        counts = np.asarray(data.get("blink_rate", np.zeros(len(present))))[present]
+        if not len(counts):
+            return hold_latest(present, counts, initial)
+        previous = np.concatenate(([counts[0] if self.prev_count is None else self.prev_count], counts[:-1]))
+        self.prev_count = counts[-1]
+        timestamps = data["timestamps"][present]
+        sums, _ = events.extend(np.maximum(0, counts - previous), timestamps, self.window_seconds)
+        # Early in a session the rate is scaled to the time covered so far, as in rate_per_minute().
+        covered = np.minimum(self.window_seconds, timestamps - events.first_timestamp)
+        rates = np.where(covered > 0, sums * 60.0 / np.where(covered > 0, covered, 1.0), 0.0)
+        return hold_latest(present, rates, initial)
@@ -0,0 +1,100 @@
+# kpi/feature_cache.py
+# Defines the FeatureCache class, which computes derived per-frame features once and shares them between KPI calculators.
+
+import logging  # Facilitates logging for debugging and monitoring feature computation.
+from typing import Any, Callable, Dict  # Type hints for provider callables and frame data dictionaries.
+from kpi.head_pose_estimator import HeadPoseEstimator  # Solves head pose from facial landmarks.
+
+
+def _head_pose_provider() -> Callable[[Dict[str, Any]], Any]:
+    """Build a provider that solves the head pose once per frame.
+
+    Returns:
+        Callable: Function mapping frame data to a pose dict ('yaw', 'pitch', 'roll') or None.
+    """
+    estimator = HeadPoseEstimator()  # One estimator shared by every calculator that requires 'head_pose'.
+
+    def provide(data: Dict[str, Any]):
+        landmarks = data.get("landmarks")
+        image_size = data.get("image_size")
+        if not landmarks or not image_size:
+            return None  # Pose is undefined without a face.
+        return estimator.estimate(landmarks, image_size)
+
+    return provide
+
+
+def _head_pose_batch_provider() -> Callable[[Dict[str, Any]], Any]:
+    """Build a provider that solves the head pose of every frame of a batch.
+
+    Returns:
+        Callable: Function mapping batch data to a POSE_DTYPE column (NaN where undefined).
+    """
+    estimator = HeadPoseEstimator()
+
+    def provide(data: Dict[str, Any]):
+        return estimator.estimate_batch(data["points"], data["image_sizes"], data["present"])
+
+    return provide
+
+
+# Registry of known derived features, mapping feature names to provider builders.
+FEATURE_PROVIDERS: Dict[str, Callable[[], Callable[[Dict[str, Any]], Any]]] = {
+    "head_pose": _head_pose_provider,
+}
+
+# Batch counterparts of FEATURE_PROVIDERS, producing one column per feature for many frames.
+BATCH_FEATURE_PROVIDERS: Dict[str, Callable[[], Callable[[Dict[str, Any]], Any]]] = {
+    "head_pose": _head_pose_batch_provider,
+}
+
+
+class FeatureCache:
+    def __init__(self):
+        """Initialize an empty FeatureCache with no required features."""
+        self.providers = {}  # Map feature names to their per-frame provider functions.
+        self.batch_providers = {}  # Map feature names to their batch provider functions, built on first use.
+
+    def require(self, feature: str):
+        """Declare that a registered calculator depends on a derived feature.
+
+        Args:
+            feature: Name of the feature (e.g., 'head_pose').
+
+        Raises:
+            KeyError: If no provider is known for the feature.
+        """
+        if feature in self.providers:
+            return  # Already required by another calculator; computed once per frame.
+        if feature not in FEATURE_PROVIDERS:
+            raise KeyError(f"Unknown derived feature '{feature}'")
+        self.providers[feature] = FEATURE_PROVIDERS[feature]()
+        logging.debug("Derived feature required: %s", feature)
+
+    def populate(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute every required feature once and store it in the frame data.
+
+        Args:
+            data: Dictionary containing processed frame data (e.g., landmarks, image size).
+
+        Returns:
+            Dict[str, Any]: The same data dictionary, extended with one entry per required feature.
+        """
+        for feature, provide in self.providers.items():
+            data[feature] = provide(data)  # Calculators read the cached value under the feature name.
+        return data
+
+    def populate_batch(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute every required feature for a batch of frames and store the columns in the data.
+
+        Args:
+            data: Dictionary of per-frame columns (see KpiCalculator.calculate_batch).
+
+        Returns:
+            Dict[str, Any]: The same data dictionary, extended with one column per required feature.
+        """
+        for feature in self.providers:
+            if feature not in self.batch_providers:
+                self.batch_providers[feature] = BATCH_FEATURE_PROVIDERS[feature]()
+            data[feature] = self.batch_providers[feature](data)
+        return data
@@ -2,6 +2,39 @@ import cv2
 import numpy as np
 import math
 import logging
+from logs.rate_limited_log import RateLimitedLog
+
+# Per-frame head pose column of batch evaluation, in degrees; NaN where the pose is undefined.
+POSE_DTYPE = np.dtype([("yaw", np.float64), ("pitch", np.float64), ("roll", np.float64)])
+
+def _skew(vectors):
+    """Return the cross-product matrices of an (..., 3) array of vectors, shaped (..., 3, 3)."""
+    x, y, z = vectors[..., 0], vectors[..., 1], vectors[..., 2]
+    zero = np.zeros_like(x)
+    return np.stack([
+        np.stack([zero, -z, y], axis=-1),
+        np.stack([z, zero, -x], axis=-1),
+        np.stack([-y, x, zero], axis=-1)
+    ], axis=-2)
+
+def _rodrigues(rotation_vectors):
+    """Convert (F, 3) rotation vectors to (F, 3, 3) rotation matrices."""
+    theta = np.linalg.norm(rotation_vectors, axis=1)[:, None, None]
+    small = theta < 1e-12
+    k = _skew(rotation_vectors / np.where(small, 1.0, theta)[:, :, 0])
+    identity = np.broadcast_to(np.eye(3), k.shape)
+    rotation = identity + np.sin(theta) * k + (1.0 - np.cos(theta)) * (k @ k)
+    return np.where(small, identity + _skew(rotation_vectors), rotation)
+
+def _euler_degrees(rotation):
+    """Convert (F, 3, 3) rotation matrices to (F, 3) yaw, pitch, roll in degrees, as estimate() does."""
+    sy = np.sqrt(rotation[:, 0, 0] ** 2 + rotation[:, 1, 0] ** 2)
+    singular = sy < 1e-6  # Gimbal lock: roll becomes indeterminate.
+    pitch = np.where(singular, np.arctan2(-rotation[:, 1, 2], rotation[:, 1, 1]),
+                     np.arctan2(rotation[:, 2, 1], rotation[:, 2, 2]))
+    yaw = np.arctan2(-rotation[:, 2, 0], sy)
+    roll = np.where(singular, 0.0, np.arctan2(rotation[:, 1, 0], rotation[:, 0, 0]))
+    return np.degrees(np.stack([yaw, pitch, roll], axis=1))
 
 class HeadPoseEstimator:
     def __init__(self):
@@ -15,6 +48,14 @@ class HeadPoseEstimator:
             [-28.9, -28.9, -24.1],       # Left mouth corner (defines mouth plane)
             [28.9, -28.9, -24.1]         # Right mouth corner (defines mouth plane)
         ], dtype="double")
+        # Matching MediaPipe landmarks: nose tip, chin, left/right eye corners, left/right mouth corners
+        self.landmark_indices = np.array([1, 152, 33, 263, 61, 291])
+        # Maps image offsets from the nose tip to scaled rotation rows (scaled orthographic initialization).
+        self.model_pseudo_inverse = np.linalg.pinv(self.model_points[1:] - self.model_points[0])
+        self.dist_coeffs = np.zeros((4, 1))  # Distortion coefficients (assume no distortion for simplicity)
+        self.image_size = None  # Image size the cached camera matrix was built for.
+        self.camera_matrix = None
+        self.failure_log = RateLimitedLog("Failed to solve PnP for head pose estimation.")
         logging.debug("HeadPoseEstimator initialized with 3D model points.")
 
     def estimate(self, landmarks, image_size):
@@ -22,45 +63,37 @@ class HeadPoseEstimator:
         Estimate head pose (yaw, pitch, roll) from 2D facial landmarks.
 
         Args:
-            landmarks: MediaPipe landmark object containing facial keypoints.
+            landmarks: LandmarkFrame containing pixel-space facial keypoints.
             image_size: Tuple of (width, height) of the input image.
 
         Returns:
             dict: Contains 'yaw', 'pitch', and 'roll' in degrees, or None if estimation fails.
         """
-        # Convert 2D landmark coordinates to image pixel coordinates
-        image_points = np.array([
-            [landmarks.landmark[1].x * image_size[0], landmarks.landmark[1].y * image_size[1]],   # Nose tip
-            [landmarks.landmark[152].x * image_size[0], landmarks.landmark[152].y * image_size[1]], # Chin
-            [landmarks.landmark[33].x * image_size[0], landmarks.landmark[33].y * image_size[1]],  # Left eye left corner
-            [landmarks.landmark[263].x * image_size[0], landmarks.landmark[263].y * image_size[1]], # Right eye right corner
-            [landmarks.landmark[61].x * image_size[0], landmarks.landmark[61].y * image_size[1]],  # Left mouth corner
-            [landmarks.landmark[291].x * image_size[0], landmarks.landmark[291].y * image_size[1]] # Right mouth corner
-        ], dtype="double")
+        # Gather the six reference landmarks (already in pixel coordinates) in model-point order
+        image_points = landmarks.points[self.landmark_indices, :2].astype(np.float64)
 
         # Camera parameters: focal length approximated as image width, center at image midpoint
-        focal_length = image_size[0]  # Approximation for a typical camera
-        center = (image_size[0] / 2, image_size[1] / 2)
-        camera_matrix = np.array([
-            [focal_length, 0, center[0]],
-            [0, focal_length, center[1]],
-            [0, 0, 1]
-        ], dtype="double")
-
-        # Distortion coefficients (assume no distortion for simplicity)
-        dist_coeffs = np.zeros((4, 1))
+        if image_size != self.image_size:  # Rebuilt only when the resolution changes
+            focal_length = image_size[0]  # Approximation for a typical camera
+            center = (image_size[0] / 2, image_size[1] / 2)
+            self.camera_matrix = np.array([
+                [focal_length, 0, center[0]],
+                [0, focal_length, center[1]],
+                [0, 0, 1]
+            ], dtype="double")
+            self.image_size = image_size
 
         # Solve Perspective-n-Point problem to find rotation and translation vectors
         success, rotation_vector, translation_vector = cv2.solvePnP(
             self.model_points, 
             image_points, 
-            camera_matrix, 
-            dist_coeffs, 
+            self.camera_matrix, 
+            self.dist_coeffs, 
             flags=cv2.SOLVEPNP_ITERATIVE  # Iterative method for accuracy
         )
 
         if not success:
-            logging.warning("Failed to solve PnP for head pose estimation.")
+            self.failure_log.log()
             return None
 
         # Convert rotation vector to rotation matrix
@@ -87,5 +120,136 @@ class HeadPoseEstimator:
             "pitch": np.degrees(pitch),
             "roll": np.degrees(roll)
         }
-        logging.debug(f"Head pose estimated: {result}")
-        return result
\ No newline at end of file
+        logging.debug("Head pose estimated: %s", result)
+        return result
+
+    def estimate_batch(self, points, image_sizes, present, max_iterations=20):
+        """
+        Estimate head poses for many frames at once with NumPy, for offline sessions.
+
+        Solves the same reprojection least-squares problem as estimate() for all frames together:
+        a closed-form scaled orthographic (POS) initialization followed by vectorized
+        Levenberg-Marquardt refinement. Yaw, pitch and roll follow estimate()'s Euler convention
+        and agree with it within 1e-3 degrees (angles compared modulo 360) wherever both reach the
+        same minimum; on noisy landmarks solvePnP occasionally settles in a flipped local minimum
+        that the orthographic initialization avoids.
+
+        Args:
+            points: (frames, N, 3) array of pixel-space landmarks.
+            image_sizes: (frames, 2) array of (width, height).
+            present: (frames,) bool mask of frames with a face.
+            max_iterations: Refinement iterations at most.
+
+        Returns:
+            np.ndarray: (frames,) POSE_DTYPE array, NaN where there is no face or estimation fails.
+        """
+        poses = np.empty(len(present), dtype=POSE_DTYPE)
+        for field in POSE_DTYPE.names:
+            poses[field] = np.nan
+        index = np.flatnonzero(present)
+        if not len(index):
+            return poses
+        # Reference landmarks relative to the principal point; focal length = image width, as in estimate().
+        sizes = np.asarray(image_sizes, dtype=np.float64)[index]
+        focal = sizes[:, 0][:, None]
+        observed = points[index][:, self.landmark_indices, :2].astype(np.float64) - sizes[:, None, :] / 2
+
+        valid, rotation, translation = self._initial_poses(observed, focal)  # Drops degenerate layouts.
+        observed, focal, index = observed[valid], focal[valid], index[valid]
+        with np.errstate(all="ignore"):
+            rotation, translation, cost = self._refine(observed, focal, rotation, translation, max_iterations)
+
+        solved = np.isfinite(cost) & np.isfinite(translation).all(axis=1) & (translation[:, 2] > 0)
+        angles = _euler_degrees(rotation[solved])
+        for column, field in enumerate(("yaw", "pitch", "roll")):
+            poses[field][index[solved]] = angles[:, column]
+        if not (valid.all() and solved.all()):
+            self.failure_log.log()
+        return poses
+
+    def _initial_poses(self, observed, focal):
+        """Closed-form scaled orthographic pose of every frame.
+
+        Returns:
+            tuple: (valid, rotations, translations): mask of frames with a usable landmark layout
+            and the poses of those frames.
+        """
+        offsets = observed[:, 1:] - observed[:, :1]  # Image offsets from the nose tip (model origin).
+        row_x = offsets[:, :, 0] @ self.model_pseudo_inverse.T  # Scale * first rotation row.
+        row_y = offsets[:, :, 1] @ self.model_pseudo_inverse.T  # Scale * second rotation row.
+        norm_x = np.linalg.norm(row_x, axis=1)
+        norm_y = np.linalg.norm(row_y, axis=1)
+        r1 = row_x / np.maximum(norm_x, 1e-9)[:, None]
+        r2 = row_y / np.maximum(norm_y, 1e-9)[:, None]
+        r3 = np.cross(r1, r2)
+        valid = (norm_x > 1e-9) & (norm_y > 1e-9) & (np.linalg.norm(r3, axis=1) > 1e-6)
+        valid &= np.isfinite(observed).all(axis=(1, 2)) & (focal[:, 0] > 0)
+        approximate = np.stack([r1[valid], r2[valid], r3[valid]], axis=1)
+        u, _, vt = np.linalg.svd(approximate)  # Nearest proper rotation.
+        rotation = u @ vt
+        flip = np.linalg.det(rotation) < 0
+        u[flip, :, 2] *= -1
+        rotation[flip] = u[flip] @ vt[flip]
+        scale = ((norm_x + norm_y) / 2)[valid][:, None]  # focal / depth of the nose tip.
+        translation = np.concatenate([observed[valid, 0] / scale, focal[valid] / scale], axis=1)
+        return valid, rotation, translation
+
+    def _residuals(self, observed, focal, rotation, translation):
+        """Reprojection residuals (F, 12) and camera-frame model points (F, 6, 3)."""
+        camera = np.einsum("fij,pj->fpi", rotation, self.model_points) + translation[:, None, :]
+        projected = focal[:, :, None] * camera[:, :, :2] / camera[:, :, 2:]
+        return (projected - observed).reshape(len(observed), 2 * len(self.model_points)), camera
+
+    def _refine(self, observed, focal, rotation, translation, max_iterations):
+        """Levenberg-Marquardt refinement of all poses at once, on a left-multiplied rotation update.
+
+        Each iteration only processes the frames that have not converged yet.
+        """
+        rotation, translation = rotation.copy(), translation.copy()
+        residuals, camera = self._residuals(observed, focal, rotation, translation)
+        cost = np.einsum("fi,fi->f", residuals, residuals)
+        damping = np.full(len(observed), 1e-3)
+        active = np.arange(len(observed))  # Frames still being refined.
+        for _ in range(max_iterations):
+            if not len(active):
+                break
+            points, active_focal = camera[active], focal[active]
+            # d(projection)/d(camera point), shaped (F, 6, 2, 3).
+            inverse_depth = 1.0 / points[:, :, 2]
+            d_projection = np.zeros(points.shape[:2] + (2, 3))
+            d_projection[:, :, 0, 0] = d_projection[:, :, 1, 1] = active_focal * inverse_depth
+            d_projection[:, :, :, 2] = -active_focal[:, :, None] * points[:, :, :2] * inverse_depth[:, :, None] ** 2
+            # d(camera point)/d(rotation update, translation): [-[R X]x | I].
+            d_camera = np.concatenate([
+                -_skew(points - translation[active][:, None, :]),
+                np.broadcast_to(np.eye(3), points.shape[:2] + (3, 3))
+            ], axis=3)
+            jacobian = (d_projection @ d_camera).reshape(len(active), -1, 6)
+            jacobian_t = jacobian.transpose(0, 2, 1)
+            normal = jacobian_t @ jacobian
+            gradient = jacobian_t @ residuals[active][:, :, None]
+            diagonal = np.arange(6)
+            normal[:, diagonal, diagonal] += damping[active][:, None] * (normal[:, diagonal, diagonal] + 1e-9)
+            step = -np.linalg.solve(normal, gradient)[:, :, 0]
+
+            candidate_rotation = _rodrigues(step[:, :3]) @ rotation[active]
+            candidate_translation = translation[active] + step[:, 3:]
+            candidate_residuals, candidate_camera = self._residuals(observed[active], active_focal,
+                                                                    candidate_rotation, candidate_translation)
+            candidate_cost = np.einsum("fi,fi->f", candidate_residuals, candidate_residuals)
+            improved = candidate_cost < cost[active]
+            accepted = active[improved]
+            rotation[accepted] = candidate_rotation[improved]
+            translation[accepted] = candidate_translation[improved]
+            residuals[accepted] = candidate_residuals[improved]
+            camera[accepted] = candidate_camera[improved]
+            gain = cost[accepted] - candidate_cost[improved]
+            cost[accepted] = candidate_cost[improved]
+            damping[active] = np.where(improved, damping[active] * 0.1, damping[active] * 10.0)
+            # Converged: negligible improvement or steps, or no descent left at any damping.
+            converged = np.zeros(len(active), dtype=bool)
+            converged[improved] = gain <= 1e-12 * (1.0 + cost[accepted])
+            converged |= np.abs(step).max(axis=1) < 1e-10
+            converged |= damping[active] > 1e12
+            active = active[~converged]
+        return rotation, translation, cost
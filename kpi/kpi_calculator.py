@@ -2,7 +2,7 @@
 # Defines the abstract KpiCalculator class, providing a blueprint for KPI calculation implementations.
 
 from abc import ABC, abstractmethod  # Enables creation of abstract base classes with required methods.
-from typing import Any, Dict  # Type hints for flexible dictionary inputs and calculation outputs.
+from typing import Any, Dict, List  # Type hints for flexible dictionary inputs and calculation outputs.
 
 class KpiCalculator(ABC):
     """Abstract base class for KPI calculators, defining the interface for metric computation."""
@@ -25,6 +25,59 @@ class KpiCalculator(ABC):
         """
         pass
 
+    def produces(self) -> List[str]:
+        """Return the data keys this KPI publishes for downstream calculators.
+
+        A calculator producing a single value publishes it under its own name. Calculators
+        producing several keys return a dictionary keyed by these names from calculate().
+
+        Returns:
+            List[str]: Names of produced values (defaults to the KPI name).
+        """
+        return [self.name()]
+
+    def consumes(self) -> List[str]:
+        """Return the data keys produced by other calculators that this KPI reads.
+
+        The KpiManager runs the producers of these keys before this calculator.
+
+        Returns:
+            List[str]: Names of consumed values (empty by default).
+        """
+        return []
+
+    def cumulative(self) -> bool:
+        """Return whether the KPI value is a running total (e.g., a blink count).
+
+        Batch processing uses this to continue totals across video shards.
+
+        Returns:
+            bool: True for monotonically accumulating KPIs (False by default).
+        """
+        return False
+
+    def history_seconds(self) -> float:
+        """Return how many seconds of preceding frames the KPI value depends on (e.g., a sliding window).
+
+        Batch processing warms up at least this long before each video shard, so sharded
+        results match a sequential run.
+
+        Returns:
+            float: Seconds of history needed to rebuild the KPI's state (0.0 by default).
+        """
+        return 0.0
+
+    def required_features(self) -> List[str]:
+        """Return the shared per-frame features this KPI reads from the input data.
+
+        Features (e.g., 'head_pose') are computed once per frame by the KpiManager's
+        FeatureCache and stored in the data dictionary under their own name.
+
+        Returns:
+            List[str]: Names of required derived features (empty by default).
+        """
+        return []
+
     @abstractmethod
     def calculate(self, data: Dict[str, Any]) -> Any:
         """Calculate the KPI value based on input data.
@@ -35,4 +88,29 @@ class KpiCalculator(ABC):
         Returns:
             Any: The calculated KPI value (e.g., float for numeric KPIs, bool for state KPIs).
         """
-        pass
\ No newline at end of file
+        pass
+
+    def calculate_batch(self, data: Dict[str, Any]) -> Any:
+        """Calculate the KPI for many consecutive frames at once with array operations.
+
+        Used for offline workloads such as replayed landmark sessions. Results must equal calling
+        calculate() frame by frame, and calculator state carries over between calls, so long
+        recordings can be processed in chunks.
+
+        Args:
+            data: Dictionary of per-frame columns:
+                points: (frames, N, 3) float32 landmark array (undefined where no face).
+                present: (frames,) bool mask of frames with a face.
+                image_sizes: (frames, 2) array of (width, height).
+                timestamps: (frames,) float64 capture times in seconds.
+                history: The KpiManager's KpiHistory.
+                Plus one column per upstream produced key and required feature.
+
+        Returns:
+            Any: NumPy array with one value per frame (a dictionary of arrays for several produced keys).
+
+        Raises:
+            NotImplementedError: If the calculator has no vectorized implementation; the KpiManager
+                then runs calculate() per frame.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no batch implementation")
\ No newline at end of file
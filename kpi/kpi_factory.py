@@ -1,11 +1,35 @@
 # kpi/kpi_factory.py
 # Defines the KpiFactory class, responsible for dynamically creating KPI calculator instances based on configuration.
 
+import functools  # Caches calculator class lookups.
 import importlib  # Enables dynamic importing of modules for KPI calculators.
 import logging  # Facilitates logging for debugging and error tracking.
-from typing import List, Dict  # Type hints for lists and dictionaries.
+from typing import List, Dict, Optional  # Type hints for lists and dictionaries.
 from kpi.kpi_calculator import KpiCalculator  # Abstract base class for KPI calculators.
 
+@functools.lru_cache(maxsize=None)
+def load_calculator_class(kpi_name: str) -> type:
+    """Import and return the calculator class of a KPI, once per process.
+
+    Every KpiManager (per video, shard, passenger or replayed session) creates its calculators
+    through the factory, so the module lookup and class resolution are cached.
+
+    Args:
+        kpi_name: Name of the KPI (e.g., 'yaw' loads kpi.yaw_calculator.YawCalculator).
+
+    Returns:
+        type: The calculator class.
+
+    Raises:
+        ImportError: If the module cannot be imported.
+        AttributeError: If the module lacks the calculator class.
+    """
+    # Dynamically import the module for the KPI (e.g., kpi.yaw_calculator).
+    module = importlib.import_module(f"kpi.{kpi_name}_calculator")
+    # Construct the class name (e.g., YawCalculator from yaw_calculator).
+    class_name = ''.join(part.capitalize() for part in kpi_name.split('_')) + "Calculator"
+    return getattr(module, class_name)
+
 class KpiFactory:
     def __init__(self, config: Dict):
         """Initialize the KpiFactory with application configuration.
@@ -14,7 +38,30 @@ class KpiFactory:
             config: Dictionary containing KPI configurations (e.g., from config.json).
         """
         self.config = config  # Store the configuration for KPI creation.
-        logging.debug(f"KpiFactory initialized with config: {self.config}")
+        logging.debug("KpiFactory initialized with config: %s", self.config)
+
+    def create_calculator(self, kpi_name: str, params: Dict = None) -> Optional[KpiCalculator]:
+        """Create a single KPI calculator by name.
+
+        Args:
+            kpi_name: Name of the KPI (e.g., 'yaw' loads kpi.yaw_calculator.YawCalculator).
+            params: Calculator-specific parameters (optional).
+
+        Returns:
+            Optional[KpiCalculator]: The instantiated calculator, or None if it cannot be loaded.
+        """
+        try:
+            calculator_class = load_calculator_class(kpi_name)
+
+            # Instantiate the calculator with its specific parameters.
+            calculator = calculator_class(config=params or {})
+            logging.debug("Loaded calculator: %s", kpi_name)
+            return calculator
+
+        except (ImportError, AttributeError) as e:
+            # Log errors if module or class cannot be loaded.
+            logging.error("Failed to load calculator for '%s': %s", kpi_name, e)
+            return None
 
     def create_calculators(self) -> List[KpiCalculator]:
         """Create a list of enabled KPI calculator instances based on configuration.
@@ -31,24 +78,40 @@ class KpiFactory:
         }
 
         for kpi_name in enabled_kpis:
-            try:
-                # Dynamically import the module for the KPI (e.g., kpi.yaw_calculator).
-                module = importlib.import_module(f"kpi.{kpi_name}_calculator")
+            calculator = self.create_calculator(kpi_name, enabled_kpis[kpi_name].get("params", {}))
+            if calculator is not None:
+                calculators.append(calculator)
 
-                # Construct the class name (e.g., YawCalculator from yaw_calculator).
-                class_name = ''.join(part.capitalize() for part in kpi_name.split('_')) + "Calculator"
-                calculator_class = getattr(module, class_name)
+        # Log the names of all successfully created calculators.
+        logging.debug("Calculators created: %s", [calc.name() for calc in calculators])
+        return calculators
 
-                # Instantiate the calculator with its specific parameters.
-                calculators.append(
-                    calculator_class(config=enabled_kpis[kpi_name].get("params", {}))
-                )
-                logging.debug(f"Loaded calculator: {kpi_name}")
+    def create_dependencies(self, calculators: List[KpiCalculator]) -> List[KpiCalculator]:
+        """Create the calculators needed to satisfy what the given calculators consume.
 
-            except (ImportError, AttributeError) as e:
-                # Log errors if module or class cannot be loaded.
-                logging.error(f"Failed to load calculator for '{kpi_name}': {e}")
+        Dependencies missing from the enabled set are created with their configured
+        parameters (even if the KPI is disabled) or with defaults when not configured.
 
-        # Log the names of all successfully created calculators.
-        logging.debug(f"Calculators created: {[calc.name() for calc in calculators]}")
-        return calculators
\ No newline at end of file
+        Args:
+            calculators: Calculators already created (typically the enabled ones).
+
+        Returns:
+            List[KpiCalculator]: Additional calculators to register as disabled KPIs.
+        """
+        configured = {kpi["name"]: kpi for kpi in self.config.get("kpis", [])}
+        available = {key for calc in calculators for key in calc.produces()}
+        dependencies = []
+        pending = [key for calc in calculators for key in calc.consumes()]
+        while pending:
+            key = pending.pop(0)
+            if key in available:
+                continue
+            available.add(key)  # Attempt each missing key only once.
+            calculator = self.create_calculator(key, configured.get(key, {}).get("params", {}))
+            if calculator is not None:
+                dependencies.append(calculator)
+                available.update(calculator.produces())
+                pending.extend(calculator.consumes())  # Resolve transitive dependencies.
+
+        logging.debug("Dependency calculators created: %s", [calc.name() for calc in dependencies])
+        return dependencies
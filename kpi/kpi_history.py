@@ -0,0 +1,267 @@
+# kpi/kpi_history.py
+# Defines fixed-memory ring buffers of timestamped KPI values and incrementally maintained sliding windows.
+
+from collections import deque  # Monotonic deques for sliding-window minimum and maximum.
+from typing import Any, Dict, Optional, Tuple  # Type hints for results, optional thresholds and batch windows.
+import numbers  # Identifies numeric KPI values worth recording.
+import numpy as np  # Preallocated value and timestamp storage.
+
+class SlidingWindow:
+    def __init__(self, series: "KpiSeries", seconds: float, threshold: Optional[float] = None):
+        """Initialize a time window over a series, updated in amortized O(1) per appended sample.
+
+        Args:
+            series: KpiSeries the window reads from.
+            seconds: Window length in seconds, ending at the latest sample.
+            threshold: Value above which samples are counted by count_above() (optional).
+        """
+        self.series = series
+        self.seconds = seconds
+        self.threshold = threshold
+        self.start = series.total - len(series)  # Absolute index of the oldest sample in the window.
+        self.end = self.start  # Absolute index one past the newest sample in the window.
+        self.sum = 0.0
+        self.above = 0  # Samples in the window above the threshold.
+        self.minima = deque()  # (index, value) with increasing values; the front is the window minimum.
+        self.maxima = deque()  # (index, value) with decreasing values; the front is the window maximum.
+        # Replay samples still in the buffer so a window created mid-session starts filled.
+        for index in range(self.start, series.total):
+            self._add(index, series.value_at(index))
+        self._evict()
+
+    def _add(self, index: int, value: float):
+        """Add the sample at an absolute index to the window."""
+        self.end = index + 1
+        self.sum += value
+        if self.threshold is not None and value > self.threshold:
+            self.above += 1
+        while self.minima and self.minima[-1][1] >= value:
+            self.minima.pop()
+        self.minima.append((index, value))
+        while self.maxima and self.maxima[-1][1] <= value:
+            self.maxima.pop()
+        self.maxima.append((index, value))
+
+    def _evict(self, oldest_kept: Optional[int] = None):
+        """Drop samples older than the window, or before oldest_kept when the ring buffer is about to overwrite them.
+
+        Windows longer than the buffer's capacity therefore hold the latest capacity samples.
+        """
+        series = self.series
+        oldest_kept = series.total - len(series) if oldest_kept is None else oldest_kept
+        cutoff = series.latest_timestamp - self.seconds
+        while self.start < self.end and (self.start < oldest_kept or series.timestamp_at(self.start) < cutoff):
+            value = series.value_at(self.start)
+            self.sum -= value
+            if self.threshold is not None and value > self.threshold:
+                self.above -= 1
+            if self.minima and self.minima[0][0] == self.start:
+                self.minima.popleft()
+            if self.maxima and self.maxima[0][0] == self.start:
+                self.maxima.popleft()
+            self.start += 1
+
+    def update(self):
+        """Add samples appended to the series since the last update and evict expired ones."""
+        for index in range(max(self.end, self.series.total - len(self.series)), self.series.total):
+            self._add(index, self.series.value_at(index))
+        self._evict()
+
+    def count(self) -> int:
+        """Number of samples in the window."""
+        return self.end - self.start
+
+    def mean(self) -> float:
+        """Mean value in the window (0.0 if empty)."""
+        return self.sum / self.count() if self.count() else 0.0
+
+    def min(self) -> float:
+        """Minimum value in the window (0.0 if empty)."""
+        return self.minima[0][1] if self.minima else 0.0
+
+    def max(self) -> float:
+        """Maximum value in the window (0.0 if empty)."""
+        return self.maxima[0][1] if self.maxima else 0.0
+
+    def count_above(self) -> int:
+        """Number of samples in the window above the threshold."""
+        return self.above
+
+    def fraction_above(self) -> float:
+        """Share of samples in the window above the threshold (0.0 if empty)."""
+        return self.above / self.count() if self.count() else 0.0
+
+    def rate_per_minute(self) -> float:
+        """Sum of the window's values per minute, e.g. events per minute for a series of event counts.
+
+        Early in a session the rate is scaled to the time covered so far rather than the full window.
+        """
+        covered = min(self.seconds, self.series.latest_timestamp - self.series.first_timestamp)
+        return self.sum * 60.0 / covered if covered > 0 else 0.0
+
+class KpiSeries:
+    def __init__(self, name: str, capacity: int):
+        """Initialize a ring buffer of timestamped values with preallocated storage.
+
+        Args:
+            name: KPI name the series records.
+            capacity: Maximum samples kept; older samples are overwritten.
+        """
+        self.name = name
+        self.capacity = capacity
+        self.values = np.zeros(capacity, dtype=np.float64)
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.total = 0  # Samples appended since creation (absolute index of the next sample).
+        self.first_timestamp = 0.0
+        self.latest_timestamp = 0.0
+        self.windows = {}  # Map (seconds, threshold) to SlidingWindow instances kept up to date.
+
+    def __len__(self) -> int:
+        """Number of samples currently stored."""
+        return min(self.total, self.capacity)
+
+    def append(self, value: float, timestamp: float):
+        """Append a sample and update every registered window.
+
+        Args:
+            value: KPI value.
+            timestamp: Capture time of the frame in seconds.
+        """
+        if self.total >= self.capacity:
+            # Let windows release the sample about to be overwritten while its value is still readable.
+            for window in self.windows.values():
+                window._evict(self.total - self.capacity + 1)
+        position = self.total % self.capacity
+        self.values[position] = value
+        self.timestamps[position] = timestamp
+        if self.total == 0:
+            self.first_timestamp = timestamp
+        self.latest_timestamp = timestamp
+        self.total += 1
+        for window in self.windows.values():
+            window.update()
+
+    def value_at(self, index: int) -> float:
+        """Value at an absolute sample index still held in the buffer."""
+        return float(self.values[index % self.capacity])
+
+    def timestamp_at(self, index: int) -> float:
+        """Timestamp at an absolute sample index still held in the buffer."""
+        return float(self.timestamps[index % self.capacity])
+
+    def window(self, seconds: float, threshold: Optional[float] = None) -> SlidingWindow:
+        """Return the sliding window over the last seconds, creating and registering it on first use.
+
+        Args:
+            seconds: Window length in seconds.
+            threshold: Value above which samples are counted (optional).
+
+        Returns:
+            SlidingWindow: Window updated on every append.
+        """
+        key = (seconds, threshold)
+        if key not in self.windows:
+            self.windows[key] = SlidingWindow(self, seconds, threshold)
+        return self.windows[key]
+
+    def extend(self, values, timestamps, seconds: Optional[float] = None) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Append many samples at once, e.g. when KPIs are calculated in batches.
+
+        Registered windows are rebuilt from the buffer afterwards.
+
+        Args:
+            values: Array of KPI values.
+            timestamps: Array of increasing capture times in seconds.
+            seconds: Window length to report for every appended sample (optional).
+
+        Returns:
+            Optional[Tuple[np.ndarray, np.ndarray]]: With seconds, the window sum and sample count
+            right after each appended sample, as a SlidingWindow of that length would report them.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        windows = None
+        if seconds is not None:
+            # Prefix sums over the samples still buffered plus the new ones.
+            previous_timestamps, previous_values = self.to_arrays()
+            all_timestamps = np.concatenate((previous_timestamps, timestamps))
+            sums = np.concatenate(([0.0], np.cumsum(np.concatenate((previous_values, values)))))
+            ends = np.arange(len(previous_values), len(all_timestamps)) + 1  # One past each new sample.
+            starts = np.searchsorted(all_timestamps, all_timestamps[ends - 1] - seconds, side="left")
+            starts = np.maximum(starts, ends - self.capacity)  # Samples overwritten in the ring buffer.
+            windows = (sums[ends] - sums[starts], ends - starts)
+        count = len(values)
+        if count:
+            if self.total == 0:
+                self.first_timestamp = float(timestamps[0])
+            kept = min(count, self.capacity)
+            positions = (self.total + np.arange(count - kept, count)) % self.capacity
+            self.values[positions] = values[count - kept:]
+            self.timestamps[positions] = timestamps[count - kept:]
+            self.total += count
+            self.latest_timestamp = float(timestamps[-1])
+            for key in self.windows:
+                self.windows[key] = SlidingWindow(self, *key)
+        return windows
+
+    def to_arrays(self):
+        """Return stored (timestamps, values) in chronological order, as copies."""
+        start = self.total % self.capacity if self.total > self.capacity else 0
+        order = (np.arange(len(self)) + start) % self.capacity
+        return self.timestamps[order], self.values[order]
+
+class KpiHistory:
+    def __init__(self, capacity: int = 18000):
+        """Initialize the history store.
+
+        Args:
+            capacity: Samples kept per KPI (default 18000, ten minutes at 30 FPS).
+        """
+        self.capacity = capacity
+        self.series_by_name: Dict[str, KpiSeries] = {}
+
+    def series(self, name: str) -> KpiSeries:
+        """Return the series for a KPI, creating it on first use."""
+        if name not in self.series_by_name:
+            self.series_by_name[name] = KpiSeries(name, self.capacity)
+        return self.series_by_name[name]
+
+    def record(self, name: str, value: Any, timestamp: float):
+        """Append a KPI value if it is numeric (booleans count as 0/1; None and states are skipped).
+
+        Args:
+            name: KPI name.
+            value: Calculated value.
+            timestamp: Capture time of the frame in seconds.
+        """
+        if isinstance(value, numbers.Real):
+            self.series(name).append(float(value), timestamp)
+
+    def record_batch(self, name: str, values, timestamps):
+        """Append a column of KPI values if it is numeric (state columns are skipped).
+
+        Args:
+            name: KPI name.
+            values: Array of calculated values.
+            timestamps: Array of capture times in seconds.
+        """
+        values = np.asarray(values)
+        if values.dtype.kind in "biuf":
+            self.series(name).extend(values, timestamps)
+
+def hold_latest(present: np.ndarray, samples: np.ndarray, initial: float) -> np.ndarray:
+    """Spread values computed at the frames with a face over all frames.
+
+    Frames without a face keep the value of the latest frame with one, as windowed KPIs do when
+    nothing is appended; frames before the first face get the initial value.
+
+    Args:
+        present: (frames,) bool mask of frames with a face.
+        samples: One value per frame with a face.
+        initial: Value before the first frame with a face.
+
+    Returns:
+        np.ndarray: (frames,) float64 values.
+    """
+    values = np.concatenate(([initial], np.asarray(samples, dtype=np.float64)))
+    return values[np.cumsum(present)]  # Number of faces seen so far indexes the latest sample.
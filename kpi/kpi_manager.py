@@ -2,35 +2,231 @@
 # Defines the KpiManager class, responsible for managing and executing KPI calculators.
 
 import logging  # Facilitates logging for debugging and monitoring calculator execution.
-from typing import Dict, Any  # Type hints for flexible dictionary inputs and outputs.
+import numbers  # Distinguishes numeric from state results of per-frame fallbacks.
+import time  # Fallback timestamps for recorded history samples and calculator timing.
+from typing import Dict, Any, List  # Type hints for flexible dictionary inputs and outputs.
+import numpy as np  # Result columns of batch evaluation.
+from adapters.landmark_frame import LandmarkFrame  # Per-frame landmarks for calculators without a batch path.
+from kpi.feature_cache import FeatureCache  # Computes derived features shared between calculators.
+from kpi.kpi_history import KpiHistory  # Fixed-memory history of numeric KPI values with sliding windows.
+from logs.instrumentation import instrumentation  # Per-calculator timing when enabled.
 
 class KpiManager:
-    def __init__(self):
-        """Initialize the KpiManager with an empty list of calculators."""
+    def __init__(self, history_capacity: int = 18000):
+        """Initialize the KpiManager with an empty list of calculators.
+
+        Args:
+            history_capacity: Samples kept per KPI in the history (default 18000, ten minutes at 30 FPS).
+        """
         self.calculators = []  # Store registered KPI calculators.
+        self.enabled = {}  # Map calculator names to whether their KPI is reported.
+        self.plan = []  # Dependency-ordered calculators executed for each frame.
+        self.feature_cache = FeatureCache()  # Derived features computed once per frame.
+        self.history = KpiHistory(history_capacity)  # Recent values of every produced numeric KPI.
         logging.debug("KpiManager initialized.")
 
-    def register_calculator(self, calculator):
-        """Register a KPI calculator for execution.
+    def register_calculator(self, calculator, enabled: bool = True):
+        """Register a KPI calculator for execution and rebuild the execution plan.
 
         Args:
             calculator: A KpiCalculator instance to be added to the manager.
+            enabled: Whether the KPI is reported. Disabled calculators only run when an
+                enabled calculator consumes one of their outputs.
         """
         self.calculators.append(calculator)  # Add calculator to the list.
-        logging.debug(f"Calculator registered: {calculator.name()}")
+        self.enabled[calculator.name()] = enabled
+        self.build_plan()  # Resolve dependencies once, not per frame.
+        logging.debug("Calculator registered: %s (enabled=%s)", calculator.name(), enabled)
+
+    def build_plan(self):
+        """Build the topologically sorted execution plan from declared dependencies.
+
+        Raises:
+            ValueError: If two calculators produce the same key or dependencies form a cycle.
+        """
+        # Map each produced key to the calculator responsible for it.
+        producers = {}
+        for calculator in self.calculators:
+            for key in calculator.produces():
+                if key in producers:
+                    raise ValueError(f"'{key}' is produced by both '{producers[key].name()}' and '{calculator.name()}'")
+                producers[key] = calculator
+
+        # Collect enabled calculators plus every producer they transitively depend on.
+        active = []
+        pending = [calc for calc in self.calculators if self.enabled[calc.name()]]
+        while pending:
+            calculator = pending.pop(0)
+            if calculator in active:
+                continue
+            active.append(calculator)
+            for key in calculator.consumes():
+                if key in producers:
+                    pending.append(producers[key])
+                else:
+                    # Calculators fall back to their own defaults for unresolved inputs.
+                    logging.debug("'%s' consumes '%s' but no calculator produces it yet.", calculator.name(), key)
+
+        # Kahn's algorithm, keeping registration order among independent calculators.
+        ordered = [calc for calc in self.calculators if calc in active]
+        plan: List = []
+        while ordered:
+            ready = next(
+                (calc for calc in ordered
+                 if all(producers.get(key) in plan or key not in producers for key in calc.consumes())),
+                None
+            )
+            if ready is None:
+                raise ValueError(f"Cyclic KPI dependencies among: {[calc.name() for calc in ordered]}")
+            plan.append(ready)
+            ordered.remove(ready)
+        self.plan = plan
+
+        # Only features needed by calculators in the plan are computed per frame.
+        self.feature_cache = FeatureCache()
+        for calculator in self.plan:
+            for feature in calculator.required_features():
+                self.feature_cache.require(feature)
+        logging.debug("KPI execution plan: %s", [calc.name() for calc in self.plan])
+
+    def history_seconds(self) -> float:
+        """Return the longest history any calculator in the plan depends on, in seconds.
+
+        Returns:
+            float: Seconds of preceding frames needed to rebuild every KPI's state.
+        """
+        return max((calculator.history_seconds() for calculator in self.plan), default=0.0)
+
+    def clone(self) -> "KpiManager":
+        """Create a manager with the same calculators and enabled flags but fresh calculator state.
+
+        Used to keep independent KPI state per tracked face.
+
+        Returns:
+            KpiManager: New manager with newly instantiated calculators.
+        """
+        manager = KpiManager(self.history.capacity)
+        for calculator in self.calculators:
+            manager.register_calculator(type(calculator)(config=calculator.config), self.enabled[calculator.name()])
+        return manager
 
     def calculate(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute all registered calculators on the input data.
+        """Execute the calculator plan on the input data, feeding results downstream.
 
         Args:
             data: Dictionary containing processed frame data (e.g., landmarks, image size).
+                Produced values are written back into it for consuming calculators, and
+                data["history"] gives them the KpiHistory, already holding this frame's upstream values
+                (values are only recorded while a face is present).
 
         Returns:
-            Dict[str, Any]: Dictionary mapping calculator names to their results.
+            Dict[str, Any]: Dictionary mapping enabled calculator names to their results.
         """
         results = {}  # Initialize dictionary to store calculation results.
-        for calculator in self.calculators:
-            logging.debug(f"Executing calculator: {calculator.name()}")
-            # Store each calculator's result under its name.
-            results[calculator.name()] = calculator.calculate(data)
-        return results
\ No newline at end of file
+        timestamp = data.get("timestamp", time.time())
+        data["history"] = self.history
+        face_present = data.get("landmarks") is not None  # Placeholder values without a face are not history.
+        self.feature_cache.populate(data)  # Solve shared features (e.g., head pose) once for all calculators.
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)  # Checked once per frame, not per calculator.
+        timing = instrumentation.enabled
+        for calculator in self.plan:
+            if debug:
+                logging.debug("Executing calculator: %s", calculator.name())
+            if timing:
+                start = time.perf_counter()
+                value = calculator.calculate(data)
+                instrumentation.record("kpi." + calculator.name(), time.perf_counter() - start)
+            else:
+                value = calculator.calculate(data)
+            produced = calculator.produces()
+            if len(produced) == 1:
+                data[produced[0]] = value  # Publish the result for downstream calculators.
+            else:
+                data.update({key: value.get(key) for key in produced})
+            if face_present:
+                for key in produced:
+                    self.history.record(key, data[key], timestamp)
+            if self.enabled[calculator.name()]:
+                # Store each enabled calculator's result under its name.
+                results[calculator.name()] = value
+        return results
+
+    def calculate_batch(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute the calculator plan on many consecutive frames at once, one column per KPI.
+
+        Calculators run their vectorized calculate_batch(); those without one fall back to
+        calculate() per frame. Calculator state and history carry over between calls, so long
+        recordings can be fed in chunks and results equal per-frame calculate() calls.
+
+        Args:
+            data: Dictionary of per-frame columns (points, present, image_sizes, timestamps; see
+                KpiCalculator.calculate_batch). Produced columns are written back into it.
+
+        Returns:
+            Dict[str, Any]: Dictionary mapping enabled calculator names to their result columns.
+        """
+        results = {}
+        data["history"] = self.history
+        present = data["present"]
+        timestamps = data["timestamps"]
+        self.feature_cache.populate_batch(data)  # Shared features (e.g., head pose) for every frame.
+        timing = instrumentation.enabled
+        for calculator in self.plan:
+            start = time.perf_counter() if timing else 0.0
+            try:
+                column = calculator.calculate_batch(data)
+            except NotImplementedError:
+                logging.debug("No batch path for %s; calculating per frame", calculator.name())
+                column = self._calculate_frames(calculator, data)
+            if timing:
+                instrumentation.record("kpi_batch." + calculator.name(), time.perf_counter() - start)
+            produced = calculator.produces()
+            if len(produced) == 1:
+                data[produced[0]] = column  # Publish the column for downstream calculators.
+            else:
+                data.update({key: column.get(key) for key in produced})
+            for key in produced:
+                self.history.record_batch(key, data[key][present], timestamps[present])
+            if self.enabled[calculator.name()]:
+                results[calculator.name()] = column
+        return results
+
+    def _calculate_frames(self, calculator, data: Dict[str, Any]):
+        """Run a calculator without a batch implementation frame by frame over batch columns.
+
+        Args:
+            calculator: KpiCalculator to run.
+            data: Dictionary of per-frame columns.
+
+        Returns:
+            Any: Result column (a dictionary of columns for several produced keys).
+        """
+        values = []
+        for index in range(len(data["present"])):
+            image_size = (int(data["image_sizes"][index][0]), int(data["image_sizes"][index][1]))
+            frame_data = {
+                "landmarks": LandmarkFrame(data["points"][index], image_size) if data["present"][index] else None,
+                "image_size": image_size,
+                "frame": None,
+                "timestamp": float(data["timestamps"][index]),
+                "history": self.history
+            }
+            for key in calculator.consumes():
+                if key in data:
+                    frame_data[key] = data[key][index]
+            for feature in calculator.required_features():
+                frame_data[feature] = self.feature_cache.providers[feature](frame_data)
+            values.append(calculator.calculate(frame_data))
+        produced = calculator.produces()
+        if len(produced) == 1:
+            return self._column(values)
+        return {key: self._column([value.get(key) for value in values]) for key in produced}
+
+    @staticmethod
+    def _column(values: List[Any]) -> np.ndarray:
+        """Convert per-frame results into a float column, or an object column for states."""
+        if all(isinstance(value, numbers.Real) for value in values):
+            return np.asarray(values, dtype=np.float64)
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+        return column
@@ -8,7 +8,7 @@ class LeftEyeOpennessCalculator(KpiCalculator):
         self.config = config or {}
         self.threshold = self.config.get("threshold", 0.3)  # NCAP-like threshold for "open"
         # MediaPipe refined landmark indices for left eye
-        self.eye_indices = [33, 159, 145, 133]  # Outer, upper, lower, inner
+        self.eye_indices = np.array([33, 159, 145, 133])  # Outer, upper, lower, inner
 
     def name(self) -> str:
         return "left_eye_openness"
@@ -23,14 +23,18 @@ class LeftEyeOpennessCalculator(KpiCalculator):
             logging.debug("LeftEyeOpenness: No landmarks or image size provided.")
             return 0.0
         
-        img_w, img_h = image_size
-        points = [landmarks.landmark[i] for i in self.eye_indices]
-        coords = [(int(p.x * img_w), int(p.y * img_h)) for p in points]
+        coords = landmarks.points[self.eye_indices, :2]  # Single gather of pixel-space x, y.
         
         # EAR: vertical distance (upper to lower) / horizontal distance (outer to inner)
-        vert_dist = np.linalg.norm(np.array(coords[1]) - np.array(coords[2]))
-        hor_dist = np.linalg.norm(np.array(coords[0]) - np.array(coords[3]))
+        vert_dist = np.linalg.norm(coords[1] - coords[2])
+        hor_dist = np.linalg.norm(coords[0] - coords[3])
         ear = vert_dist / (hor_dist + 1e-6)  # Avoid division by zero
         
-        logging.debug(f"Left Eye Openness: EAR={ear:.2f}")
-        return ear
\ No newline at end of file
+        logging.debug("Left Eye Openness: EAR=%.2f", ear)
+        return ear
+
+    def calculate_batch(self, data: Dict[str, Any]) -> np.ndarray:
+        coords = data["points"][:, self.eye_indices, :2]  # (frames, 4, 2) gather for all frames at once.
+        vert_dist = np.linalg.norm(coords[:, 1] - coords[:, 2], axis=1)
+        hor_dist = np.linalg.norm(coords[:, 0] - coords[:, 3], axis=1)
+        return np.where(data["present"], vert_dist / (hor_dist + 1e-6), 0.0)
\ No newline at end of file
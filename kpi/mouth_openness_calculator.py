@@ -8,7 +8,7 @@ class MouthOpennessCalculator(KpiCalculator):
         self.config = config or {}
         # No threshold here—raw value for flexibility (e.g., NCAP analysis)
         # MediaPipe landmarks: upper lip (13), lower lip (14), left corner (61), right corner (291)
-        self.mouth_indices = [13, 14, 61, 291]
+        self.mouth_indices = np.array([13, 14, 61, 291])
 
     def name(self) -> str:
         return "mouth_openness"
@@ -23,16 +23,20 @@ class MouthOpennessCalculator(KpiCalculator):
             logging.debug("MouthOpenness: No landmarks or image size provided.")
             return 0.0
         
-        img_w, img_h = image_size
-        points = [landmarks.landmark[i] for i in self.mouth_indices]
-        coords = [(int(p.x * img_w), int(p.y * img_h)) for p in points]
+        coords = landmarks.points[self.mouth_indices, :2]  # Single gather of pixel-space x, y.
         
         # Vertical distance (upper to lower lip)
-        vert_dist = np.linalg.norm(np.array(coords[0]) - np.array(coords[1]))
+        vert_dist = np.linalg.norm(coords[0] - coords[1])
         # Horizontal distance (left to right corner)
-        hor_dist = np.linalg.norm(np.array(coords[2]) - np.array(coords[3]))
+        hor_dist = np.linalg.norm(coords[2] - coords[3])
         # Normalized openness
         openness = vert_dist / (hor_dist + 1e-6)
         
-        logging.debug(f"Mouth Openness: openness={openness:.2f}")
-        return openness
\ No newline at end of file
+        logging.debug("Mouth Openness: openness=%.2f", openness)
+        return openness
+
+    def calculate_batch(self, data: Dict[str, Any]) -> np.ndarray:
+        coords = data["points"][:, self.mouth_indices, :2]  # (frames, 4, 2) gather for all frames at once.
+        vert_dist = np.linalg.norm(coords[:, 0] - coords[:, 1], axis=1)
+        hor_dist = np.linalg.norm(coords[:, 2] - coords[:, 3], axis=1)
+        return np.where(data["present"], vert_dist / (hor_dist + 1e-6), 0.0)
\ No newline at end of file
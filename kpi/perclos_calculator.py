@@ -0,0 +1,49 @@
+# kpi/perclos_calculator.py
+from kpi.kpi_calculator import KpiCalculator
+import numpy as np
+import logging
+from typing import Dict, Any, List
+from kpi.kpi_history import hold_latest
+
+class PerclosCalculator(KpiCalculator):
+    def __init__(self, config: Dict = None):
+        self.config = config or {}
+        self.closed_threshold = self.config.get("closed_threshold", 0.2)  # Mean EAR at or below which eyes count as closed
+        self.window_seconds = self.config.get("window_seconds", 60.0)  # Sliding window for the closure percentage
+
+    def name(self) -> str:
+        return "perclos"
+
+    def group(self) -> str:
+        return "numeric"
+
+    def consumes(self) -> List[str]:
+        return ["left_eye_openness", "right_eye_openness"]
+
+    def history_seconds(self) -> float:
+        return self.window_seconds
+
+    def calculate(self, data: Dict[str, Any]) -> float:
+        history = data.get("history")
+        if history is None:
+            return 0.0
+        closures = history.series("eye_closure")  # One sample per frame: 1.0 if eyes closed
+        window = closures.window(self.window_seconds)
+        if data.get("landmarks"):
+            ear = (data.get("left_eye_openness", 0.0) + data.get("right_eye_openness", 0.0)) / 2
+            closures.append(1.0 if ear <= self.closed_threshold else 0.0, data.get("timestamp", 0.0))
+        perclos = window.mean() * 100  # O(1): running sum over the window
+        logging.debug("PERCLOS: %.1f%%", perclos)
+        return perclos
+
+    def calculate_batch(self, data: Dict[str, Any]) -> np.ndarray:
+        present = data["present"]
+        history = data.get("history")
+        if history is None:
+            return np.zeros(len(present))
+        closures = history.series("eye_closure")
+        initial = closures.window(self.window_seconds).mean() * 100
+        ear = (data["left_eye_openness"][present] + data["right_eye_openness"][present]) / 2
+        samples = (ear <= self.closed_threshold).astype(np.float64)
+        sums, counts = closures.extend(samples, data["timestamps"][present], self.window_seconds)
+        return hold_latest(present, sums / np.maximum(counts, 1) * 100, initial)
@@ -1,12 +1,11 @@
 from kpi.kpi_calculator import KpiCalculator
-from kpi.head_pose_estimator import HeadPoseEstimator
+import numpy as np
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 class PitchCalculator(KpiCalculator):
     def __init__(self, config: Dict = None):
         self.config = config or {}
-        self.estimator = HeadPoseEstimator()
         self.threshold = self.config.get("threshold", 20.0)
 
     def name(self) -> str:
@@ -15,12 +14,15 @@ class PitchCalculator(KpiCalculator):
     def group(self) -> str:
         return "numeric"
 
+    def required_features(self) -> List[str]:
+        return ["head_pose"]
+
     def calculate(self, data: Dict[str, Any]) -> float:
-        landmarks = data.get("landmarks")
-        image_size = data.get("image_size")
-        if not landmarks:
-            return 0.0
-        pose = self.estimator.estimate(landmarks, image_size)
+        pose = data.get("head_pose")
         pitch = pose["pitch"] if pose else 0.0
-        logging.debug(f"Pitch calculated: {pitch}, threshold: {self.threshold}")
-        return pitch
\ No newline at end of file
+        logging.debug("Pitch calculated: %s, threshold: %s", pitch, self.threshold)
+        return pitch
+
+    def calculate_batch(self, data: Dict[str, Any]) -> np.ndarray:
+        pitch = data["head_pose"]["pitch"]
+        return np.where(np.isnan(pitch), 0.0, pitch)  # 0.0 where the pose is undefined, as in calculate().
@@ -1,12 +1,11 @@
 from kpi.kpi_calculator import KpiCalculator
-from kpi.head_pose_estimator import HeadPoseEstimator
+import numpy as np
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 class RollCalculator(KpiCalculator):
     def __init__(self, config: Dict = None):
         self.config = config or {}
-        self.estimator = HeadPoseEstimator()
         self.threshold = self.config.get("threshold", 25.0)
 
     def name(self) -> str:
@@ -15,12 +14,15 @@ class RollCalculator(KpiCalculator):
     def group(self) -> str:
         return "numeric"
 
+    def required_features(self) -> List[str]:
+        return ["head_pose"]
+
     def calculate(self, data: Dict[str, Any]) -> float:
-        landmarks = data.get("landmarks")
-        image_size = data.get("image_size")
-        if not landmarks:
-            return 0.0
-        pose = self.estimator.estimate(landmarks, image_size)
+        pose = data.get("head_pose")
         roll = pose["roll"] if pose else 0.0
-        logging.debug(f"Roll calculated: {roll}, threshold: {self.threshold}")
-        return roll
\ No newline at end of file
+        logging.debug("Roll calculated: %s, threshold: %s", roll, self.threshold)
+        return roll
+
+    def calculate_batch(self, data: Dict[str, Any]) -> np.ndarray:
+        roll = data["head_pose"]["roll"]
+        return np.where(np.isnan(roll), 0.0, roll)  # 0.0 where the pose is undefined, as in calculate().
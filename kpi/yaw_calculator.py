@@ -1,13 +1,12 @@
 # kpi/yaw_calculator.py
 from kpi.kpi_calculator import KpiCalculator
-from kpi.head_pose_estimator import HeadPoseEstimator
+import numpy as np
 import logging
-from typing import Dict, Any  # Add this import
+from typing import Dict, Any, List  # Add this import
 
 class YawCalculator(KpiCalculator):
     def __init__(self, config: Dict = None):
         self.config = config or {}
-        self.estimator = HeadPoseEstimator()
         self.threshold = self.config.get("threshold", 30.0)
 
     def name(self) -> str:
@@ -16,12 +15,15 @@ class YawCalculator(KpiCalculator):
     def group(self) -> str:
         return "numeric"
 
+    def required_features(self) -> List[str]:
+        return ["head_pose"]
+
     def calculate(self, data: Dict[str, Any]) -> float:
-        landmarks = data.get("landmarks")
-        image_size = data.get("image_size")
-        if not landmarks:
-            return 0.0
-        pose = self.estimator.estimate(landmarks, image_size)
+        pose = data.get("head_pose")
         yaw = pose["yaw"] if pose else 0.0
-        logging.debug(f"Yaw calculated: {yaw}, threshold: {self.threshold}")
-        return yaw
\ No newline at end of file
+        logging.debug("Yaw calculated: %s, threshold: %s", yaw, self.threshold)
+        return yaw
+
+    def calculate_batch(self, data: Dict[str, Any]) -> np.ndarray:
+        yaw = data["head_pose"]["yaw"]
+        return np.where(np.isnan(yaw), 0.0, yaw)  # 0.0 where the pose is undefined, as in calculate().
@@ -9,7 +9,7 @@ class YawnCalculator(KpiCalculator):
         # NCAP-inspired threshold: mouth opening > 0.5 (normalized) ≈ yawn
         self.openness_threshold = self.config.get("openness_threshold", 0.5)
         # MediaPipe landmarks: upper lip (13), lower lip (14), left corner (61), right corner (291)
-        self.mouth_indices = [13, 14, 61, 291]
+        self.mouth_indices = np.array([13, 14, 61, 291])
 
     def name(self) -> str:
         return "yawn"
@@ -24,17 +24,22 @@ class YawnCalculator(KpiCalculator):
             logging.debug("Yawn: No landmarks or image size provided.")
             return "None"
         
-        img_w, img_h = image_size
-        points = [landmarks.landmark[i] for i in self.mouth_indices]
-        coords = [(int(p.x * img_w), int(p.y * img_h)) for p in points]
+        coords = landmarks.points[self.mouth_indices, :2]  # Single gather of pixel-space x, y.
         
         # Vertical distance (upper to lower lip)
-        vert_dist = np.linalg.norm(np.array(coords[0]) - np.array(coords[1]))
+        vert_dist = np.linalg.norm(coords[0] - coords[1])
         # Horizontal distance (left to right corner)
-        hor_dist = np.linalg.norm(np.array(coords[2]) - np.array(coords[3]))
+        hor_dist = np.linalg.norm(coords[2] - coords[3])
         # Normalized openness (EAR-like metric)
         openness = vert_dist / (hor_dist + 1e-6)
         
         result = "Detected" if openness >= self.openness_threshold else "None"
-        logging.debug(f"Yawn: openness={openness:.2f}, result={result}")
-        return result
\ No newline at end of file
+        logging.debug("Yawn: openness=%.2f, result=%s", openness, result)
+        return result
+
+    def calculate_batch(self, data: Dict[str, Any]) -> np.ndarray:
+        coords = data["points"][:, self.mouth_indices, :2]  # (frames, 4, 2) gather for all frames at once.
+        vert_dist = np.linalg.norm(coords[:, 0] - coords[:, 1], axis=1)
+        hor_dist = np.linalg.norm(coords[:, 2] - coords[:, 3], axis=1)
+        detected = data["present"] & (vert_dist / (hor_dist + 1e-6) >= self.openness_threshold)
+        return np.where(detected, "Detected", "None").astype(object)
\ No newline at end of file
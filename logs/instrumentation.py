@@ -0,0 +1,176 @@
+# logs/instrumentation.py
+# Defines the Instrumentation class, which collects per-stage timings, frame counters and rolling percentiles.
+
+import json  # Writes the machine-readable metrics dump.
+import threading  # Guards stage creation; stages are recorded from capture, inference and GUI threads.
+import time  # High-resolution timer for stage durations.
+from typing import Any, Dict, List  # Type hints for snapshots and overlay lines.
+
+class _StageSamples:
+    """Ring buffer of the most recent durations of one stage, in seconds."""
+
+    __slots__ = ("samples", "count", "total")
+
+    def __init__(self, window: int):
+        import numpy as np  # Created on the first recorded stage, keeping numpy off the GUI startup path.
+        self.samples = np.zeros(window, dtype=np.float64)
+        self.count = 0  # Durations recorded since start (samples holds the latest window of them).
+        self.total = 0.0  # Sum of all recorded durations.
+
+    def add(self, seconds: float):
+        self.samples[self.count % len(self.samples)] = seconds
+        self.count += 1
+        self.total += seconds
+
+    def summary(self) -> Dict[str, float]:
+        import numpy as np  # Already loaded by __init__.
+        recent = self.samples[:min(self.count, len(self.samples))] * 1000.0
+        p50, p95, p99 = np.percentile(recent, [50, 95, 99]) if len(recent) else (0.0, 0.0, 0.0)
+        return {
+            "count": self.count,
+            "mean_ms": float(recent.mean()) if len(recent) else 0.0,
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "p99_ms": float(p99),
+            "total_s": self.total
+        }
+
+class _Timer:
+    """Context manager recording the duration of a with-block into a stage."""
+
+    __slots__ = ("instrumentation", "stage", "start")
+
+    def __init__(self, instrumentation: "Instrumentation", stage: str):
+        self.instrumentation = instrumentation
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.instrumentation.record(self.stage, time.perf_counter() - self.start)
+        return False
+
+class _NullTimer:
+    """Shared do-nothing context manager returned while instrumentation is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_TIMER = _NullTimer()
+
+class Instrumentation:
+    def __init__(self, config: Dict = None):
+        """Initialize the Instrumentation.
+
+        Args:
+            config: Dictionary of instrumentation options (optional):
+                enabled: Collect timings and counters (default False; every call is then a cheap no-op).
+                window: Recent samples per stage used for percentiles (default 1000).
+                overlay: Show the metrics overlay in MainWindow (default False).
+                dump_path: JSON file the metrics are written to (optional).
+                dump_interval: Seconds between periodic dumps from the GUI (default 10).
+                startup_budget: Seconds allowed until the window is shown; exceeding it logs a warning (default 1.5).
+        """
+        self.configure(config)
+
+    def configure(self, config: Dict = None):
+        """Apply a configuration and clear all collected metrics."""
+        self.config = config or {}  # Use empty dict if no config provided.
+        self.enabled = bool(self.config.get("enabled", False))
+        self.window = self.config.get("window", 1000)
+        self.overlay = self.enabled and self.config.get("overlay", False)
+        self.dump_path = self.config.get("dump_path") or None
+        self.dump_interval = self.config.get("dump_interval", 10.0)
+        self.startup_budget = self.config.get("startup_budget", 1.5)
+        self.lock = threading.Lock()
+        self.stages: Dict[str, _StageSamples] = {}
+        self.counters: Dict[str, int] = {}
+        self.values: Dict[str, Any] = {}  # One-off measurements such as startup time.
+        self.last_sequence = None  # Sequence ID of the last displayed frame.
+        self.started = time.time()
+
+    def timer(self, stage: str):
+        """Return a context manager timing a with-block as the given stage (a shared no-op when disabled)."""
+        return _Timer(self, stage) if self.enabled else _NULL_TIMER
+
+    def record(self, stage: str, seconds: float):
+        """Record one duration of a stage.
+
+        Args:
+            stage: Stage name, e.g. 'facemesh' or 'kpi.yaw'.
+            seconds: Duration in seconds.
+        """
+        if not self.enabled:
+            return
+        samples = self.stages.get(stage)
+        if samples is None:
+            with self.lock:
+                samples = self.stages.setdefault(stage, _StageSamples(self.window))
+        samples.add(seconds)
+
+    def count(self, counter: str, amount: int = 1):
+        """Increase a frame counter, e.g. 'frames_captured'."""
+        if self.enabled:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def set_value(self, name: str, value: Any):
+        """Store a one-off measurement, e.g. 'startup_s' (kept even when disabled)."""
+        self.values[name] = value
+
+    def frame_displayed(self, sequence: int, capture_timestamp: float):
+        """Record a displayed frame: end-to-end latency and frames skipped since the previous one.
+
+        Args:
+            sequence: Capture sequence ID of the displayed frame.
+            capture_timestamp: Wall-clock time the frame was captured.
+        """
+        if not self.enabled:
+            return
+        self.record("end_to_end", time.time() - capture_timestamp)
+        self.count("frames_displayed")
+        if self.last_sequence is not None and sequence > self.last_sequence + 1:
+            self.count("frames_not_displayed", sequence - self.last_sequence - 1)
+        self.last_sequence = sequence
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current metrics as a JSON-serializable dictionary."""
+        with self.lock:
+            stages = dict(self.stages)
+        return {
+            "uptime_s": time.time() - self.started,
+            "stages": {name: samples.summary() for name, samples in sorted(stages.items())},
+            "counters": dict(self.counters),
+            "values": dict(self.values)
+        }
+
+    def overlay_lines(self) -> List[str]:
+        """Return short human-readable lines for the live overlay."""
+        snapshot = self.snapshot()
+        lines = [
+            f"{name}: p50 {stats['p50_ms']:.1f} / p95 {stats['p95_ms']:.1f} / p99 {stats['p99_ms']:.1f} ms"
+            for name, stats in snapshot["stages"].items()
+        ]
+        lines.extend(f"{name}: {value}" for name, value in sorted(snapshot["counters"].items()))
+        return lines
+
+    def dump(self, path: str = None):
+        """Write the current metrics as JSON.
+
+        Args:
+            path: Output file (defaults to the configured dump_path; nothing is written without one).
+        """
+        path = path or self.dump_path
+        if not path:
+            return
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.snapshot(), handle, indent=2)
+
+# Process-wide instance, configured by the entry points from the "instrumentation" config section.
+instrumentation = Instrumentation()
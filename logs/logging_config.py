@@ -0,0 +1,25 @@
+# logs/logging_config.py
+# Configures application logging from the "logging" section of the configuration.
+
+import logging  # Standard logging framework configured here once per process.
+from typing import Dict  # Type hints for configuration dictionaries.
+
+DEFAULT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+def configure_logging(config: Dict = None, default_level: str = "INFO"):
+    """Configure the root logger; called by entry points, never at import time.
+
+    Args:
+        config: Dictionary of logging options (optional):
+            level: Root log level name, e.g. 'DEBUG', 'INFO', 'WARNING' (default default_level).
+            format: Log record format (default timestamp, level and message).
+            loggers: Mapping of logger names to level names for finer control.
+        default_level: Level used when the configuration does not set one.
+    """
+    config = config or {}  # Use empty dict if no config provided.
+    level = str(config.get("level", default_level)).upper()
+    logging.basicConfig(level=getattr(logging, level, logging.INFO),
+                        format=config.get("format", DEFAULT_FORMAT), force=True)
+    for name, logger_level in config.get("loggers", {}).items():
+        logging.getLogger(name).setLevel(str(logger_level).upper())
+    logging.debug("Logging configured at level %s", level)
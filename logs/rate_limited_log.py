@@ -0,0 +1,38 @@
+# logs/rate_limited_log.py
+# Defines the RateLimitedLog class, which turns repeating log messages into periodic summaries.
+
+import logging  # Emits the limited messages through the standard logging framework.
+import time  # Monotonic clock for the suppression interval.
+
+class RateLimitedLog:
+    def __init__(self, message: str, level: int = logging.WARNING, interval: float = 60.0):
+        """Initialize a rate-limited log message.
+
+        Args:
+            message: Message to log (%-style placeholders are filled from log() arguments).
+            level: Logging level of the message (default WARNING).
+            interval: Minimum seconds between emitted messages; repeats in between are counted (default 60).
+        """
+        self.message = message
+        self.level = level
+        self.interval = interval
+        self.suppressed = 0  # Occurrences since the last emitted message.
+        self.last_emitted = None  # Monotonic time of the last emitted message.
+
+    def log(self, *args):
+        """Log the message now if the interval has passed, otherwise count it for the next summary.
+
+        Args:
+            *args: Arguments for the message's %-style placeholders.
+        """
+        now = time.monotonic()
+        if self.last_emitted is not None and now - self.last_emitted < self.interval:
+            self.suppressed += 1
+            return
+        if self.suppressed:
+            logging.log(self.level, self.message + " (repeated %d more times in the last %.0fs)",
+                        *args, self.suppressed, now - self.last_emitted)
+        else:
+            logging.log(self.level, self.message, *args)
+        self.suppressed = 0
+        self.last_emitted = now
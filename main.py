@@ -1,6 +1,8 @@
 # main.py
 # Entry point for the PyQt5 application, initializes the app and starts the main event loop.
 
+import time  # Measures startup time from the very first import.
+STARTED = time.perf_counter()  # Reference point for the startup metrics.
 import sys  # Provides access to system-specific parameters and functions, like command-line arguments.
 from PyQt5 import QtWidgets, QtCore  # Imports PyQt5 modules for creating the GUI and handling core application features.
 from controllers.app_controller import AppController  # Imports the AppController class to manage the application's logic.
@@ -15,7 +17,7 @@ def main():
     # Create the PyQt5 application instance, passing command-line arguments.
     app = QtWidgets.QApplication(sys.argv)
     # Instantiate the AppController to handle the application's logic and UI setup.
-    controller = AppController()
+    controller = AppController(started=STARTED)
     # Retrieve the main window from the controller for display.
     window = controller.get_main_window()
     # Show the main window to the user.
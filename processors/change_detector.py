@@ -0,0 +1,88 @@
+# processors/change_detector.py
+# Defines the ChangeDetector class, which gates inference on frames that barely differ from the last processed one.
+
+from typing import Any, Dict  # Type hints for configuration and statistics dictionaries.
+import cv2  # Provides resizing, grayscale conversion and absolute differences.
+import numpy as np  # Computes the mean difference of the thumbnails.
+
+class ChangeDetector:
+    def __init__(self, config: Dict = None):
+        """Initialize the ChangeDetector.
+
+        Args:
+            config: Dictionary of gating options (optional):
+                enabled: Skip inference on unchanged frames (default False).
+                threshold: Mean absolute grayscale difference (0-255) below which a frame is unchanged (default 2.0).
+                thumbnail_width: Width of the grayscale thumbnails compared (default 64).
+                max_gated_frames: Consecutive frames that may be skipped before one is processed anyway (default 30).
+        """
+        self.config = config or {}  # Use empty dict if no config provided.
+        self.enabled = self.config.get("enabled", False)
+        self.threshold = self.config.get("threshold", 2.0)
+        self.thumbnail_width = self.config.get("thumbnail_width", 64)
+        self.max_gated_frames = self.config.get("max_gated_frames", 30)
+        self.reset()
+
+    def reset(self):
+        """Forget the reference frame and the gating statistics."""
+        self.reference = None  # Thumbnail of the last processed frame.
+        self.consecutive_gated = 0  # Frames skipped since the last processed frame.
+        self.frames_checked = 0
+        self.frames_compared = 0  # Checks that had a reference to compare against.
+        self.frames_gated = 0
+        self.last_difference = 0.0
+        self.max_difference = 0.0
+        self.difference_total = 0.0
+
+    def _thumbnail(self, frame) -> np.ndarray:
+        """Downscale a BGR frame to a small grayscale thumbnail."""
+        height, width = frame.shape[:2]
+        size = (self.thumbnail_width, max(1, round(height * self.thumbnail_width / width)))
+        return cv2.cvtColor(cv2.resize(frame, size, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+
+    def is_unchanged(self, frame) -> bool:
+        """Compare a frame with the last processed frame.
+
+        A changed frame becomes the new reference; an unchanged one does not, so slow drift
+        still accumulates until it crosses the threshold.
+
+        Args:
+            frame: Input frame (numpy array) in BGR format.
+
+        Returns:
+            bool: True if inference can be skipped and the previous results reused.
+        """
+        thumbnail = self._thumbnail(frame)
+        self.frames_checked += 1
+        if self.reference is None or self.reference.shape != thumbnail.shape:
+            self.reference = thumbnail
+            self.consecutive_gated = 0
+            return False
+        difference = float(np.mean(cv2.absdiff(thumbnail, self.reference)))
+        self.frames_compared += 1
+        self.last_difference = difference
+        self.max_difference = max(self.max_difference, difference)
+        self.difference_total += difference
+        if difference < self.threshold and self.consecutive_gated < self.max_gated_frames:
+            self.consecutive_gated += 1
+            self.frames_gated += 1
+            return True
+        self.reference = thumbnail
+        self.consecutive_gated = 0
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        """Return gating statistics for tuning the threshold.
+
+        Returns:
+            Dict[str, Any]: Frames checked and gated, gated ratio, and last/mean/max frame difference.
+        """
+        return {
+            "threshold": self.threshold,
+            "frames_checked": self.frames_checked,
+            "frames_gated": self.frames_gated,
+            "gated_ratio": self.frames_gated / max(1, self.frames_checked),
+            "last_difference": self.last_difference,
+            "mean_difference": self.difference_total / max(1, self.frames_compared),
+            "max_difference": self.max_difference
+        }
@@ -0,0 +1,102 @@
+# processors/face_tracker.py
+# Defines the FaceTracker class, which assigns stable track IDs to detected faces across frames.
+
+import logging  # Facilitates logging for debugging and monitoring track changes.
+from typing import Dict, List, Tuple  # Type hints for tracks and assignments.
+import numpy as np  # Computes landmark bounding boxes and overlaps.
+
+def bounding_box(landmarks) -> np.ndarray:
+    """Return the pixel bounding box of a face's landmarks.
+
+    Args:
+        landmarks: LandmarkFrame of the face.
+
+    Returns:
+        np.ndarray: [x_min, y_min, x_max, y_max].
+    """
+    xy = landmarks.points[:, :2]
+    return np.concatenate((xy.min(axis=0), xy.max(axis=0)))
+
+def iou(box_a: np.ndarray, box_b: np.ndarray) -> float:
+    """Compute the intersection over union of two [x_min, y_min, x_max, y_max] boxes."""
+    width = min(box_a[2], box_b[2]) - max(box_a[0], box_b[0])
+    height = min(box_a[3], box_b[3]) - max(box_a[1], box_b[1])
+    if width <= 0 or height <= 0:
+        return 0.0
+    intersection = width * height
+    area_a = (box_a[2] - box_a[0]) * (box_a[3] - box_a[1])
+    area_b = (box_b[2] - box_b[0]) * (box_b[3] - box_b[1])
+    return float(intersection / (area_a + area_b - intersection + 1e-6))
+
+class FaceTracker:
+    def __init__(self, config: Dict = None):
+        """Initialize the FaceTracker.
+
+        Args:
+            config: Dictionary of tracking options (optional):
+                iou_threshold: Minimum box overlap to continue a track (default 0.3).
+                max_missed_frames: Frames a track survives without a match (default 30).
+        """
+        self.config = config or {}  # Use empty dict if no config provided.
+        self.iou_threshold = self.config.get("iou_threshold", 0.3)
+        self.max_missed_frames = self.config.get("max_missed_frames", 30)
+        self.tracks = {}  # Map track IDs to {'box': last bounding box, 'missed': frames without a match}.
+        self.next_id = 1  # Next track ID to assign.
+        self.driver_id = None  # Track ID currently considered the driver.
+
+    def update(self, faces: List) -> List[Tuple[int, object]]:
+        """Associate this frame's faces with existing tracks by bounding-box overlap.
+
+        Matching is greedy on the highest overlap, which is exact for the few faces in a cabin.
+
+        Args:
+            faces: LandmarkFrame objects detected in the frame.
+
+        Returns:
+            List[Tuple[int, LandmarkFrame]]: (track_id, landmarks) pairs, one per face.
+        """
+        boxes = [bounding_box(face) for face in faces]
+        candidates = sorted(
+            ((iou(track["box"], box), track_id, face_index)
+             for track_id, track in self.tracks.items()
+             for face_index, box in enumerate(boxes)),
+            reverse=True
+        )
+        assigned = {}  # Map face indices to track IDs.
+        matched_tracks = set()
+        for overlap, track_id, face_index in candidates:
+            if overlap < self.iou_threshold:
+                break
+            if track_id in matched_tracks or face_index in assigned:
+                continue
+            assigned[face_index] = track_id
+            matched_tracks.add(track_id)
+
+        # Age unmatched tracks and drop the ones missing for too long.
+        for track_id in list(self.tracks):
+            if track_id in matched_tracks:
+                continue
+            self.tracks[track_id]["missed"] += 1
+            if self.tracks[track_id]["missed"] > self.max_missed_frames:
+                del self.tracks[track_id]
+                logging.debug("Face track %s lost", track_id)
+                if track_id == self.driver_id:
+                    self.driver_id = None
+
+        # Update matched tracks and open new ones for unmatched faces.
+        for face_index, box in enumerate(boxes):
+            track_id = assigned.get(face_index)
+            if track_id is None:
+                track_id = self.next_id
+                self.next_id += 1
+                assigned[face_index] = track_id
+                logging.debug("Face track %s started", track_id)
+            self.tracks[track_id] = {"box": box, "missed": 0}
+
+        # The driver is the largest (closest) face when no driver track is alive.
+        if self.driver_id is None and boxes:
+            largest = max(range(len(boxes)), key=lambda i: (boxes[i][2] - boxes[i][0]) * (boxes[i][3] - boxes[i][1]))
+            self.driver_id = assigned[largest]
+            logging.info("Driver assigned to face track %s", self.driver_id)
+
+        return [(assigned[face_index], face) for face_index, face in enumerate(faces)]
@@ -3,40 +3,223 @@
 
 import cv2  # OpenCV library for image and video processing.
 import logging  # Enables logging for debugging and monitoring frame processing.
+import time  # Supplies wall-clock timestamps for live frames.
 from typing import Dict, Any  # Type hints for flexible dictionary return types.
+from processors.face_tracker import FaceTracker  # Assigns stable track IDs to detected faces.
+from processors.change_detector import ChangeDetector  # Skips inference on frames that barely changed.
+from processors.idle_policy import IdlePolicy  # Backs off inference while the seat is empty.
+from processors.keyframe_scheduler import KeyframeScheduler  # Decides which live frames run FaceMesh.
+from processors.landmark_propagator import LandmarkPropagator  # Moves landmarks between keyframes with optical flow.
+from logs.instrumentation import instrumentation  # Publishes gating statistics when enabled.
 
 class FrameProcessor:
-    def __init__(self, mediapipe_adapter, kpi_manager):
-        """Initialize the FrameProcessor with a MediaPipe adapter and KPI manager.
+    def __init__(self, adapter_pool, kpi_manager, tracking_config: Dict = None, keyframe_config: Dict = None,
+                 gating_config: Dict = None, idle_config: Dict = None):
+        """Initialize the FrameProcessor with a MediaPipe adapter pool and KPI manager.
 
         Args:
-            mediapipe_adapter: Adapter for processing frames with MediaPipe.
-            kpi_manager: Manager for calculating KPIs based on processed frame data.
+            adapter_pool: MediaPipeAdapterPool providing one reusable adapter per mode.
+            kpi_manager: Manager for calculating KPIs based on processed frame data; used for the driver.
+            tracking_config: Dictionary of face tracking options (optional):
+                driver_only: Run KPIs for the driver track only (default True).
+                iou_threshold, max_missed_frames: Passed to the FaceTracker.
+            keyframe_config: Dictionary of keyframe options (optional):
+                enabled: Run FaceMesh on keyframes only and propagate landmarks in between (default False).
+                Remaining keys are passed to the KeyframeScheduler and LandmarkPropagator.
+            gating_config: Dictionary of ChangeDetector options for skipping unchanged live frames (optional).
+            idle_config: Dictionary of IdlePolicy options for backing off live inference without faces (optional).
         """
-        self.mediapipe_adapter = mediapipe_adapter  # Store MediaPipe adapter for landmark detection.
+        self.adapter_pool = adapter_pool  # Store MediaPipe adapters (live/static) for landmark detection.
         self.kpi_manager = kpi_manager  # Store KPI manager for metric calculations.
+        self.tracking_config = tracking_config or {}  # Use empty dict if no config provided.
+        self.driver_only = self.tracking_config.get("driver_only", True)  # Skip passengers' KPIs.
+        self.face_tracker = FaceTracker(self.tracking_config)  # Stable IDs across frames.
+        self.passenger_managers = {}  # Map non-driver track IDs to their own KpiManager (own calculator state).
+        self.keyframe_config = keyframe_config or {}  # Use empty dict if no config provided.
+        self.keyframes_enabled = self.keyframe_config.get("enabled", False)
+        self.keyframe_scheduler = KeyframeScheduler(self.keyframe_config)
+        self.landmark_propagator = LandmarkPropagator(self.keyframe_config)
+        self.last_timestamp = None  # Timestamp of the previous live frame, for the frame period.
+        self.change_detector = ChangeDetector(gating_config)  # Gates inference on static scenes.
+        self.last_faces = None  # Per-face results of the last processed live frame, reused while gated.
+        self.last_results = None  # Driver results of the last processed live frame, reused while gated.
+        self.idle_policy = IdlePolicy(idle_config)  # Lowers the inference rate while no face is present.
+        self.empty_results = None  # KPI results without a driver, computed once per face-to-no-face transition.
+        self.driver_landmarks = None  # Landmarks of the driver in the last processed frame, or None.
+        self.recorder = None  # Optional LandmarkRecorder receiving the driver's landmarks of every live frame.
         # Log the initialized calculators for debugging.
-        logging.debug(f"FrameProcessor initialized with calculators: {[calc.name() for calc in self.kpi_manager.calculators]}")
+        logging.debug("FrameProcessor initialized with calculators: %s", [calc.name() for calc in self.kpi_manager.calculators])
 
-    def process_frame(self, frame) -> Dict[str, Any]:
-        """Process a single video frame and calculate KPIs.
+    def reset(self, kpi_manager=None):
+        """Forget face tracks, per-face state and FaceMesh tracking, e.g. before processing another video.
+
+        Args:
+            kpi_manager: Replacement driver KPI manager with fresh calculator state (optional).
+        """
+        if kpi_manager is not None:
+            self.kpi_manager = kpi_manager
+        self.adapter_pool.reset()  # Live FaceMesh tracking and crop region of the previous video.
+        self.face_tracker = FaceTracker(self.tracking_config)
+        self.passenger_managers = {}
+        self.keyframe_scheduler = KeyframeScheduler(self.keyframe_config)
+        self.landmark_propagator = LandmarkPropagator(self.keyframe_config)
+        self.last_timestamp = None
+        self.change_detector.reset()
+        self.last_faces = None
+        self.last_results = None
+        self.idle_policy.reset()
+        self.empty_results = None
+
+    def process_faces(self, frame, timestamp: float = None, mode: str = "live") -> Dict[int, Dict[str, Any]]:
+        """Process a video frame and calculate KPIs for every tracked face.
+
+        The driver's KPIs use self.kpi_manager; each other track keeps its own calculator state,
+        so stateful KPIs are never mixed between driver and passengers. Cost grows linearly with
+        the number of faces processed.
 
         Args:
             frame: Input frame (numpy array) from a video or camera feed.
+            timestamp: Capture time in seconds (video position for recordings); defaults to now.
+            mode: 'live' for video frames or 'static' for independent still images.
+
+        Returns:
+            Dict[int, Dict[str, Any]]: KPI results keyed by face track ID (only the driver if driver_only).
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        if self._is_gated(frame, mode, self.last_faces):
+            return self.last_faces  # Scene unchanged: reuse the previous results.
+        results = self._process_faces(frame, timestamp, mode)
+        if mode == "live":
+            self.last_faces = results
+        return results
+
+    def _process_faces(self, frame, timestamp: float, mode: str,
+                       passengers: bool = True) -> Dict[int, Dict[str, Any]]:
+        """Detect, track and calculate KPIs for the faces of one frame (see process_faces).
+
+        Passengers' KPIs are skipped when passengers is False, e.g. for callers that only report the driver.
+        """
+        logging.debug("Processing frame: %s", frame.shape)  # Log frame dimensions for debugging.
+        if mode == "live" and not self.idle_policy.should_infer(timestamp):
+            self.driver_landmarks = None
+            return {}  # Seat empty and backing off: no inference this frame.
+        image_size = (frame.shape[1], frame.shape[0])  # Frame width and height.
+        if mode == "live" and self.keyframes_enabled:
+            faces = self._live_faces(frame, timestamp)
+        else:
+            # Process the frame using MediaPipe to extract pixel-space landmark frames.
+            faces = self.adapter_pool.get(mode).process(frame)
+        if mode == "live":
+            self.idle_policy.update(bool(faces), timestamp)
+        tracked = self.face_tracker.update(faces)
+        driver_id = self.face_tracker.driver_id
+        self.driver_landmarks = next((face for track_id, face in tracked if track_id == driver_id), None)
+
+        # Drop calculator state of passenger tracks that are gone.
+        for track_id in list(self.passenger_managers):
+            if track_id not in self.face_tracker.tracks or track_id == driver_id:
+                del self.passenger_managers[track_id]
+
+        results = {}
+        for track_id, landmarks in tracked:
+            if track_id == driver_id:
+                manager = self.kpi_manager
+            elif self.driver_only or not passengers:
+                continue
+            else:
+                manager = self.passenger_managers.get(track_id)
+                if manager is None:
+                    manager = self.passenger_managers[track_id] = self.kpi_manager.clone()
+            results[track_id] = manager.calculate(self._frame_data(frame, landmarks, image_size, timestamp))
+        return results
+
+    def process_frame(self, frame, timestamp: float = None, mode: str = "live") -> Dict[str, Any]:
+        """Process a single video frame and calculate the driver's KPIs.
+
+        Only the driver's calculators run; use process_faces() for passengers' KPIs.
+
+        Args:
+            frame: Input frame (numpy array) from a video or camera feed.
+            timestamp: Capture time in seconds (video position for recordings); defaults to now.
+            mode: 'live' for video frames or 'static' for independent still images.
 
         Returns:
             Dict[str, Any]: Dictionary containing KPI calculation results.
         """
-        logging.debug(f"Processing frame: {frame.shape}")  # Log frame dimensions for debugging.
-        results = {}  # Initialize empty results dictionary (to be populated by kpi_manager if needed).
-        # Process the frame using MediaPipe to extract facial landmarks.
-        processed_landmarks = self.mediapipe_adapter.process(frame)
-        # Prepare data dictionary for KPI calculations.
-        data = {
-            # Extract first face's landmarks if available, otherwise None.
-            "landmarks": processed_landmarks.multi_face_landmarks[0] if processed_landmarks and processed_landmarks.multi_face_landmarks else None,
-            "image_size": (frame.shape[1], frame.shape[0]),  # Store frame width and height.
-            "frame": frame  # Pass the original frame for potential use in calculations.
+        timestamp = time.time() if timestamp is None else timestamp
+        if self._is_gated(frame, mode, self.last_results):
+            results = self.last_results  # Scene unchanged: reuse the previous results.
+        else:
+            faces = self._process_faces(frame, timestamp, mode, passengers=False)
+            driver_id = self.face_tracker.driver_id
+            if driver_id in faces:
+                results = faces[driver_id]
+                self.empty_results = None
+            else:
+                results = self._empty_results(frame, timestamp)
+            if mode == "live":
+                self.last_results = results
+        if mode == "live" and self.recorder is not None:
+            self.recorder.write(timestamp, (frame.shape[1], frame.shape[0]), self.driver_landmarks)
+        return results
+
+    def _empty_results(self, frame, timestamp: float) -> Dict[str, Any]:
+        """Return the KPI results for a frame without a driver.
+
+        The calculators run once when the driver disappears, letting them reset their tracking
+        state; later frames without a driver reuse that result without calling them.
+        """
+        if self.empty_results is None:
+            image_size = (frame.shape[1], frame.shape[0])
+            self.empty_results = self.kpi_manager.calculate(self._frame_data(frame, None, image_size, timestamp))
+        return dict(self.empty_results)
+
+    def _is_gated(self, frame, mode: str, cached) -> bool:
+        """Return whether a live frame can reuse cached results because it barely differs from the last processed one."""
+        if mode != "live" or cached is None or not self.change_detector.enabled:
+            return False
+        gated = self.change_detector.is_unchanged(frame)
+        if instrumentation.enabled:
+            # Overlay counter plus the detector's statistics in the metrics dump, for tuning the threshold per vehicle.
+            instrumentation.count("frames_gated", int(gated))
+            instrumentation.set_value("gating", self.change_detector.stats())
+        return gated
+
+    def _live_faces(self, frame, timestamp: float):
+        """Detect faces on keyframes and propagate the previous landmarks on the frames in between.
+
+        Args:
+            frame: Input frame (numpy array) from a video or camera feed.
+            timestamp: Capture time in seconds.
+
+        Returns:
+            List[LandmarkFrame]: Detected or propagated faces.
+        """
+        frame_period = 0.0 if self.last_timestamp is None else max(0.0, timestamp - self.last_timestamp)
+        self.last_timestamp = timestamp
+        scheduler = self.keyframe_scheduler
+        if not scheduler.is_keyframe():
+            faces = self.landmark_propagator.propagate(frame)
+            if faces is not None:
+                scheduler.on_propagated(self.landmark_propagator.last_motion)
+                return faces
+            scheduler.on_lost()  # Flow lost the face: detect on this very frame.
+
+        start = time.perf_counter()
+        faces = self.adapter_pool.get("live").process(frame)
+        scheduler.on_keyframe(time.perf_counter() - start, frame_period)
+        if faces:
+            self.landmark_propagator.reset(frame, faces)
+        else:
+            scheduler.on_lost()
+        return faces
+
+    @staticmethod
+    def _frame_data(frame, landmarks, image_size, timestamp) -> Dict[str, Any]:
+        """Prepare the data dictionary for KPI calculations."""
+        return {
+            "landmarks": landmarks,  # One face's landmarks, or None.
+            "image_size": image_size,  # Store frame width and height.
+            "frame": frame,  # Pass the original frame for potential use in calculations.
+            "timestamp": timestamp  # Time base for stateful KPIs.
         }
-        # Calculate KPIs using the prepared data and return results.
-        return self.kpi_manager.calculate(data)
\ No newline at end of file
@@ -0,0 +1,70 @@
+# processors/idle_policy.py
+# Defines the IdlePolicy class, which backs off live inference exponentially while no face is present.
+
+import logging  # Facilitates logging for debugging and monitoring idle state changes.
+from typing import Dict  # Type hints for configuration dictionaries.
+
+class IdlePolicy:
+    def __init__(self, config: Dict = None):
+        """Initialize the IdlePolicy.
+
+        Args:
+            config: Dictionary of idle options (optional):
+                enabled: Reduce the inference rate while the seat is empty (default False).
+                grace_seconds: Time without faces before backing off, covering brief misses (default 2.0).
+                initial_interval: First pause between inferences once idle, in seconds (default 0.1).
+                max_interval: Longest pause between inferences, in seconds (default 2.0).
+        """
+        self.config = config or {}  # Use empty dict if no config provided.
+        self.enabled = self.config.get("enabled", False)
+        self.grace_seconds = self.config.get("grace_seconds", 2.0)
+        self.initial_interval = self.config.get("initial_interval", 0.1)
+        self.max_interval = self.config.get("max_interval", 2.0)
+        self.reset()
+
+    def reset(self):
+        """Return to full-rate inference."""
+        self.empty_since = None  # Timestamp of the first inference without faces, or None while faces are present.
+        self.interval = 0.0  # Current pause between inferences (0 = every frame).
+        self.next_inference = 0.0  # Earliest timestamp of the next inference.
+        self.frames_skipped = 0  # Frames answered without inference while idle.
+
+    @property
+    def idle(self) -> bool:
+        """Whether inference is currently backed off."""
+        return self.interval > 0
+
+    def should_infer(self, timestamp: float) -> bool:
+        """Return whether the frame at timestamp should run inference.
+
+        Args:
+            timestamp: Capture time of the frame in seconds.
+        """
+        if not self.enabled or timestamp >= self.next_inference:
+            return True
+        self.frames_skipped += 1
+        return False
+
+    def update(self, faces_found: bool, timestamp: float):
+        """Record the outcome of an inference and schedule the next one.
+
+        Args:
+            faces_found: Whether any face was detected.
+            timestamp: Capture time of the frame in seconds.
+        """
+        if faces_found:
+            if self.idle:
+                logging.info("Face detected; inference back to full rate")
+            self.empty_since = None
+            self.interval = 0.0
+            self.next_inference = timestamp
+            return
+        if self.empty_since is None:
+            self.empty_since = timestamp
+        if timestamp - self.empty_since < self.grace_seconds:
+            return
+        if not self.idle:
+            logging.info("No face present; backing off inference")
+        # Double the pause after every empty inference, up to the maximum.
+        self.interval = min(self.max_interval, max(self.initial_interval, self.interval * 2))
+        self.next_inference = timestamp + self.interval
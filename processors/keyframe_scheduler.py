@@ -0,0 +1,73 @@
+# processors/keyframe_scheduler.py
+# Defines the KeyframeScheduler class, which decides when FaceMesh runs and adapts the keyframe interval.
+
+import logging  # Facilitates logging for debugging and monitoring interval changes.
+from typing import Dict  # Type hints for configuration dictionaries.
+
+class KeyframeScheduler:
+    def __init__(self, config: Dict = None):
+        """Initialize the KeyframeScheduler.
+
+        Args:
+            config: Dictionary of keyframe options (optional):
+                min_interval: Smallest number of frames between keyframes (default 1).
+                max_interval: Largest number of frames between keyframes (default 6).
+                motion_threshold: Landmark motion in pixels per frame that forces a keyframe (default 4.0).
+                cpu_budget: Fraction of the frame period FaceMesh may use on average (default 0.5).
+        """
+        self.config = config or {}  # Use empty dict if no config provided.
+        self.min_interval = max(1, self.config.get("min_interval", 1))
+        self.max_interval = max(self.min_interval, self.config.get("max_interval", 6))
+        self.motion_threshold = self.config.get("motion_threshold", 4.0)
+        self.cpu_budget = self.config.get("cpu_budget", 0.5)
+        self.interval = self.min_interval  # Current frames between keyframes.
+        self.frames_since_keyframe = 0  # Frames propagated since the last keyframe.
+        self.force = True  # Whether the next frame must be a keyframe.
+        self.fast_motion = False  # Whether motion exceeded the threshold since the last keyframe.
+        self.keyframes = 0  # Total keyframes (FaceMesh runs).
+        self.propagated = 0  # Total frames served by propagation.
+
+    def is_keyframe(self) -> bool:
+        """Return whether FaceMesh should run on the next frame."""
+        return self.force or self.frames_since_keyframe + 1 >= self.interval
+
+    def on_keyframe(self, inference_seconds: float, frame_period: float):
+        """Record a keyframe and adapt the interval to head motion and CPU headroom.
+
+        Args:
+            inference_seconds: Time FaceMesh took on this keyframe.
+            frame_period: Seconds between consecutive frames (0 if unknown).
+        """
+        self.keyframes += 1
+        self.frames_since_keyframe = 0
+        self.force = False
+        if self.fast_motion:
+            # Fast motion since the last keyframe: sample more densely.
+            self.interval = max(self.min_interval, self.interval // 2)
+        else:
+            self.interval = min(self.max_interval, self.interval + 1)  # Slow driver: stretch the interval.
+        self.fast_motion = False
+        if frame_period > 0:
+            # Spread inference over enough frames to stay within the CPU budget.
+            needed = int(inference_seconds / (self.cpu_budget * frame_period)) + 1
+            if needed > self.interval:
+                self.interval = min(self.max_interval, needed)
+                logging.debug("Keyframe interval raised to %s for CPU headroom", self.interval)
+
+    def on_propagated(self, motion: float):
+        """Record a propagated frame and request a keyframe if the head moves fast.
+
+        Args:
+            motion: Largest mean landmark displacement among faces, in pixels since the previous frame.
+        """
+        self.propagated += 1
+        self.frames_since_keyframe += 1
+        if motion > self.motion_threshold:
+            self.force = True
+            self.fast_motion = True
+
+    def on_lost(self):
+        """Request a keyframe after propagation failed or no face was found."""
+        self.force = True
+        self.fast_motion = False
+        self.interval = self.min_interval
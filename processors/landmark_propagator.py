@@ -0,0 +1,105 @@
+# processors/landmark_propagator.py
+# Defines the LandmarkPropagator class, which moves keyframe landmarks to in-between frames with sparse optical flow.
+
+import logging  # Facilitates logging for debugging and monitoring propagation.
+from typing import List, Optional  # Type hints for face lists.
+import cv2  # Provides pyramidal Lucas-Kanade optical flow and similarity fitting.
+import numpy as np  # Applies the fitted transform to whole landmark arrays.
+from adapters.landmark_frame import LandmarkFrame  # Compact per-face landmark representation.
+
+# Landmarks tracked with optical flow: eye corners and lids, brows, nose, mouth corners and lips, jaw line.
+TRACKED_INDICES = np.array([
+    33, 133, 159, 145, 263, 362, 386, 374,  # Eye corners and lids (lids follow their own flow, keeping blinks).
+    70, 105, 300, 334,                       # Brows
+    1, 4, 6, 168,                            # Nose bridge and tip
+    61, 291, 13, 14,                         # Mouth corners and lips
+    152, 234, 454, 10                        # Chin, cheeks, forehead
+])
+
+class LandmarkPropagator:
+    def __init__(self, config: dict = None):
+        """Initialize the LandmarkPropagator.
+
+        Args:
+            config: Dictionary of propagation options (optional):
+                flow_size: Longest side of the grayscale images used for optical flow (default 640).
+                min_tracked_points: Minimum valid flow points per face before propagation fails (default 8).
+        """
+        self.config = config or {}  # Use empty dict if no config provided.
+        self.flow_size = self.config.get("flow_size", 640)
+        self.min_tracked_points = self.config.get("min_tracked_points", 8)
+        self.prev_gray = None  # Downscaled grayscale image of the previous frame.
+        self.scale = 1.0  # Factor from full-frame pixels to flow-image pixels.
+        self.faces = []  # Landmarks of the previous frame, in full-frame pixels.
+        self.last_motion = 0.0  # Mean landmark displacement of the last propagation, in full-frame pixels.
+
+    def _gray(self, frame) -> np.ndarray:
+        """Downscale and convert a BGR frame to the grayscale image used for optical flow."""
+        height, width = frame.shape[:2]
+        self.scale = min(1.0, self.flow_size / max(width, height))
+        if self.scale < 1.0:
+            frame = cv2.resize(frame, (round(width * self.scale), round(height * self.scale)),
+                               interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+    def reset(self, frame, faces: List[LandmarkFrame]):
+        """Anchor propagation on a keyframe's detected landmarks.
+
+        Args:
+            frame: Keyframe (numpy array) in BGR format.
+            faces: Landmarks detected on the keyframe.
+        """
+        self.prev_gray = self._gray(frame)
+        self.faces = faces
+
+    def propagate(self, frame) -> Optional[List[LandmarkFrame]]:
+        """Estimate landmarks on a non-keyframe from the previous frame's landmarks.
+
+        Each face moves by the similarity transform fitted to its tracked points' flow; the tracked
+        points themselves (including eyelids) keep their individual flow.
+
+        Args:
+            frame: Current frame (numpy array) in BGR format.
+
+        Returns:
+            Optional[List[LandmarkFrame]]: Propagated faces, or None if propagation failed and a keyframe is needed.
+        """
+        if self.prev_gray is None or not self.faces:
+            return None
+        gray = self._gray(frame)
+        if gray.shape != self.prev_gray.shape:
+            return None  # Resolution changed; only a detection can recover.
+        prev_points = np.concatenate([face.points[TRACKED_INDICES, :2] for face in self.faces]) * self.scale
+        next_points, status, _ = cv2.calcOpticalFlowPyrLK(
+            self.prev_gray, gray, prev_points.astype(np.float32), None, winSize=(15, 15), maxLevel=2
+        )
+        status = status.ravel().astype(bool)
+
+        propagated = []
+        motions = []
+        count = len(TRACKED_INDICES)
+        for i, face in enumerate(self.faces):
+            valid = status[i * count:(i + 1) * count]
+            if valid.sum() < self.min_tracked_points:
+                logging.debug("Landmark propagation lost track; keyframe required")
+                return None
+            src = prev_points[i * count:(i + 1) * count][valid]
+            dst = next_points[i * count:(i + 1) * count][valid]
+            transform, _ = cv2.estimateAffinePartial2D(src, dst)
+            if transform is None:
+                return None
+            # Apply the similarity transform (in full-frame pixels) to every landmark of the face.
+            transform[:, 2] /= self.scale
+            points = face.points.copy()
+            points[:, :2] = points[:, :2] @ transform[:, :2].T + transform[:, 2]
+            points[:, 2] *= np.sqrt(abs(np.linalg.det(transform[:, :2])))  # Depth follows the scale change.
+            # Tracked points keep their own flow so non-rigid motion such as blinks survives.
+            tracked = TRACKED_INDICES[valid]
+            points[tracked, :2] = dst / self.scale
+            motions.append(float(np.mean(np.linalg.norm(dst - src, axis=1))) / self.scale)
+            propagated.append(LandmarkFrame(points, face.image_size, face.face_index))
+
+        self.prev_gray = gray
+        self.faces = propagated
+        self.last_motion = max(motions)
+        return propagated
@@ -0,0 +1,187 @@
+# processors/landmark_recording.py
+# Defines the LandmarkRecorder and LandmarkSession classes: a compact, memory-mappable record of per-frame driver landmarks.
+
+import json  # Session metadata.
+import os  # Session directory and file handling.
+import time  # Creation time stored in the metadata.
+from typing import Dict, Iterator, Optional, Tuple  # Type hints for replayed frames and batch columns.
+import numpy as np  # Quantization, raw record writing and memory mapping.
+from adapters.landmark_frame import LandmarkFrame  # Landmarks handed back to the KPI calculators.
+
+FORMAT_VERSION = 1
+METADATA_FILE = "session.json"
+FRAMES_FILE = "frames.bin"
+LANDMARKS_FILE = "landmarks.bin"
+NUM_LANDMARKS = 478  # Refined FaceMesh topology.
+NUM_LANDMARKS_UNREFINED = 468  # FaceMesh without the iris landmarks (refine_landmarks disabled).
+
+# One fixed-size record per frame; landmark offsets are quantized to uint16 between origin and origin + extent.
+FRAME_DTYPE = np.dtype([
+    ("frame_index", "<i8"),
+    ("timestamp", "<f8"),
+    ("width", "<i4"),
+    ("height", "<i4"),
+    ("has_face", "u1"),
+    ("origin", "<f4", 3),
+    ("extent", "<f4", 3),
+])
+QUANTIZATION_LEVELS = 65535
+
+def landmark_count(mediapipe_config: Dict = None) -> int:
+    """Return the landmarks per face FaceMesh produces with a mediapipe configuration section."""
+    config = mediapipe_config or {}  # Use empty dict if no config provided.
+    return NUM_LANDMARKS if config.get("refine_landmarks", True) else NUM_LANDMARKS_UNREFINED
+
+class LandmarkRecorder:
+    def __init__(self, path: str, source: str = "", num_landmarks: int = NUM_LANDMARKS):
+        """Create a session directory and start recording.
+
+        Each frame stores its index, timestamp, image size and the driver's landmarks as uint16
+        offsets from the face's bounding box (about 0.01 px resolution for a 500 px face),
+        2 bytes per coordinate.
+
+        Args:
+            path: Session directory to create (existing recordings in it are overwritten).
+            source: Description of the recorded source, e.g. a video path or camera index.
+            num_landmarks: Landmarks per face (see landmark_count()); every frame must match it.
+        """
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.num_landmarks = num_landmarks
+        self.frames_written = 0
+        with open(os.path.join(path, METADATA_FILE), "w", encoding="utf-8") as handle:
+            json.dump({"version": FORMAT_VERSION, "num_landmarks": num_landmarks, "source": source,
+                       "created": time.strftime("%Y-%m-%dT%H:%M:%S")}, handle, indent=2)
+        self.frames_file = open(os.path.join(path, FRAMES_FILE), "wb")
+        self.landmarks_file = open(os.path.join(path, LANDMARKS_FILE), "wb")
+        self.record = np.zeros(1, dtype=FRAME_DTYPE)  # Reused per frame.
+        self.empty = np.zeros((num_landmarks, 3), dtype=np.uint16)  # Written for frames without a face.
+
+    def write(self, timestamp: float, image_size: Tuple[int, int], landmarks: Optional[LandmarkFrame],
+              frame_index: Optional[int] = None):
+        """Append one frame.
+
+        Args:
+            timestamp: Capture time in seconds.
+            image_size: Tuple of (width, height) of the frame.
+            landmarks: Driver landmarks, or None if no driver was visible.
+            frame_index: Frame number in the source (defaults to the number of frames written).
+
+        Raises:
+            ValueError: If the landmarks do not have the session's (num_landmarks, 3) shape, which would
+                shift every later record.
+        """
+        record = self.record[0]
+        record["frame_index"] = self.frames_written if frame_index is None else frame_index
+        record["timestamp"] = timestamp
+        record["width"], record["height"] = image_size
+        if landmarks is None:
+            record["has_face"] = 0
+            record["origin"] = 0.0
+            record["extent"] = 0.0
+            quantized = self.empty
+        else:
+            points = landmarks.points
+            if points.shape != (self.num_landmarks, 3):
+                raise ValueError(f"Landmarks of shape {points.shape} do not match the session's "
+                                 f"({self.num_landmarks}, 3); check mediapipe.refine_landmarks")
+            origin = points.min(axis=0)
+            extent = np.maximum(points.max(axis=0) - origin, 1e-6)
+            record["has_face"] = 1
+            record["origin"] = origin
+            record["extent"] = extent
+            quantized = np.rint((points - origin) * (QUANTIZATION_LEVELS / extent)).astype(np.uint16)
+        self.frames_file.write(self.record.tobytes())
+        self.landmarks_file.write(quantized.tobytes())
+        self.frames_written += 1
+
+    def close(self):
+        """Flush and close the session files."""
+        if not self.frames_file.closed:
+            self.frames_file.close()
+            self.landmarks_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+class LandmarkSession:
+    def __init__(self, path: str):
+        """Open a recorded session for memory-mapped random access.
+
+        Args:
+            path: Session directory written by LandmarkRecorder.
+
+        Raises:
+            ValueError: If the directory does not hold a supported session.
+        """
+        with open(os.path.join(path, METADATA_FILE), encoding="utf-8") as handle:
+            self.metadata = json.load(handle)
+        if self.metadata.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported landmark session version in {path}: {self.metadata.get('version')}")
+        self.path = path
+        self.num_landmarks = self.metadata["num_landmarks"]
+        frame_bytes = self.num_landmarks * 3 * 2
+        # A recording cut short may end in a partial record; only complete frames are exposed.
+        count = min(os.path.getsize(os.path.join(path, FRAMES_FILE)) // FRAME_DTYPE.itemsize,
+                    os.path.getsize(os.path.join(path, LANDMARKS_FILE)) // frame_bytes)
+        self.frames = self._memmap(FRAMES_FILE, FRAME_DTYPE, (count,))
+        self.landmarks = self._memmap(LANDMARKS_FILE, np.uint16, (count, self.num_landmarks, 3))
+
+    def _memmap(self, name: str, dtype, shape) -> np.ndarray:
+        if shape[0] == 0:
+            return np.zeros(shape, dtype=dtype)  # np.memmap cannot map empty files.
+        return np.memmap(os.path.join(self.path, name), dtype=dtype, mode="r", shape=shape)
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def find(self, frame_index: int) -> Optional[int]:
+        """Return the position of a source frame number in the session, or None if it was not recorded."""
+        indices = self.frames["frame_index"]
+        position = int(np.searchsorted(indices, frame_index))  # Frame numbers are recorded in increasing order.
+        return position if position < len(self) and indices[position] == frame_index else None
+
+    def landmarks_at(self, position: int) -> Optional[LandmarkFrame]:
+        """Return the driver landmarks of the frame at a position in the session, or None without a face."""
+        record = self.frames[position]
+        if not record["has_face"]:
+            return None
+        points = self.landmarks[position].astype(np.float32)
+        points *= record["extent"] / QUANTIZATION_LEVELS
+        points += record["origin"]
+        return LandmarkFrame(points, (int(record["width"]), int(record["height"])))
+
+    def arrays(self, start: int = 0, stop: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Decode a range of frames into the columns used by KpiManager.calculate_batch.
+
+        Args:
+            start: First position in the session.
+            stop: Position to stop before (None for the end of the session).
+
+        Returns:
+            Dict[str, np.ndarray]: points (frames, N, 3) float32, present, image_sizes (frames, 2),
+            timestamps and frame_indices.
+        """
+        frames = self.frames[start:stop]
+        # Same float32 operations as landmarks_at(), for all frames at once.
+        points = self.landmarks[start:stop].astype(np.float32)
+        points *= (frames["extent"] / QUANTIZATION_LEVELS)[:, None, :]
+        points += frames["origin"][:, None, :]
+        return {
+            "points": points,
+            "present": frames["has_face"].astype(bool),
+            "image_sizes": np.stack((frames["width"], frames["height"]), axis=1),
+            "timestamps": frames["timestamp"].astype(np.float64),
+            "frame_indices": frames["frame_index"].astype(np.int64)
+        }
+
+    def __iter__(self) -> Iterator[Tuple[int, float, Tuple[int, int], Optional[LandmarkFrame]]]:
+        """Yield (frame_index, timestamp, image_size, landmarks) for every frame in order."""
+        for position in range(len(self)):
+            record = self.frames[position]
+            yield (int(record["frame_index"]), float(record["timestamp"]),
+                   (int(record["width"]), int(record["height"])), self.landmarks_at(position))
@@ -0,0 +1,64 @@
+# processors/result_writer.py
+# Defines the ResultWriter class, which streams per-frame KPI rows to a CSV or JSON Lines file.
+
+import csv  # Writes comma-separated KPI tables.
+import json  # Writes one JSON object per line for the .jsonl format.
+import logging  # Facilitates logging for debugging and monitoring output.
+from typing import Any, Dict, List  # Type hints for KPI rows and column names.
+
+def to_builtin(value: Any) -> Any:
+    """Convert NumPy scalars (e.g., np.float32) to plain Python values for serialization.
+
+    Args:
+        value: KPI value.
+
+    Returns:
+        Any: JSON/CSV friendly value.
+    """
+    return value.item() if hasattr(value, "item") else value
+
+class ResultWriter:
+    def __init__(self, path: str, kpi_names: List[str], key_columns: List[str] = None):
+        """Open the output file and write the header (CSV only).
+
+        The format follows the file extension: '.jsonl' writes JSON Lines, anything else CSV.
+
+        Args:
+            path: Output file path.
+            kpi_names: Names of the KPI columns, in output order.
+            key_columns: Identifying columns preceding the KPIs (default: source, frame_index, timestamp).
+        """
+        self.path = path  # Output file path.
+        self.columns = (key_columns or ["source", "frame_index", "timestamp"]) + list(kpi_names)  # Column order.
+        self.jsonl = path.endswith(".jsonl")  # Output format selected by extension.
+        self.rows_written = 0  # Number of rows streamed so far.
+        self.file = open(path, "w", newline="")
+        if not self.jsonl:
+            self.csv_writer = csv.writer(self.file)
+            self.csv_writer.writerow(self.columns)  # Header row.
+        logging.info("Writing KPI rows to %s", path)
+
+    def write(self, row: Dict[str, Any]):
+        """Append one row; missing columns are left empty (CSV) or null (JSON Lines).
+
+        Args:
+            row: Mapping of column names to values.
+        """
+        values = [to_builtin(row.get(column)) for column in self.columns]
+        if self.jsonl:
+            self.file.write(json.dumps(dict(zip(self.columns, values))) + "\n")
+        else:
+            self.csv_writer.writerow(["" if value is None else value for value in values])
+        self.rows_written += 1
+
+    def close(self):
+        """Flush and close the output file."""
+        if not self.file.closed:
+            self.file.close()
+            logging.info("Wrote %d KPI rows to %s", self.rows_written, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
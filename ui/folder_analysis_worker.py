@@ -0,0 +1,52 @@
+# ui/folder_analysis_worker.py
+# Defines the FolderAnalysisWorker class, a QThread that runs bulk still-image analysis without blocking the GUI.
+
+from PyQt5 import QtCore  # Provides QThread and cross-thread signals.
+import threading  # Provides the cancellation event shared with the batch controller.
+import logging  # Facilitates logging for debugging and monitoring bulk analysis.
+
+class FolderAnalysisWorker(QtCore.QThread):
+    # Emitted with (images done, total images, images per second).
+    progress = QtCore.pyqtSignal(int, int, float)
+    # Emitted with the number of images analyzed when the run ends.
+    completed = QtCore.pyqtSignal(int)
+
+    def __init__(self, config_path, sources, output_path, batch_config=None, parent=None):
+        """Initialize the FolderAnalysisWorker.
+
+        Args:
+            config_path: Path to the JSON configuration file used to build the worker pipeline.
+            sources: Image folders or glob patterns.
+            output_path: CSV or JSON Lines output file.
+            batch_config: Dictionary with 'workers' and 'decode_threads' (optional).
+            parent: Parent QObject (optional).
+        """
+        super().__init__(parent)  # Initialize base QThread class.
+        self.config_path = config_path
+        self.sources = sources
+        self.output_path = output_path
+        self.batch_config = batch_config or {}
+        self.stop_event = threading.Event()  # Set by cancel() to stop after the current image.
+
+    def run(self):
+        """Analyze the images and stream KPI rows to the output file."""
+        # Imported here so the GUI only loads the batch machinery when bulk analysis is used.
+        from controllers.batch_controller import BatchController
+        done = 0
+        try:
+            controller = BatchController(self.config_path)
+            done = controller.run_images(
+                self.sources, self.output_path,
+                workers=self.batch_config.get("workers", 1),
+                decode_threads=self.batch_config.get("decode_threads", 4),
+                progress=self.progress.emit,
+                stop_event=self.stop_event
+            )
+        except Exception as e:
+            logging.error("Folder analysis failed: %s", e)
+        self.completed.emit(done)
+
+    def cancel(self):
+        """Stop the analysis and wait for the thread to finish."""
+        self.stop_event.set()
+        self.wait()
@@ -0,0 +1,115 @@
+# ui/inference_worker.py
+# Defines the InferenceWorker class, a QThread that runs frame processing off the GUI thread.
+
+from PyQt5 import QtCore  # Provides QThread and cross-thread signals.
+import threading  # Guards the latest-result slot shared with the GUI thread.
+import time  # Measures the warm-up duration.
+import logging  # Facilitates logging for debugging and monitoring inference.
+from logs.instrumentation import instrumentation  # Times frame processing and counts coalesced results.
+
+class InferenceWorker(QtCore.QThread):
+    # Emitted (queued to the GUI thread) when a new result is available and none is pending.
+    result_ready = QtCore.pyqtSignal()
+    # Emitted once the camera is open and FaceMesh is built and warmed up.
+    warmed_up = QtCore.pyqtSignal()
+    # Emitted when the camera cannot be opened; the worker then stops.
+    camera_failed = QtCore.pyqtSignal()
+    # Emitted with the error message when FaceMesh cannot be built or warmed up; the camera is released.
+    warmup_failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, frame_processor, capture, parent=None):
+        """Initialize the InferenceWorker.
+
+        Args:
+            frame_processor: Object to process video frames and compute KPIs.
+            capture: CaptureWorker supplying the freshest camera frames.
+            parent: Parent QObject (optional).
+        """
+        super().__init__(parent)  # Initialize base QThread class.
+        self.frame_processor = frame_processor  # Processor run on this thread only.
+        self.capture = capture  # Source of captured frames.
+        self.lock = threading.Lock()  # Protects latest and pending.
+        self.latest = None  # Most recent (frame, results, capture_timestamp, sequence_id) not yet taken by the GUI.
+        self.pending = False  # Whether a result_ready signal is queued but not yet handled.
+        self.running = False  # Whether the inference loop should keep going.
+        self.frames_processed = 0  # Total frames run through the frame processor.
+        self.results_coalesced = 0  # Results replaced before the GUI displayed them.
+        self.is_warm = False  # Whether the live FaceMesh graph has been built and run once.
+
+    def start(self, *args):
+        """Arm the inference loop on the calling (GUI) thread, then start the thread.
+
+        Setting the flag here rather than in run() means a stop() issued before the thread is
+        scheduled cannot be overwritten, which would leave stop()'s wait() hanging.
+        """
+        self.running = True
+        super().start(*args)
+
+    def run(self):
+        """Process captured frames until stopped, coalescing results for the GUI."""
+        logging.info("Inference worker started.")
+        if not self.prepare():
+            return
+        while self.running:
+            captured = self.capture.read(timeout=0.1)  # Wait briefly so stop() is honoured promptly.
+            if captured is None:
+                if not self.capture.is_running():
+                    logging.warning("Camera is not open; inference worker stopping.")
+                    break
+                continue
+            frame, timestamp, sequence = captured
+            with instrumentation.timer("frame_processing"):
+                results = self.frame_processor.process_frame(frame, timestamp)  # Heavy inference, off the GUI thread.
+            self.frames_processed += 1
+            instrumentation.count("frames_processed")
+            with self.lock:
+                if self.latest is not None:
+                    self.results_coalesced += 1  # GUI is behind; keep only the newest result.
+                    instrumentation.count("results_coalesced")
+                self.latest = (frame, results, timestamp, sequence)
+                notify = not self.pending
+                self.pending = True
+            if notify:
+                self.result_ready.emit()  # At most one queued signal at a time.
+        logging.info("Inference worker stopped.")
+
+    def prepare(self) -> bool:
+        """Open the camera and warm up FaceMesh on this thread, keeping both off the GUI's startup path.
+
+        Returns:
+            bool: False if the camera could not be opened or FaceMesh could not be started.
+        """
+        start = time.perf_counter()
+        if not self.capture.is_running() and not self.capture.start():
+            self.camera_failed.emit()
+            return False
+        if not self.is_warm:
+            try:
+                self.frame_processor.adapter_pool.warm_up("live")  # Imports mediapipe and builds the graph.
+            except Exception as exc:  # Any failure would otherwise end the thread silently.
+                logging.exception("Could not start FaceMesh")
+                self.capture.stop()  # Release the camera; nothing will read it.
+                self.warmup_failed.emit(str(exc))
+                return False
+            self.is_warm = True
+            instrumentation.set_value("warmup_s", round(time.perf_counter() - start, 3))
+            logging.info("Camera opened and FaceMesh warmed up in %.2fs", time.perf_counter() - start)
+        self.warmed_up.emit()
+        return True
+
+    def take_latest(self):
+        """Take the newest result and re-arm the result_ready signal (GUI thread).
+
+        Returns:
+            Optional[Tuple]: (frame, results, capture_timestamp, sequence_id), or None if nothing new is available.
+        """
+        with self.lock:
+            latest, self.latest = self.latest, None
+            self.pending = False
+        return latest
+
+    def stop(self):
+        """Stop the inference loop and wait for the thread to finish."""
+        self.running = False
+        self.wait()
+        self.take_latest()  # Drop any result produced for the previous session.
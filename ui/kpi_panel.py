@@ -20,7 +20,7 @@ class KpiPanel(QtWidgets.QWidget):
         self.tr = tr_func  # Store translation function for dynamic text updates.
         self.group = group  # Store group name for categorization.
         self.setup_ui()  # Set up the UI (implemented by subclasses).
-        logging.debug(f"KpiPanel initialized for group '{group}' with KPIs: {kpis}")
+        logging.debug("KpiPanel initialized for group '%s' with KPIs: %s", group, kpis)
 
     def setup_ui(self):
         """Set up the panel's UI layout and widgets.
@@ -30,11 +30,15 @@ class KpiPanel(QtWidgets.QWidget):
         """
         raise NotImplementedError("Subclasses must implement setup_ui()")
 
-    def update_values(self, results: Dict[str, Any]):
+    def update_values(self, results: Dict[str, Any], refresh_text: bool = True):
         """Update KPI values displayed in the panel.
 
+        Implementations only touch widgets whose displayed value changed.
+
         Args:
             results: Dictionary mapping KPI names to their values.
+            refresh_text: Whether frequently changing values are redrawn on this call; callers
+                use it to cap text refreshes at a readable rate.
 
         Raises:
             NotImplementedError: Must be implemented by subclasses.
@@ -80,23 +84,32 @@ class TableKpiPanel(KpiPanel):
             value_item.setForeground(QtGui.QColor("white"))
             value_item.setFlags(QtCore.Qt.ItemIsEnabled)
             self.table.setItem(i, 1, value_item)
-            logging.debug(f"Setup KPI {kpi} as '{self.tr(label)}'")
+            logging.debug("Setup KPI %s as '%s'", kpi, self.tr(label))
+        self.shown_values = ["N/A"] * len(self.kpis)  # Text currently displayed per row.
         # Add table to a vertical layout.
         layout = QtWidgets.QVBoxLayout(self)
         layout.addWidget(self.table)
         layout.setContentsMargins(0, 0, 0, 0)  # Remove margins for tight fit.
         self.table.setStyleSheet(Styles.TABLE_PANEL)  # Apply custom table styling.
 
-    def update_values(self, results: Dict[str, Any]):
+    def update_values(self, results: Dict[str, Any], refresh_text: bool = True):
         """Update KPI values in the table based on results.
 
         Args:
             results: Dictionary mapping KPI names to their values.
+            refresh_text: Whether to redraw the values on this call (numeric values change every frame).
         """
+        if not refresh_text:
+            return
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)  # Checked once per update, not per KPI.
         for i, kpi in enumerate(self.kpis):
             value = results.get(kpi, "N/A")  # Get value or default to 'N/A'.
             if isinstance(value, (int, float)):
                 value = f"{value:.2f}"  # Format numeric values to two decimal places.
+            value = str(value)
+            if value == self.shown_values[i]:
+                continue  # Unchanged: leave the cell alone.
+            self.shown_values[i] = value
             item = self.table.item(i, 1)  # Get value cell.
             if item is None:
                 # Create new item if none exists (defensive programming).
@@ -104,8 +117,9 @@ class TableKpiPanel(KpiPanel):
                 item.setForeground(QtGui.QColor("white"))
                 item.setFlags(QtCore.Qt.ItemIsEnabled)
                 self.table.setItem(i, 1, item)
-            item.setText(str(value))  # Update cell with new value.
-            logging.debug(f"Updated {self.group} KPI {kpi}: {value}")
+            item.setText(value)  # Update cell with new value.
+            if debug:
+                logging.debug("Updated %s KPI %s: %s", self.group, kpi, value)
 
     def retranslate_ui(self):
         """Update table text with translated strings."""
@@ -116,9 +130,9 @@ class TableKpiPanel(KpiPanel):
             item = self.table.item(i, 0)  # Get KPI name cell.
             if item:
                 item.setText(translated_label)  # Update with translated text.
-                logging.debug(f"Retranslated {kpi} to '{translated_label}'")
+                logging.debug("Retranslated %s to '%s'", kpi, translated_label)
             else:
-                logging.warning(f"Item at row {i} not found during retranslation for {kpi}")
+                logging.warning("Item at row %s not found during retranslation for %s", i, kpi)
 
 class StateKpiPanel(KpiPanel):
     def __init__(self, kpis: List[str], tr_func, group: str):
@@ -139,6 +153,7 @@ class StateKpiPanel(KpiPanel):
         table_layout.setColumnStretch(0, 1)  # Stretch name column to fill space.
         table_layout.setColumnMinimumWidth(1, 120)  # Set fixed width for value column.
         self.state_labels = {}  # Store value labels for each KPI.
+        self.states = {}  # Map each KPI to its displayed state.
         for i, kpi in enumerate(self.kpis):
             # Convert KPI name to human-readable and translated format.
             translated_name = self.tr(kpi.replace("_", " ").title())
@@ -149,34 +164,42 @@ class StateKpiPanel(KpiPanel):
             # Create label for KPI state, initialized as 'None'.
             state_label = QtWidgets.QLabel(self.tr("None"))
             state_label.setFixedWidth(120)  # Fix width for consistency.
-            state_label.setStyleSheet(Styles.STATE_VALUE_DEFAULT)  # Apply default state styling.
+            state_label.setStyleSheet(Styles.STATE_VALUE)  # Default, pending and detected styling, switched by property.
             table_layout.addWidget(state_label, i, 1, alignment=QtCore.Qt.AlignRight)
             self.state_labels[kpi] = state_label  # Store state label for updates.
-            logging.debug(f"Setup state KPI {kpi} as '{translated_name}'")
+            self.states[kpi] = "None"  # Untranslated state currently displayed.
+            logging.debug("Setup state KPI %s as '%s'", kpi, translated_name)
         self.table.setStyleSheet(Styles.STATE_PANEL)  # Apply panel styling.
         layout.addWidget(self.table)  # Add grid widget to layout.
         layout.addStretch()  # Add stretch to push content upward.
         # layout.setContentsMargins(0, 0, 0, 0)  # Uncomment if margins need removal.
 
-    def update_values(self, results: Dict[str, Any]):
+    def update_values(self, results: Dict[str, Any], refresh_text: bool = True):
         """Update state KPI values and styles based on results.
 
+        States change rarely and signal alerts, so they are shown immediately regardless of
+        refresh_text; labels whose state is unchanged are not touched.
+
         Args:
             results: Dictionary mapping KPI names to their state values.
+            refresh_text: Ignored (see above).
         """
         for kpi in self.kpis:
             value = results.get(kpi, "N/A")  # Get state or default to 'N/A'.
             state = "None" if value == "N/A" else str(value)  # Convert to string state.
+            if state == self.states[kpi]:
+                continue  # Unchanged: leave the label alone.
+            self.states[kpi] = state
             label = self.state_labels[kpi]  # Get state label.
             label.setText(self.tr(state))  # Update with translated state.
-            # Apply styling based on state value.
+            # Switch styling based on state value.
             if state == "Pending":
-                label.setStyleSheet(Styles.STATE_VALUE_PENDING)
+                Styles.set_state(label, "state", "pending")
             elif state.startswith("Detected"):
-                label.setStyleSheet(Styles.STATE_VALUE_DETECTED)
+                Styles.set_state(label, "state", "detected")
             else:
-                label.setStyleSheet(Styles.STATE_VALUE_DEFAULT)
-            logging.debug(f"Updated {self.group} KPI {kpi}: {state}")
+                Styles.set_state(label, "state", "default")
+            logging.debug("Updated %s KPI %s: %s", self.group, kpi, state)
 
     def retranslate_ui(self):
         """Update state panel text with translated strings."""
@@ -185,7 +208,6 @@ class StateKpiPanel(KpiPanel):
             name_label = self.table.layout().itemAtPosition(i, 0).widget()  # Get name label.
             name_label.setText(translated_name)  # Update name.
             state_label = self.state_labels[kpi]  # Get state label.
-            current_state = state_label.text()  # Get current state text.
-            translated_state = self.tr(current_state)  # Translate state.
+            translated_state = self.tr(self.states[kpi])  # Translate the current state.
             state_label.setText(translated_state)  # Update state.
-            logging.debug(f"Retranslated state KPI {kpi} to '{translated_name}', state to '{translated_state}'")
\ No newline at end of file
+            logging.debug("Retranslated state KPI %s to '%s', state to '%s'", kpi, translated_name, translated_state)
\ No newline at end of file
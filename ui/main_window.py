@@ -1,40 +1,88 @@
 # ui/main_window.py
 # Defines the MainWindow class, the primary PyQt5 window for the Car Face Tracker application.
 
-import cv2  # OpenCV library for video and image processing.
-import numpy as np  # Provides array operations for image handling.
-from PyQt5 import QtWidgets, QtGui, QtCore  # PyQt5 modules for GUI creation.
+from PyQt5 import QtWidgets, QtCore  # PyQt5 modules for GUI creation.
 import logging  # Facilitates logging for debugging and monitoring.
 from ui.title_bar import TitleBar  # Custom title bar with language selector.
 from ui.video_panel import VideoPanel  # Panel for video display and controls.
 from ui.kpi_panel import TableKpiPanel, StateKpiPanel  # Panels for displaying KPIs.
 from ui.translations import translations  # Dictionary of translations for internationalization.
 from ui.styles import Styles  # Custom styles for consistent UI appearance.
-
-# Configure logging with timestamp, level, and message format.
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+from ui.inference_worker import InferenceWorker  # Runs frame processing off the GUI thread.
+from ui.folder_analysis_worker import FolderAnalysisWorker  # Runs bulk still-image analysis off the GUI thread.
+from logs.instrumentation import instrumentation  # Stage timings for the optional overlay and metrics dump.
+import time  # Measures display intervals for the display-rate cap.
 
 class MainWindow(QtWidgets.QMainWindow):
-    def __init__(self, frame_processor, enabled_kpis):
+    def __init__(self, frame_processor, enabled_kpis, camera_config=None, ui_config=None,
+                 config_path="config/config.json", batch_config=None, started=None):
         """Initialize the MainWindow with video feed, KPI panels, and controls.
 
+        The window can be shown before the processing pipeline exists: pass frame_processor=None
+        and hand it over later with attach_frame_processor.
+
         Args:
-            frame_processor: Object to process video frames and compute KPIs.
+            frame_processor: Object to process video frames and compute KPIs, or None until it is attached.
             enabled_kpis: Dictionary mapping KPI groups to their enabled KPI names.
+            camera_config: Dictionary of capture settings for live mode (optional).
+            ui_config: Dictionary of display settings, e.g. display_fps and kpi_text_fps (optional).
+            config_path: Configuration file used to build the bulk image analysis pipeline.
+            batch_config: Dictionary of bulk analysis settings (workers, decode_threads) (optional).
+            started: time.perf_counter() value when the application started, for startup metrics (optional).
         """
         super().__init__()  # Initialize base QMainWindow class.
         self.current_language = "en"  # Default language for translations.
-        self.frame_processor = frame_processor  # Store frame processor for KPI computation.
+        self.frame_processor = None  # Frame processor for KPI computation, set by attach_frame_processor.
         self.enabled_kpis = enabled_kpis  # Store enabled KPIs by group.
         self.static_image = None  # Store loaded static image (if any).
         self.mode = "live"  # Current mode: 'live' or 'static'.
-        self.cap = None  # Video capture object for live feed.
+        self.camera_config = camera_config  # Capture settings, used once the pipeline is attached.
+        self.capture = None  # Background camera capture for live feed.
+        self.inference_worker = None  # Runs inference off the GUI thread.
+        self.ui_config = ui_config or {}  # Display settings.
+        self.config_path = config_path  # Configuration for bulk image analysis workers.
+        self.batch_config = batch_config or {}  # Bulk image analysis settings.
+        self.folder_worker = None  # Running bulk image analysis, if any.
+        self.display_interval = 1.0 / self.ui_config.get("display_fps", 30)  # Minimum seconds between repaints.
+        self.last_display_time = 0.0  # When the last live result was displayed.
+        self.kpi_text_interval = 1.0 / self.ui_config.get("kpi_text_fps", 5)  # Minimum seconds between KPI text redraws.
+        self.last_kpi_text_time = 0.0  # When KPI values were last redrawn in live mode.
         self.translations = translations  # Store translation dictionary.
+        self.started = time.perf_counter() if started is None else started  # Reference for startup metrics.
+        self.first_frame_shown = False  # Whether the time to the first live frame was recorded.
         self.setup_ui()  # Set up the UI components.
         
-        # Set up timer for live video updates.
-        self.timer = QtCore.QTimer()
-        self.timer.timeout.connect(self.update_live_video)
+        # Single-shot timer that defers a result arriving faster than the display rate.
+        self.display_timer = QtCore.QTimer(self)
+        self.display_timer.setSingleShot(True)
+        self.display_timer.timeout.connect(self.update_live_video)
+        # Refresh the metrics overlay and dump once per second when instrumentation is enabled.
+        self.last_metrics_dump = time.perf_counter()
+        self.metrics_timer = QtCore.QTimer(self)
+        self.metrics_timer.timeout.connect(self.update_metrics)
+        if instrumentation.enabled:
+            self.metrics_timer.start(1000)
+        self.video_panel.video_label.setText(self.tr("Warming up..."))  # Until the pipeline is attached.
+        if frame_processor is not None:
+            self.attach_frame_processor(frame_processor)
+        QtCore.QTimer.singleShot(0, self.record_startup)  # Runs once the event loop has shown the window.
+
+    def attach_frame_processor(self, frame_processor):
+        """Connect the processing pipeline and start the live feed.
+
+        Args:
+            frame_processor: Object to process video frames and compute KPIs.
+        """
+        from adapters.capture_worker import CaptureWorker  # Loads OpenCV, so only once the window is up.
+        self.frame_processor = frame_processor
+        self.capture = CaptureWorker(self.camera_config)  # Background camera capture for live feed.
+        # Run inference on a worker thread; results arrive through a queued, coalesced signal.
+        self.inference_worker = InferenceWorker(self.frame_processor, self.capture, self)
+        self.inference_worker.result_ready.connect(self.update_live_video)
+        self.inference_worker.warmed_up.connect(self.on_warmed_up)
+        self.inference_worker.camera_failed.connect(self.on_camera_failed)
+        self.inference_worker.warmup_failed.connect(self.on_warmup_failed)
+        self.update_mode_ui()
         if self.mode == "live":
             self.initialize_camera()  # Start camera if in live mode.
 
@@ -47,23 +95,57 @@ class MainWindow(QtWidgets.QMainWindow):
         Returns:
             str: Translated text or original text if translation is unavailable.
         """
-        translated = self.translations.get(self.current_language, {}).get(text, text)
-        logging.debug(f"Translating '{text}' to '{translated}' for language '{self.current_language}'")
-        return translated
+        return self.translations.get(self.current_language, {}).get(text, text)
     
     def initialize_camera(self):
-        """Initialize or reinitialize the camera for live video feed."""
-        if self.cap is not None and self.cap.isOpened():
-            self.cap.release()  # Release existing camera if open.
-        self.cap = cv2.VideoCapture(0)  # Open default camera (index 0).
-        if not self.cap.isOpened():
-            logging.error("Could not open camera.")
-            QtWidgets.QMessageBox.critical(self, self.tr("Error"), self.tr("Could not access camera."))
-            self.mode = "static"  # Switch to static mode on failure.
-            self.update_mode_ui()
+        """Initialize or reinitialize the camera for live video feed.
+
+        The inference worker opens the camera and warms up FaceMesh in the background; the video
+        label shows a warming-up state until it is ready.
+        """
+        self.video_panel.video_label.setText(self.tr("Warming up..."))
+        self.inference_worker.start()  # Opens the camera, then processes frames as fast as inference allows.
+
+    def on_warmed_up(self):
+        """Leave the warming-up state once the camera is open and FaceMesh is ready."""
+        if self.mode == "live":
+            self.video_panel.video_label.setText(self.tr("Video Feed"))
+        logging.info("Camera initialized successfully.")
+
+    def on_camera_failed(self):
+        """Report a camera that could not be opened and fall back to static mode."""
+        self.leave_live_mode(self.tr("Could not access camera."))
+
+    def on_warmup_failed(self, error):
+        """Report a FaceMesh that could not be started and fall back to static mode.
+
+        Args:
+            error: Message of the exception raised while building or warming up FaceMesh.
+        """
+        self.leave_live_mode(f"{self.tr('Could not start face tracking.')}\n{error}")
+
+    def leave_live_mode(self, message):
+        """Leave the warming-up state, show an error and switch to static mode.
+
+        Args:
+            message: Translated error message.
+        """
+        if self.mode != "live":
+            return
+        self.video_panel.video_label.setText(self.tr("Video Feed"))
+        QtWidgets.QMessageBox.critical(self, self.tr("Error"), message)
+        self.mode = "static"  # Switch to static mode on failure.
+        self.video_panel.toggle_mode_btn.setText(self.tr("Switch to Live Mode"))
+        self.update_mode_ui()
+
+    def record_startup(self):
+        """Report the time from application start until the window was shown, against the startup budget."""
+        elapsed = time.perf_counter() - self.started
+        instrumentation.set_value("startup_s", round(elapsed, 3))
+        if elapsed > instrumentation.startup_budget:
+            logging.warning("Window shown after %.2fs, over the %.2fs startup budget", elapsed, instrumentation.startup_budget)
         else:
-            self.timer.start(30)  # Start timer for 30ms intervals (~33 FPS).
-            logging.info("Camera initialized successfully.")
+            logging.info("Window shown after %.2fs", elapsed)
     
     def setup_ui(self):
         """Set up the main window's UI layout and components."""
@@ -96,9 +178,17 @@ class MainWindow(QtWidgets.QMainWindow):
             self.kpi_panels["state"] = state_panel
         
         # Add video panel for live/static display and controls.
-        self.video_panel = VideoPanel(self, lambda x: self.tr(x), self.toggle_mode, self.load_static_image, self.analyze_static_image)
+        self.video_panel = VideoPanel(self, lambda x: self.tr(x), self.toggle_mode, self.load_static_image,
+                                       self.analyze_static_image, self.analyze_image_folder)
         content_layout.addWidget(self.video_panel, 3)  # Stretch factor 3 for larger video area.
         
+        # Optional stage-timing overlay drawn over the top-left corner of the video.
+        self.metrics_overlay = None
+        if instrumentation.overlay:
+            self.metrics_overlay = QtWidgets.QLabel(self.video_panel.video_label)
+            self.metrics_overlay.setStyleSheet(Styles.METRICS_OVERLAY)
+            self.metrics_overlay.move(4, 4)
+        
         # Create right-side widget for numeric KPI panels.
         right_widget = QtWidgets.QWidget()
         right_layout = QtWidgets.QVBoxLayout(right_widget)
@@ -120,13 +210,14 @@ class MainWindow(QtWidgets.QMainWindow):
     
     def toggle_mode(self):
         """Toggle between live and static modes."""
+        if self.frame_processor is None:
+            return  # The pipeline is still being built.
         if self.mode == "live":
             self.mode = "static"
             self.video_panel.toggle_mode_btn.setText(self.tr("Switch to Live Mode"))
-            self.timer.stop()  # Stop live video updates.
-            if hasattr(self, 'cap') and self.cap.isOpened():
-                self.cap.release()  # Release camera.
-                self.cap = None
+            self.inference_worker.stop()  # Stop live inference (and a camera start in progress).
+            self.capture.stop()  # Stop grabbing and release camera.
+            self.display_timer.stop()
             logging.info("Switched to static mode.")
         else:
             self.mode = "live"
@@ -139,28 +230,59 @@ class MainWindow(QtWidgets.QMainWindow):
     
     def update_mode_ui(self):
         """Update UI elements based on the current mode."""
+        attached = self.frame_processor is not None
+        self.video_panel.toggle_mode_btn.setEnabled(attached)
         self.video_panel.load_image_btn.setEnabled(self.mode == "static")
-        self.video_panel.analyze_btn.setEnabled(self.mode == "static")
+        self.video_panel.analyze_btn.setEnabled(self.mode == "static" and attached)
+        self.video_panel.analyze_folder_btn.setEnabled(self.mode == "static" and self.folder_worker is None)
     
     def update_live_video(self):
-        """Update the live video feed and KPI values."""
-        if not hasattr(self, 'cap') or not self.cap.isOpened():
-            logging.warning("Camera is not open.")
-            self.initialize_camera()  # Attempt to reinitialize.
+        """Display the latest inference result (GUI thread, capped at the display rate)."""
+        if self.mode != "live":
+            return  # Late signal from a stopped session.
+        remaining = self.display_interval - (time.perf_counter() - self.last_display_time)
+        if remaining > 0:
+            # Too soon: leave the result pending (further ones coalesce) and display it later.
+            if not self.display_timer.isActive():
+                self.display_timer.start(int(remaining * 1000) + 1)
             return
-        ret, frame = self.cap.read()  # Read frame from camera.
-        if ret:
-            results = self.frame_processor.process_frame(frame)  # Process frame for KPIs.
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)  # Convert to RGB for Qt.
-            h, w, ch = rgb_frame.shape
-            bytes_per_line = ch * w
-            qt_image = QtGui.QImage(rgb_frame.data, w, h, bytes_per_line, QtGui.QImage.Format_RGB888)
-            self.video_panel.video_label.setPixmap(QtGui.QPixmap.fromImage(qt_image))  # Display frame.
-            for panel in self.kpi_panels.values():
-                panel.update_values(results)  # Update KPI panels.
-            self.video_panel.update_video_style(results)  # Update video style based on results.
-        else:
-            logging.error("Failed to read frame from camera.")
+        latest = self.inference_worker.take_latest()  # Newest result; older ones were coalesced.
+        if latest is None:
+            return
+        self.last_display_time = time.perf_counter()
+        if not self.first_frame_shown:
+            self.first_frame_shown = True
+            instrumentation.set_value("first_frame_s", round(self.last_display_time - self.started, 3))
+        frame, results, timestamp, sequence = latest
+        with instrumentation.timer("ui_update"):
+            self.display_results(frame, results)
+        instrumentation.frame_displayed(sequence, timestamp)
+
+    def display_results(self, frame, results):
+        """Show a live frame and its KPI results.
+
+        Args:
+            frame: Frame (numpy array) in BGR format.
+            results: KPI results for the frame.
+        """
+        self.video_panel.show_frame(frame)  # Display frame.
+        # Numeric values change every frame: redraw them at a readable rate; states update immediately.
+        now = time.perf_counter()
+        refresh_text = now - self.last_kpi_text_time >= self.kpi_text_interval
+        if refresh_text:
+            self.last_kpi_text_time = now
+        for panel in self.kpi_panels.values():
+            panel.update_values(results, refresh_text)  # Update KPI panels.
+        self.video_panel.update_video_style(results)  # Update video style based on results.
+    
+    def update_metrics(self):
+        """Refresh the metrics overlay and periodically write the metrics dump."""
+        if self.metrics_overlay is not None:
+            self.metrics_overlay.setText("\n".join(instrumentation.overlay_lines()))
+            self.metrics_overlay.adjustSize()
+        if instrumentation.dump_path and time.perf_counter() - self.last_metrics_dump >= instrumentation.dump_interval:
+            self.last_metrics_dump = time.perf_counter()
+            instrumentation.dump()
     
     def load_static_image(self):
         """Load a static image from file for analysis."""
@@ -168,17 +290,14 @@ class MainWindow(QtWidgets.QMainWindow):
         filename, _ = QtWidgets.QFileDialog.getOpenFileName(self, self.tr("Load Static Image"), "",
                                                             self.tr("Image Files (*.png *.jpg *.jpeg)"), options=options)
         if filename:
+            import cv2  # Loaded with the processing pipeline, not on the startup path.
             self.static_image = cv2.imread(filename)  # Load image with OpenCV.
             if self.static_image is None:
-                logging.error(f"Could not load image from {filename}")
+                logging.error("Could not load image from %s", filename)
                 QtWidgets.QMessageBox.warning(self, self.tr("Error"), self.tr("Could not load image."))
             else:
-                logging.info(f"Image loaded from {filename}")
-                rgb_image = cv2.cvtColor(self.static_image, cv2.COLOR_BGR2RGB)
-                h, w, ch = rgb_image.shape
-                bytes_per_line = ch * w
-                qt_image = QtGui.QImage(rgb_image.data, w, h, bytes_per_line, QtGui.QImage.Format_RGB888)
-                self.video_panel.video_label.setPixmap(QtGui.QPixmap.fromImage(qt_image))  # Display image.
+                logging.info("Image loaded from %s", filename)
+                self.video_panel.show_frame(self.static_image)  # Display image.
                 for panel in self.kpi_panels.values():
                     panel.update_values({})  # Clear KPI values until analyzed.
     
@@ -188,30 +307,63 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.warning(self, self.tr("No Image"), self.tr("Please load a static image first."))
             return
         logging.info("Analyzing static image...")
-        from adapters.mediapipe_adapter import MediaPipeAdapter
-        # Reconfigure frame processor for static mode.
-        self.frame_processor.mediapipe_adapter = MediaPipeAdapter(mode="static", config={
-            "max_num_faces": 1,
-            "refine_landmarks": True,
-            "min_detection_confidence": 0.5,
-            "min_tracking_confidence": 0.5
-        })
-        results = self.frame_processor.process_frame(self.static_image)  # Process image.
-        rgb_image = cv2.cvtColor(self.static_image, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_image.shape
-        bytes_per_line = ch * w
-        qt_image = QtGui.QImage(rgb_image.data, w, h, bytes_per_line, QtGui.QImage.Format_RGB888)
-        self.video_panel.video_label.setPixmap(QtGui.QPixmap.fromImage(qt_image))  # Redisplay image.
+        from processors.frame_processor import FrameProcessor  # Already loaded by the attached pipeline.
+        # Reuse the pooled static-mode FaceMesh, but give the image its own tracker and fresh calculator
+        # state so it leaves the live session's KPI history, blink and distraction state untouched.
+        live = self.frame_processor
+        image_processor = FrameProcessor(live.adapter_pool, live.kpi_manager.clone(), live.tracking_config)
+        results = image_processor.process_frame(self.static_image, mode="static")  # Process image.
+        self.video_panel.show_frame(self.static_image)  # Redisplay image.
         for panel in self.kpi_panels.values():
             panel.update_values(results)  # Update KPI panels.
         self.video_panel.update_video_style(results)  # Update video style.
     
+    def analyze_image_folder(self):
+        """Analyze every image of a chosen folder in the background and save KPI rows to a file."""
+        from controllers.batch_controller import find_images  # Loaded only when bulk analysis is used.
+        folder = QtWidgets.QFileDialog.getExistingDirectory(self, self.tr("Select Image Folder"))
+        if not folder:
+            return
+        if not find_images(folder):
+            QtWidgets.QMessageBox.warning(self, self.tr("No Image"), self.tr("No images found."))
+            return
+        output_path, _ = QtWidgets.QFileDialog.getSaveFileName(self, self.tr("Save KPI Results"), "kpis.csv",
+                                                               self.tr("CSV Files (*.csv)"))
+        if not output_path:
+            return
+        logging.info("Analyzing image folder %s into %s", folder, output_path)
+        self.folder_worker = FolderAnalysisWorker(self.config_path, [folder], output_path, self.batch_config, self)
+        self.folder_worker.progress.connect(self.show_folder_progress)
+        self.folder_worker.completed.connect(self.finish_folder_analysis)
+        self.folder_worker.start()
+        self.update_mode_ui()  # Disable the button while the analysis runs.
+    
+    def show_folder_progress(self, done, total, rate):
+        """Report bulk analysis progress and throughput.
+
+        Args:
+            done: Images analyzed so far.
+            total: Total images to analyze.
+            rate: Images analyzed per second.
+        """
+        self.video_panel.status_label.setText(f"{self.tr('Analyzing images')}: {done}/{total} ({rate:.1f}/s)")
+    
+    def finish_folder_analysis(self, done):
+        """Re-enable bulk analysis once the worker has finished.
+
+        Args:
+            done: Number of images analyzed.
+        """
+        self.video_panel.status_label.setText(f"{self.tr('Folder analysis finished')}: {done}")
+        self.folder_worker = None
+        self.update_mode_ui()
+    
     def apply_fade_in_animation(self):
         """Apply a fade-in animation to the window on startup."""
         effect = QtWidgets.QGraphicsOpacityEffect(self)
         self.setGraphicsEffect(effect)
         self.animation = QtCore.QPropertyAnimation(effect, b"opacity")
-        self.animation.setDuration(1000)  # 1-second duration.
+        self.animation.setDuration(250)  # Short, so the window is usable right away.
         self.animation.setStartValue(0)  # Start fully transparent.
         self.animation.setEndValue(1)  # End fully opaque.
         self.animation.start()
@@ -224,9 +376,9 @@ class MainWindow(QtWidgets.QMainWindow):
         """
         languages = ["en", "fr", "de", "ro"]
         self.current_language = languages[index]
-        logging.debug(f"Language changing to {self.current_language}")
+        logging.debug("Language changing to %s", self.current_language)
         self.retranslate_ui()  # Update all UI text.
-        logging.info(f"Language changed to {self.current_language}")
+        logging.info("Language changed to %s", self.current_language)
     
     def retranslate_ui(self):
         """Update all UI text with translated strings."""
@@ -243,9 +395,20 @@ class MainWindow(QtWidgets.QMainWindow):
         Args:
             event: QCloseEvent object.
         """
-        if hasattr(self, 'timer'):
-            self.timer.stop()  # Stop video update timer.
-        if hasattr(self, 'cap') and self.cap is not None and self.cap.isOpened():
-            self.cap.release()  # Release camera.
+        if self.inference_worker is not None:
+            self.inference_worker.stop()  # Wait for the inference thread to finish.
+            self.capture.stop()  # Stop capture thread and release camera.
+            self.display_timer.stop()
             logging.info("Camera released on application close.")
+        if self.folder_worker is not None:
+            self.folder_worker.cancel()  # Stop bulk analysis and its worker processes.
+        if self.frame_processor is not None:
+            if self.frame_processor.recorder is not None:
+                self.frame_processor.recorder.close()  # Inference has stopped: finish the landmark session.
+            if self.frame_processor.change_detector.enabled:
+                logging.info("Gating statistics: %s", self.frame_processor.change_detector.stats())
+        self.metrics_timer.stop()
+        instrumentation.dump()  # Final metrics, if a dump path is configured.
+        if self.frame_processor is not None:
+            self.frame_processor.adapter_pool.close()  # Free the FaceMesh graphs deterministically.
         event.accept()  # Accept the close event.
\ No newline at end of file
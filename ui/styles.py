@@ -101,6 +101,13 @@ class Styles:
         text-align: right;
     """
     
+    # State value label switched by its "state" dynamic property ("pending" or "detected"), parsed once.
+    STATE_VALUE = f"""
+        QLabel {{ {STATE_VALUE_DEFAULT} }}
+        QLabel[state="pending"] {{ {STATE_VALUE_PENDING} }}
+        QLabel[state="detected"] {{ {STATE_VALUE_DETECTED} }}
+    """
+    
     # Video Panel
     VIDEO_PANEL = """
         background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #2E2E2E, stop:1 #1A1A1A);
@@ -123,6 +130,47 @@ class Styles:
         color: #ECF0F1;
     """
     
+    # Video label switched by its "alert" dynamic property, parsed once.
+    VIDEO_LABEL = f"""
+        QLabel {{ {VIDEO_LABEL_DEFAULT} }}
+        QLabel[alert="true"] {{ {VIDEO_LABEL_ALERT} }}
+    """
+    
+    STATUS_LABEL = """
+        font: 12px "Arial";
+        color: #BDC3C7;
+        background: transparent;
+    """
+    
+    # Metrics overlay drawn over the video feed
+    METRICS_OVERLAY = """
+        font: 10px "Courier New";
+        color: #2ECC71;
+        background: rgba(0, 0, 0, 160);
+        padding: 4px;
+    """
+    
+    @staticmethod
+    def set_state(widget, name, value):
+        """Switch a widget between the variants of its stylesheet by setting a dynamic property.
+
+        Only re-polishes the widget when the value changes, which is far cheaper than setStyleSheet.
+
+        Args:
+            widget: Widget whose stylesheet has selectors on the property.
+            name: Dynamic property name, e.g. 'state'.
+            value: New property value (string).
+
+        Returns:
+            bool: Whether the value changed.
+        """
+        if widget.property(name) == value:
+            return False
+        widget.setProperty(name, value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+        return True
+
     # Button (corrected with f-string)
     @staticmethod
     def BUTTON(color="#3498DB", hover_color="#2980B9"):
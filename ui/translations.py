@@ -4,6 +4,7 @@ translations = {
         "KPI": "KPI",
         "Value": "Value",
         "Video Feed": "Video Feed",
+        "Warming up...": "Warming up...",
         "Switch to Static Mode": "Switch to Static Mode",
         "Switch to Live Mode": "Switch to Live Mode",
         "Load Static Image": "Load Static Image",
@@ -19,6 +20,8 @@ translations = {
         "Yawn": "Yawn",
         "Mouth Openness": "Mouth Openness",
         "Blink Rate": "Blink Rate",
+        "Perclos": "PERCLOS",
+        "Blinks Per Minute": "Blinks Per Minute",
         "Head Drop": "Head Drop",
         "Adult": "Adult",
         "Belt": "Belt",
@@ -32,13 +35,22 @@ translations = {
         "Image Files (*.png *.jpg *.jpeg)": "Image Files (*.png *.jpg *.jpeg)",
         "Error": "Error",
         "Could not access camera.": "Could not access camera.",
-        "Could not load image.": "Could not load image."
+        "Could not start face tracking.": "Could not start face tracking.",
+        "Could not load image.": "Could not load image.",
+        "Analyze Folder": "Analyze Folder",
+        "Select Image Folder": "Select Image Folder",
+        "Save KPI Results": "Save KPI Results",
+        "CSV Files (*.csv)": "CSV Files (*.csv)",
+        "Analyzing images": "Analyzing images",
+        "Folder analysis finished": "Folder analysis finished",
+        "No images found.": "No images found."
     },
     "fr": {
         "Car Face Tracker": "Suivi de Visage en Voiture",
         "KPI": "Indicateur",
         "Value": "Valeur",
         "Video Feed": "Flux Vidéo",
+        "Warming up...": "Préchauffage...",
         "Switch to Static Mode": "Passer en Mode Statique",
         "Switch to Live Mode": "Passer en Mode Live",
         "Load Static Image": "Charger une Image Statique",
@@ -54,6 +66,8 @@ translations = {
         "Yawn": "Bâillement",
         "Mouth Openness": "Ouverture de la Bouche",
         "Blink Rate": "Taux de Clignement",
+        "Perclos": "PERCLOS",
+        "Blinks Per Minute": "Clignements par Minute",
         "Head Drop": "Baisse de Tête",
         "Adult": "Adulte",
         "Belt": "Ceinture",
@@ -67,13 +81,22 @@ translations = {
         "Image Files (*.png *.jpg *.jpeg)": "Fichiers Image (*.png *.jpg *.jpeg)",
         "Error": "Erreur",
         "Could not access camera.": "Impossible d'accéder à la caméra.",
-        "Could not load image.": "Impossible de charger l'image."
+        "Could not start face tracking.": "Impossible de démarrer le suivi du visage.",
+        "Could not load image.": "Impossible de charger l'image.",
+        "Analyze Folder": "Analyser un Dossier",
+        "Select Image Folder": "Sélectionner un Dossier d'Images",
+        "Save KPI Results": "Enregistrer les Résultats",
+        "CSV Files (*.csv)": "Fichiers CSV (*.csv)",
+        "Analyzing images": "Analyse des images",
+        "Folder analysis finished": "Analyse du dossier terminée",
+        "No images found.": "Aucune image trouvée."
     },
     "de": {
         "Car Face Tracker": "Autogesichtserkennung",
         "KPI": "KPI",
         "Value": "Wert",
         "Video Feed": "Videostream",
+        "Warming up...": "Wird vorbereitet...",
         "Switch to Static Mode": "Zum Statischen Modus Wechseln",
         "Switch to Live Mode": "Zum Live-Modus Wechseln",
         "Load Static Image": "Statisches Bild Laden",
@@ -89,6 +112,8 @@ translations = {
         "Yawn": "Gähnen",
         "Mouth Openness": "Mundöffnung",
         "Blink Rate": "Blinkrate",
+        "Perclos": "PERCLOS",
+        "Blinks Per Minute": "Lidschläge pro Minute",
         "Head Drop": "Kopfsenkung",
         "Adult": "Erwachsener",
         "Belt": "Gurt",
@@ -102,13 +127,22 @@ translations = {
         "Image Files (*.png *.jpg *.jpeg)": "Bilddateien (*.png *.jpg *.jpeg)",
         "Error": "Fehler",
         "Could not access camera.": "Kamera konnte nicht aufgerufen werden.",
-        "Could not load image.": "Bild konnte nicht geladen werden."
+        "Could not start face tracking.": "Gesichtsverfolgung konnte nicht gestartet werden.",
+        "Could not load image.": "Bild konnte nicht geladen werden.",
+        "Analyze Folder": "Ordner Analysieren",
+        "Select Image Folder": "Bildordner Auswählen",
+        "Save KPI Results": "KPI-Ergebnisse Speichern",
+        "CSV Files (*.csv)": "CSV-Dateien (*.csv)",
+        "Analyzing images": "Bilder werden analysiert",
+        "Folder analysis finished": "Ordneranalyse abgeschlossen",
+        "No images found.": "Keine Bilder gefunden."
     },
     "ro": {
         "Car Face Tracker": "Urmărire Facială Auto",
         "KPI": "KPI",
         "Value": "Valoare",
         "Video Feed": "Flux Video",
+        "Warming up...": "Se pregătește...",
         "Switch to Static Mode": "Trece la Modul Static",
         "Switch to Live Mode": "Trece la Modul Live",
         "Load Static Image": "Încarcă Imagine Statică",
@@ -124,6 +158,8 @@ translations = {
         "Yawn": "Căscat",
         "Mouth Openness": "Deschidere Gură",
         "Blink Rate": "Rata de Clipire",
+        "Perclos": "PERCLOS",
+        "Blinks Per Minute": "Clipiri pe Minut",
         "Head Drop": "Căderea Capului",
         "Adult": "Adult",
         "Belt": "Centură",
@@ -137,6 +173,14 @@ translations = {
         "Image Files (*.png *.jpg *.jpeg)": "Fișiere Imagine (*.png *.jpg *.jpeg)",
         "Error": "Eroare",
         "Could not access camera.": "Nu s-a putut accesa camera.",
-        "Could not load image.": "Nu s-a putut încărca imaginea."
+        "Could not start face tracking.": "Nu s-a putut porni urmărirea feței.",
+        "Could not load image.": "Nu s-a putut încărca imaginea.",
+        "Analyze Folder": "Analizează Dosar",
+        "Select Image Folder": "Selectează Dosarul cu Imagini",
+        "Save KPI Results": "Salvează Rezultatele KPI",
+        "CSV Files (*.csv)": "Fișiere CSV (*.csv)",
+        "Analyzing images": "Se analizează imaginile",
+        "Folder analysis finished": "Analiza dosarului s-a încheiat",
+        "No images found.": "Nu s-au găsit imagini."
     }
 }
\ No newline at end of file
@@ -5,8 +5,11 @@ from PyQt5 import QtWidgets, QtGui, QtCore  # PyQt5 modules for creating GUI com
 import logging  # Facilitates logging for debugging and monitoring UI initialization.
 from ui.styles import Styles  # Custom styles for consistent UI appearance.
 
+# Qt 5.14+ displays OpenCV's BGR byte order directly; older versions need an RGB conversion.
+BGR_FORMAT = getattr(QtGui.QImage, "Format_BGR888", None)
+
 class VideoPanel(QtWidgets.QWidget):
-    def __init__(self, parent, tr_func, toggle_mode_cb, load_image_cb, analyze_cb):
+    def __init__(self, parent, tr_func, toggle_mode_cb, load_image_cb, analyze_cb, analyze_folder_cb):
         """Initialize the VideoPanel with video display and control buttons.
 
         Args:
@@ -15,6 +18,7 @@ class VideoPanel(QtWidgets.QWidget):
             toggle_mode_cb: Callback to toggle between live and static modes.
             load_image_cb: Callback to load a static image.
             analyze_cb: Callback to analyze the current frame or image.
+            analyze_folder_cb: Callback to analyze a folder of still images.
         """
         super().__init__(parent)  # Initialize base QWidget class.
         self.tr = tr_func  # Store translation function for dynamic text updates.
@@ -27,7 +31,8 @@ class VideoPanel(QtWidgets.QWidget):
         self.video_label = QtWidgets.QLabel(self.tr("Video Feed"))
         self.video_label.setAlignment(QtCore.Qt.AlignCenter)  # Center the content.
         self.video_label.setFixedSize(720, 480)  # Set fixed dimensions for video display.
-        self.set_default_style()  # Apply default styling to video label.
+        self.display_buffer = None  # Reused frame buffer at display size; backs the QImage being shown.
+        self.video_label.setStyleSheet(Styles.VIDEO_LABEL)  # Default and alert styling, switched by property.
         layout.addWidget(self.video_label, alignment=QtCore.Qt.AlignCenter)  # Add label to layout.
         
         # Create horizontal layout for control buttons.
@@ -46,7 +51,16 @@ class VideoPanel(QtWidgets.QWidget):
         self.analyze_btn = self.create_button("Analyze", analyze_cb, False, "#E67E22", "#D35400")
         btn_layout.addWidget(self.analyze_btn)
         
+        # Create button to analyze a whole folder of images.
+        self.analyze_folder_btn = self.create_button("Analyze Folder", analyze_folder_cb, False, "#9B59B6", "#8E44AD")
+        btn_layout.addWidget(self.analyze_folder_btn)
+        
         layout.addLayout(btn_layout)  # Add button layout to main layout.
+        
+        # Create label reporting bulk analysis progress.
+        self.status_label = QtWidgets.QLabel("")
+        self.status_label.setStyleSheet(Styles.STATUS_LABEL)
+        layout.addWidget(self.status_label, alignment=QtCore.Qt.AlignCenter)
         self.setStyleSheet(Styles.VIDEO_PANEL)  # Apply panel-wide styling.
         logging.debug("VideoPanel initialized.")
     
@@ -69,28 +83,61 @@ class VideoPanel(QtWidgets.QWidget):
         button.setEnabled(enabled)  # Set initial enabled state.
         return button
     
+    def show_frame(self, frame):
+        """Display a BGR frame, downscaled to fit the video label.
+
+        The frame is resized straight into a reusable buffer and handed to Qt in BGR byte order,
+        so no full-resolution colour conversion or pixmap rescaling happens per frame.
+
+        Args:
+            frame: Frame (numpy array) in BGR format.
+        """
+        import cv2  # Resizes frames to the display size; loaded with the pipeline, not at startup.
+        import numpy as np  # Preallocated display buffer.
+        h, w = frame.shape[:2]
+        scale = min(1.0, self.video_label.width() / w, self.video_label.height() / h)
+        size = (max(1, round(w * scale)), max(1, round(h * scale)))
+        if self.display_buffer is None or self.display_buffer.shape[:2] != (size[1], size[0]):
+            self.display_buffer = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        if size != (w, h):
+            cv2.resize(frame, size, dst=self.display_buffer, interpolation=cv2.INTER_AREA)
+            image = self.display_buffer
+        else:
+            image = np.ascontiguousarray(frame)  # Already display-sized: show it as is.
+        if BGR_FORMAT is None:
+            cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=self.display_buffer)
+            image, image_format = self.display_buffer, QtGui.QImage.Format_RGB888
+        else:
+            image_format = BGR_FORMAT
+        # QImage wraps the array without copying; fromImage copies it into the pixmap while the array is alive.
+        qt_image = QtGui.QImage(image.data, size[0], size[1], image.strides[0], image_format)
+        self.video_label.setPixmap(QtGui.QPixmap.fromImage(qt_image))
+
     def set_default_style(self):
         """Apply default styling to the video label."""
-        self.video_label.setStyleSheet(Styles.VIDEO_LABEL_DEFAULT)
+        Styles.set_state(self.video_label, "alert", "false")
     
     def update_video_style(self, results):
-        """Update video label styling based on KPI results.
+        """Update video label styling based on KPI results (the style is only re-applied when the alert state changes).
 
         Args:
             results: Dictionary of KPI results to check for alerts.
         """
+        Styles.set_state(self.video_label, "alert", "true" if self.has_alert(results) else "false")
+
+    @staticmethod
+    def has_alert(results) -> bool:
+        """Return whether any KPI result reports a detection."""
         for value in results.values():
             # Check for string-based alerts (e.g., "Detected").
             if isinstance(value, str) and value.startswith("Detected"):
-                self.video_label.setStyleSheet(Styles.VIDEO_LABEL_ALERT)  # Apply alert styling.
-                return
+                return True
             # Check for nested dictionary alerts.
             elif isinstance(value, dict):
                 for sub_value in value.values():
                     if sub_value == "Detected":
-                        self.video_label.setStyleSheet(Styles.VIDEO_LABEL_ALERT)  # Apply alert styling.
-                        return
-        self.set_default_style()  # Revert to default styling if no alerts.
+                        return True
+        return False
     
     def retranslate_ui(self):
         """Update UI text with translated strings for dynamic language changes."""
@@ -98,4 +145,5 @@ class VideoPanel(QtWidgets.QWidget):
         # Update toggle button text based on current mode.
         self.toggle_mode_btn.setText(self.tr("Switch to Static Mode") if self.toggle_callback.__self__.mode == "live" else self.tr("Switch to Live Mode"))
         self.load_image_btn.setText(self.tr("Load Static Image"))  # Update load button text.
-        self.analyze_btn.setText(self.tr("Analyze"))  # Update analyze button text.
\ No newline at end of file
+        self.analyze_btn.setText(self.tr("Analyze"))  # Update analyze button text.
+        self.analyze_folder_btn.setText(self.tr("Analyze Folder"))  # Update folder analysis button text.
\ No newline at end of file